@@ -0,0 +1,17 @@
+"""
+Benchmarks of the service, run as `python -m benchmarks.<name>`.
+
+`benchmarks.suite` runs the regression suite and compares it with a saved
+baseline; the other modules are focused comparisons of one component.
+Importing the package provides placeholder values for the settings that
+have no default, so the benchmarks run without a `.env` file.
+"""
+import os
+
+os.environ.setdefault('DATABASE_HOST', 'localhost')
+os.environ.setdefault('DATABASE_NAME', 'benchmark')
+os.environ.setdefault('DATABASE_USER', 'benchmark')
+os.environ.setdefault('DATABASE_PASSWORD', 'benchmark')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key-with-32-characters')
+os.environ.setdefault('DOCS_USERNAME', 'benchmark')
+os.environ.setdefault('DOCS_PASSWORD', 'benchmark')
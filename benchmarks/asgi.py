@@ -0,0 +1,45 @@
+"""
+Minimal in-process ASGI client.
+
+Calls the application directly with a prepared HTTP scope, without httpx or
+sockets, so a benchmark measures the application and not the client.
+"""
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Message, Scope
+
+
+def http_scope(path: str, method: str = 'GET', headers: Iterable[tuple[bytes, bytes]] = ()) -> Scope:
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': b'',
+        'headers': list(headers),
+        'client': ('127.0.0.1', 50000),
+        'server': ('benchmark', 80),
+    }
+
+
+async def request(app: ASGIApp, scope: Scope) -> tuple[int, bytes]:
+    """Serve one request with a copy of `scope`; returns the status and the body"""
+    status = 0
+    body = bytearray()
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+        elif message['type'] == 'http.response.body':
+            body.extend(message.get('body', b''))
+
+    await app(dict(scope), receive, send)
+    return status, bytes(body)
@@ -0,0 +1,131 @@
+"""
+Benchmark of authenticated requests.
+
+Serves a route that depends on `current_claims` with the same access token
+over and over, so every request parses the bearer header, verifies the
+token and checks its revocation:
+
+- `store lookup`: no verified-token cache, every revocation check is a
+  round trip to the store (as without the Bloom filter)
+- `bloom filter`: no verified-token cache, the filter answers the check
+- `bloom + cache`: the token is verified once, then served from the cache
+
+The cost of `TokenService.verify` alone is printed next to the rate.
+
+The revocation store is in memory and sleeps `--rtt` milliseconds per
+lookup to stand in for Redis; it holds `--revoked` revoked ids.
+
+Usage:
+    python -m benchmarks.auth [--seconds 1.0] [--rtt 0.2] [--revoked 10000]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import Depends, FastAPI
+from starlette.types import ASGIApp
+
+from benchmarks.asgi import http_scope, request
+from src.application.domain.objects.token_claims import TokenClaims
+from src.infrastructure import auth
+from src.infrastructure.auth import JWTCodec, MemoryRevocationStore, RevocationIndex, RevocationStore, TokenService
+from src.infrastructure.logger import logger
+from src.presentation.responses import FastJSONResponse
+from src.presentation.security import current_claims
+from src.settings import settings
+
+
+class RemoteRevocationStore(MemoryRevocationStore):
+    def __init__(self, rtt: float) -> None:
+        super().__init__()
+        self.rtt = rtt
+
+    async def is_revoked(self, token_ids: Iterable[str]) -> bool:
+        await asyncio.sleep(self.rtt)
+        return await super().is_revoked(token_ids)
+
+
+class UnfilteredRevocationIndex(RevocationIndex):
+    def __init__(self, store: RevocationStore, *args: Any, **kwargs: Any) -> None:
+        super().__init__(store, *args, **kwargs)
+        self.store = store
+
+    async def is_revoked(self, *token_ids: str) -> bool:
+        return await self.store.is_revoked(token_ids)
+
+
+async def make_service(mode: str, rtt: float, revoked: int) -> TokenService:
+    index_class = UnfilteredRevocationIndex if mode == 'store lookup' else RevocationIndex
+    store = RemoteRevocationStore(rtt)
+    for _ in range(revoked):
+        await store.revoke(uuid.uuid4().hex, time.time() + 3600)
+    service = TokenService(
+        JWTCodec(settings.SECRET_KEY, settings.ALGORITHM),
+        index_class(store, logger, capacity=max(revoked, 1)),
+        logger,
+        cache_size=10_000 if mode == 'bloom + cache' else 0,
+    )
+    await service.start()
+    return service
+
+
+def make_app(service: TokenService) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    auth.token_service = service  # served by get_token_service; dependency_overrides re-inspects it on every request
+
+    @app.get('/me')
+    async def me(claims: TokenClaims = Depends(current_claims)) -> dict[str, str]:
+        return {'subject': claims.subject}
+
+    return app
+
+
+async def throughput(app: ASGIApp, token: str, seconds: float) -> float:
+    scope = http_scope('/me', headers=[(b'authorization', f'Bearer {token}'.encode())])
+    requests = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        status, body = await request(app, scope)
+        if status != 200:
+            message = f'/me returned {status}: {body!r}'
+            raise RuntimeError(message)
+        requests += 1
+    return requests / elapsed
+
+
+async def verify_cost(service: TokenService, token: str, calls: int = 20_000) -> float:
+    """Microseconds per TokenService.verify call, without the request around it"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        await service.verify(token)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def main_async(seconds: float, rtt: float, revoked: int) -> None:
+    baseline = 0.0
+    for mode in ('store lookup', 'bloom filter', 'bloom + cache'):
+        service = await make_service(mode, rtt, revoked)
+        token = service.issue('benchmark', {'role': 'admin'}).access_token
+        try:
+            rate = await throughput(make_app(service), token, seconds)
+            cost = await verify_cost(service, token)
+        finally:
+            await service.stop()
+        baseline = baseline or rate
+        print(f'{mode:>13}: {rate:9.1f} req/s ({rate / baseline:4.1f}x), verify {cost:7.1f} us')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=1.0, help='duration of each measurement')
+    parser.add_argument('--rtt', type=float, default=0.2, help='simulated store round trip in milliseconds')
+    parser.add_argument('--revoked', type=int, default=10_000, help='revoked ids in the store')
+    args = parser.parse_args()
+    asyncio.run(main_async(args.seconds, args.rtt / 1000, args.revoked))
+
+
+if __name__ == '__main__':
+    main()
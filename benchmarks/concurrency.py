@@ -0,0 +1,147 @@
+"""
+Stress run of @singleflight and @hedged under heavy concurrency.
+
+singleflight: many callers over a few keys, a share of them cancelled
+mid-flight; checks that each key runs once per burst, that cancelled callers
+do not disturb the others and that a failure reaches every waiter and is
+not cached.
+
+hedged: a call that is usually fast with a slow tail; compares latency
+percentiles and the extra load without hedging, with a fixed delay and with
+percentile-based hedging, then checks that cancelling callers cancels every
+attempt.
+
+Usage:
+    python -m benchmarks.concurrency [--callers 20000] [--keys 100] [--calls 3000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.infrastructure.utils.hedged import hedged
+from src.infrastructure.utils.single_flight import singleflight
+
+
+def check(name: str, condition: bool) -> bool:  # noqa: FBT001
+    print(f'  [{"ok" if condition else "FAIL"}] {name}')
+    return condition
+
+
+async def run_singleflight(callers: int, keys: int) -> bool:
+    executions: Counter[int] = Counter()
+
+    @singleflight(key='item:{item_id}')
+    async def load(item_id: int) -> int:
+        executions[item_id] += 1
+        await asyncio.sleep(0.02)
+        return item_id * 2
+
+    @singleflight(key=lambda item_id: f'failing:{item_id}')
+    async def failing(item_id: int) -> int:
+        executions[-1] += 1
+        await asyncio.sleep(0.01)
+        raise ValueError(item_id)
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(load(i % keys)) for i in range(callers)]
+    await asyncio.sleep(0.005)
+    cancelled = random.sample(tasks, callers // 3)
+    for task in cancelled:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    cancelled_ids = {id(task) for task in cancelled}
+    wrong = sum(
+        1 for i, (task, result) in enumerate(zip(tasks, results, strict=True))
+        if id(task) not in cancelled_ids and result != (i % keys) * 2
+    )
+    print(f'singleflight: {callers:,} callers over {keys} keys in {elapsed * 1000:.0f} ms, {len(cancelled):,} cancelled')
+    ok = check(f'one execution per key ({sum(executions.values())} executions)', all(executions[k] == 1 for k in range(keys)))
+    ok &= check('callers that were not cancelled got their result', wrong == 0)
+    ok &= check('no call left in flight', len(load.single_flight) == 0)
+
+    errors = await asyncio.gather(*(failing(1) for _ in range(1000)), return_exceptions=True)
+    ok &= check('a failure reaches every waiter', all(isinstance(error, ValueError) for error in errors))
+    await asyncio.gather(failing(1), return_exceptions=True)
+    ok &= check('a failure is not shared with later calls', executions[-1] == 2)
+    return ok
+
+
+def percentile(latencies: list[float], q: int) -> float:
+    return statistics.quantiles(latencies, n=100, method='inclusive')[q - 1] * 1000
+
+
+async def measure(call: Callable[[], Awaitable[Any]], calls: int, concurrency: int) -> list[float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies
+
+
+async def run_hedged(calls: int) -> bool:
+    attempts = Counter[str]()
+    running = 0
+
+    async def backend() -> int:
+        nonlocal running
+        attempts['total'] += 1
+        running += 1
+        try:
+            # 95% of the calls take ~5 ms, the rest ~200 ms
+            await asyncio.sleep(0.2 if random.random() < 0.05 else random.uniform(0.004, 0.006))  # noqa: S311
+        finally:
+            running -= 1
+        return 1
+
+    fixed = hedged(after_ms=20)(backend)
+    adaptive = hedged(percentile=0.95, min_samples=100)(backend)
+
+    print(f'hedged: {calls:,} calls, 5% of them slow')
+    for name, call in (('no hedging', backend), ('after_ms=20', fixed), ('p95', adaptive)):
+        attempts.clear()
+        latencies = await measure(call, calls, concurrency=100)
+        print(
+            f'  {name:>12}: p50 {percentile(latencies, 50):6.1f} ms | p99 {percentile(latencies, 99):6.1f} ms'
+            f' | max {max(latencies) * 1000:6.1f} ms | extra load {attempts["total"] / calls - 1:5.1%}'
+        )
+
+    tasks = [asyncio.create_task(fixed()) for _ in range(500)]
+    await asyncio.sleep(0.03)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+    return check('cancelled callers leave no attempt running', running == 0)
+
+
+async def main_async(callers: int, keys: int, calls: int) -> bool:
+    ok = await run_singleflight(callers, keys)
+    ok &= await run_hedged(calls)
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--callers', type=int, default=20_000)
+    parser.add_argument('--keys', type=int, default=100)
+    parser.add_argument('--calls', type=int, default=3000)
+    args = parser.parse_args()
+    if not asyncio.run(main_async(args.callers, args.keys, args.calls)):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark of serving an error storm.
+
+Simulates a dependency outage: every request raises ServiceUnavailableError
+with the same message. Compares the previous per-class handler (a new
+JSONResponse through the generic encoder on every error) with the cached
+problem details handler, both called directly and through the whole ASGI
+application.
+
+Usage:
+    python -m benchmarks.error_storm [--errors 100000] [--requests 20000]
+"""
+import argparse
+import asyncio
+import math
+import time
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from benchmarks.asgi import http_scope, request
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.presentation.handlers import problem_handler
+
+MESSAGE = 'Database is unavailable'
+
+Handler = Callable[[Request, ServiceUnavailableError], Awaitable[Response]]
+
+
+async def json_response_handler(_request: Request, exc: ServiceUnavailableError) -> JSONResponse:
+    """The handler used before the problem details handler"""
+    return JSONResponse(
+        status_code=int(exc.status_code.value),
+        content={'error': 'Service unavailable', 'detail': str(exc)},
+        headers={'Retry-After': str(max(math.ceil(exc.retry_after), 1))},
+    )
+
+
+async def direct(handler: Handler, errors: int) -> float:
+    request = Request({'type': 'http', 'method': 'GET', 'path': '/', 'headers': []})
+    start = time.perf_counter()
+    for _ in range(errors):
+        await handler(request, ServiceUnavailableError(MESSAGE, retry_after=5))
+    return time.perf_counter() - start
+
+
+async def end_to_end(handler: Handler, requests: int) -> float:
+    app = FastAPI()
+    app.add_exception_handler(ServiceUnavailableError, handler)  # type: ignore[arg-type]
+
+    @app.get('/items')
+    async def items() -> None:
+        raise ServiceUnavailableError(MESSAGE, retry_after=5)
+
+    scope = http_scope('/items')
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, scope)
+    return time.perf_counter() - start
+
+
+async def main_async(errors: int, requests: int) -> None:
+    for name, handler in (('JSONResponse', json_response_handler), ('problem+json', problem_handler.handle)):
+        handler_time = await direct(handler, errors)  # type: ignore[arg-type]
+        request_time = await end_to_end(handler, requests)  # type: ignore[arg-type]
+        print(
+            f'{name:>12}: handler {handler_time / errors * 1e6:5.2f} us/error'
+            f' | end to end {requests / request_time:7.0f} errors/s'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--errors', type=int, default=100_000)
+    parser.add_argument('--requests', type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.errors, args.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark of event loop responsiveness during concurrent bcrypt work.
+
+A ticker coroutine sleeps 1 ms in a loop and records how late it wakes up,
+while a burst of concurrent `verify` calls (simulated logins) runs either
+inline on the loop (the previous HashService behaviour) or through the
+bounded bcrypt thread pool.
+
+Usage:
+    python -m benchmarks.hash_service [--logins 32] [--rounds 10] [--workers 4]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import bcrypt
+
+from src.infrastructure.logger import logger
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+from src.infrastructure.utils.hash import HashService
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list[float], interval: float = 0.001) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def run(mode: str, logins: int, rounds: int, workers: int) -> tuple[float, list[float]]:
+    hashed = bcrypt.hashpw(b'password', bcrypt.gensalt(rounds)).decode()
+    service = HashService(BoundedExecutor(workers, logins, 'bcrypt-benchmark'), rounds)
+
+    async def inline_verify() -> bool:
+        return bcrypt.checkpw(b'password', hashed.encode())
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    if mode == 'inline':
+        await asyncio.gather(*(inline_verify() for _ in range(logins)))
+    else:
+        await asyncio.gather(*(service.verify(hashed, 'password') for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    return logins / elapsed, lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--logins', type=int, default=32)
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    for mode in ('inline', 'executor'):
+        throughput, lags = asyncio.run(run(mode, args.logins, args.rounds, args.workers))
+        print(
+            f'{mode:>8}: {throughput:>8,.1f} verifies/s | loop lag max {max(lags):.1f} ms, '
+            f'p99 {statistics.quantiles(lags, n=100, method="inclusive")[98]:.1f} ms over {len(lags)} ticks'
+        )
+
+
+if __name__ == '__main__':
+    main()
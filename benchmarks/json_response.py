@@ -0,0 +1,107 @@
+"""
+Benchmark of JSON response throughput.
+
+Serves a list of items with 1, 100 and 10k entries through the whole ASGI
+application in three ways:
+
+- `JSONResponse`: FastAPI's default response class, the route declares
+  `response_model=list[Item]` (validate, dump, stdlib json)
+- `FastJSONResponse`: the same route with FastJSONResponse as the default
+  response class (validate, dump, orjson)
+- `respond()`: the route returns `Item.respond(rows)`, the rows are
+  encoded once without validation
+
+Usage:
+    python -m benchmarks.json_response [--seconds 1.0]
+"""
+import argparse
+import asyncio
+import datetime
+import time
+import uuid
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp
+
+from benchmarks.asgi import http_scope, request
+from src.presentation.responses import FastJSONResponse
+from src.presentation.schemas import ResponseSchema
+
+SIZES = {'small': 1, 'medium': 100, 'large': 10_000}
+
+
+class Item(ResponseSchema):
+    id: int
+    name: str
+    price: float
+    tags: list[str]
+    created_at: datetime.datetime
+    uid: uuid.UUID
+
+
+def make_rows(count: int) -> list[dict[str, Any]]:
+    created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    return [
+        {
+            'id': i,
+            'name': f'item {i}',
+            'price': i * 1.5,
+            'tags': ['new', 'sale'],
+            'created_at': created_at,
+            'uid': uuid.UUID(int=i),
+        }
+        for i in range(count)
+    ]
+
+
+def make_app(rows: list[dict[str, Any]], mode: str) -> FastAPI:
+    app = FastAPI(default_response_class=JSONResponse if mode == 'JSONResponse' else FastJSONResponse)
+
+    if mode == 'respond()':
+        @app.get('/items', response_model=list[Item])
+        async def trusted_items() -> FastJSONResponse:
+            return Item.respond(rows)
+    else:
+        @app.get('/items', response_model=list[Item])
+        async def items() -> list[dict[str, Any]]:
+            return rows
+
+    return app
+
+
+async def throughput(app: ASGIApp, seconds: float) -> tuple[float, int]:
+    scope = http_scope('/items')
+    size = 0
+    requests = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        _, body = await request(app, scope)
+        size = len(body)
+        requests += 1
+    return requests / elapsed, size
+
+
+async def main_async(seconds: float) -> None:
+    for payload, count in SIZES.items():
+        rows = make_rows(count)
+        baseline = 0.0
+        for mode in ('JSONResponse', 'FastJSONResponse', 'respond()'):
+            rate, size = await throughput(make_app(rows, mode), seconds)
+            baseline = baseline or rate
+            print(
+                f'{payload:>6} ({count:>6} items, {size / 1024:8.1f} KiB) {mode:>16}:'
+                f' {rate:9.1f} req/s ({rate / baseline:4.1f}x)'
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=1.0, help='duration of each measurement')
+    args = parser.parse_args()
+    asyncio.run(main_async(args.seconds))
+
+
+if __name__ == '__main__':
+    main()
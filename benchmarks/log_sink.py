@@ -0,0 +1,91 @@
+"""
+Benchmark of the logger sinks: synchronous StreamSink vs background QueueSink.
+
+Stdout is replaced with a stream that sleeps on every write, emulating a slow
+pipe to the container runtime. Reports caller-side lines/sec and p50/p99 latency
+of requests served in process while logging through each sink.
+
+Usage:
+    python -m benchmarks.log_sink [--lines 20000] [--requests 2000] [--write-delay 0.0002]
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import time
+
+import httpx
+
+from src.infrastructure.logger import LogSink, QueueSink, StreamSink, logger
+from src.main import app
+
+
+class SlowStream(io.TextIOBase):
+    """Discards data but sleeps on every write, like a congested pipe."""
+
+    def __init__(self, write_delay: float) -> None:
+        self.write_delay = write_delay
+
+    def write(self, data: str) -> int:
+        time.sleep(self.write_delay)
+        return len(data)
+
+
+def bench_lines(sink: LogSink, lines: int) -> float:
+    logger.set_sink(sink)
+    start = time.perf_counter()
+    for index in range(lines):
+        logger.info(f'benchmark line {index}')
+    elapsed = time.perf_counter() - start
+    logger.flush()
+    return lines / elapsed
+
+
+async def bench_requests(sink: LogSink, requests: int, concurrency: int) -> list[float]:
+    logger.set_sink(sink)
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark') as client:
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                start = time.perf_counter()
+                await client.get('/v1/benchmark')
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    logger.flush()
+    return latencies
+
+
+def percentile(values: list[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=20_000)
+    parser.add_argument('--requests', type=int, default=2_000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--write-delay', type=float, default=0.0002, help='Seconds slept per stdout write')
+    args = parser.parse_args()
+
+    stream = SlowStream(args.write_delay)
+    sinks = {
+        'sync': lambda: StreamSink(stream),
+        'queue': lambda: QueueSink(stream),
+    }
+
+    for name, factory in sinks.items():
+        lines_per_sec = bench_lines(factory(), args.lines)
+        latencies = asyncio.run(bench_requests(factory(), args.requests, args.concurrency))
+        print(
+            f'{name:>6}: {lines_per_sec:>12,.0f} lines/s | '
+            f'request p50 {percentile(latencies, 50):.3f} ms, p99 {percentile(latencies, 99):.3f} ms'
+        )
+
+    logger.set_sink(StreamSink())
+
+
+if __name__ == '__main__':
+    main()
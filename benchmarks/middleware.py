@@ -0,0 +1,86 @@
+"""
+Benchmark of the request middleware stack on `/ping`.
+
+Compares the pure ASGI RequestContextMiddleware with an equivalent pair of
+BaseHTTPMiddleware subclasses (the previous TraceID + Timing implementation)
+and with no middleware at all. Requests are served in process through
+httpx.ASGITransport, so the numbers reflect framework overhead only.
+
+Usage:
+    python -m benchmarks.middleware [--requests 5000] [--concurrency 32]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.infrastructure.logger import logger
+from src.presentation.middleware.request_context import RequestContextMiddleware
+from src.settings import settings
+
+
+class LegacyTraceIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        if request.url.path in settings.EXCLUDED_PATHS:
+            return await call_next(request)
+        logger.set_trace_id(request.headers.get('X-Trace-ID') or str(uuid.uuid4()))
+        return await call_next(request)
+
+
+class LegacyTimingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        logger.debug('Request timing', duration_ms=(time.perf_counter() - start_time) * 1000)
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    application = FastAPI()
+
+    @application.get('/ping')
+    async def ping() -> dict[str, str]:
+        return {'message': 'pong', 'status': 'ok'}
+
+    if stack == 'asgi':
+        application.add_middleware(RequestContextMiddleware, logger=logger)
+    elif stack == 'base-http':
+        application.add_middleware(LegacyTraceIDMiddleware)
+        application.add_middleware(LegacyTimingMiddleware)
+    return application
+
+
+async def bench(application: FastAPI, requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url='http://benchmark') as client:
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                await client.get('/ping')
+
+        await worker(100)  # warm up
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    results = {stack: asyncio.run(bench(build_app(stack), args.requests, args.concurrency))
+               for stack in ('none', 'base-http', 'asgi')}
+    for stack, rps in results.items():
+        print(f'{stack:>10}: {rps:>10,.0f} req/s')
+    print(f'asgi vs base-http: {results["asgi"] / results["base-http"] - 1:+.1%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of bulk writes and streaming reads of the generic Repository.
+
+Inserts N rows with a naive `session.add` loop, with `insert_many` (COPY on
+PostgreSQL/asyncpg, chunked executemany elsewhere) and with `upsert_many`
+over the already inserted rows, then reads them back with `scalars().all()`
+and with `stream` and compares the peak Python memory of both reads.
+
+Runs against DATABASE_URL by default; the benchmark table is created and
+dropped by the script. Only postgresql+asyncpg URLs exercise the COPY path.
+
+Usage:
+    python -m benchmarks.repository [--sizes 10000 100000 1000000] [--url postgresql+asyncpg://...]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any
+
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.repositories import Repository
+from src.settings import settings
+
+
+class BenchmarkRow(Base):
+    __tablename__ = 'benchmark_repository_rows'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(64))
+    score: Mapped[int]
+
+
+def rows(count: int, offset: int = 0) -> Iterator[dict[str, Any]]:
+    return ({'id': i, 'name': f'row-{i}', 'score': (i + offset) % 1000} for i in range(count))
+
+
+async def timed(function: Callable[[], Awaitable[Any]]) -> float:
+    start = time.perf_counter()
+    await function()
+    return time.perf_counter() - start
+
+
+async def reset(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(BenchmarkRow.__table__.drop, checkfirst=True)
+        await connection.run_sync(BenchmarkRow.__table__.create)
+
+
+async def run(engine: AsyncEngine, count: int) -> None:
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def naive() -> None:
+        async with session_maker() as session:
+            for row in rows(count):
+                session.add(BenchmarkRow(**row))
+            await session.commit()
+
+    async def insert_many() -> None:
+        async with session_maker() as session:
+            await Repository(session, BenchmarkRow).insert_many(rows(count))
+            await session.commit()
+
+    async def upsert_many() -> None:
+        async with session_maker() as session:
+            await Repository(session, BenchmarkRow).upsert_many(rows(count, offset=1))
+            await session.commit()
+
+    async def load_all() -> None:
+        async with session_maker() as session:
+            for _row in (await session.scalars(select(BenchmarkRow))).all():
+                pass
+
+    async def stream() -> None:
+        async with session_maker() as session:
+            async for _row in Repository(session, BenchmarkRow).stream():
+                pass
+
+    results: list[tuple[str, float, str]] = []
+    await reset(engine)
+    results.append(('session.add loop', await timed(naive), ''))
+    await reset(engine)
+    results.append(('insert_many', await timed(insert_many), ''))
+    results.append(('upsert_many (update)', await timed(upsert_many), ''))
+
+    for name, function in (('scalars().all()', load_all), ('stream', stream)):
+        tracemalloc.start()
+        elapsed = await timed(function)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append((name, elapsed, f'peak {peak / 1024 / 1024:,.1f} MiB'))
+
+    print(f'{count:,} rows')
+    for name, elapsed, note in results:
+        print(f'  {name:>22}: {elapsed:>8.2f} s | {count / elapsed:>12,.0f} rows/s {note}')
+
+
+async def main_async(url: str, sizes: list[int]) -> None:
+    engine = create_async_engine(url)
+    try:
+        for count in sizes:
+            await run(engine, count)
+        async with engine.begin() as connection:
+            await connection.run_sync(BenchmarkRow.__table__.drop, checkfirst=True)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--url', default=settings.DATABASE_URL)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.url, args.sizes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of worker boot time.
+
+Every run starts a fresh interpreter (like a new granian worker) that
+imports `src.main`, runs the application lifespan startup and serves two
+`/ping` requests in process. Reported per phase: import, lifespan startup,
+first and second request, plus the wall time of the whole process.
+`--importtime` also lists the slowest imports.
+
+The lifespan connects to DATABASE_URL; without a reachable database the
+pool warm-up fails fast and is logged, which still exercises the rest of
+the boot path.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--importtime 15]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PHASES = ('import', 'startup', 'first_request', 'second_request')
+
+
+async def boot() -> dict[str, float]:
+    """Runs in the child process: import, lifespan startup and two requests"""
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    import httpx  # noqa: PLC0415
+
+    from src.main import app  # noqa: PLC0415
+    timings['import'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        timings['startup'] = time.perf_counter() - start
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url='http://benchmark') as client:
+            for phase in ('first_request', 'second_request'):
+                start = time.perf_counter()
+                response = await client.get('/ping')
+                response.raise_for_status()
+                timings[phase] = time.perf_counter() - start
+    return timings
+
+
+def spawn() -> tuple[dict[str, float], float]:
+    start = time.perf_counter()
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, '-m', 'benchmarks.startup', '--child'],
+        capture_output=True, check=True, text=True, env={**os.environ, 'LOG_LEVEL': 'ERROR'},
+    ).stdout
+    wall = time.perf_counter() - start
+    return json.loads(output.strip().splitlines()[-1]), wall
+
+
+def slowest_imports(count: int) -> list[tuple[float, str]]:
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', 'import src.main'],
+        capture_output=True, check=True, text=True,
+    ).stderr
+    imports: list[tuple[float, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        imports.append((int(cumulative) / 1000, name.rstrip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--importtime', type=int, default=0, metavar='N', help='show the N slowest imports')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(boot())))
+        return
+
+    runs = [spawn() for _ in range(args.runs)]
+    for phase in PHASES:
+        values = [timings[phase] * 1000 for timings, _ in runs]
+        print(f'{phase:>15}: median {statistics.median(values):8.1f} ms | min {min(values):8.1f} ms')
+    walls = [wall * 1000 for _, wall in runs]
+    print(f'{"process wall":>15}: median {statistics.median(walls):8.1f} ms | min {min(walls):8.1f} ms')
+
+    if args.importtime:
+        print('slowest imports (cumulative):')
+        for milliseconds, name in slowest_imports(args.importtime):
+            print(f'  {milliseconds:8.1f} ms  {name}')
+
+
+if __name__ == '__main__':
+    main()
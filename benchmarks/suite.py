@@ -0,0 +1,258 @@
+"""
+Regression benchmark suite of the request pipeline.
+
+Everything runs in process: `src.main:app` is called through the ASGI
+interface without a server or sockets, the logger writes to a null stream.
+Cases:
+
+- ping: `/ping` throughput and latency through the full middleware stack
+  and through the bare router (middlewares off)
+- logger: lines/sec of `Logger.info` with fields, in TEXT and JSON format
+- hash: HashService.verify throughput on its thread pool (4 bcrypt rounds)
+- objects: construction cost of ValueObject and Immutable instances
+
+Every case runs `--repeat` times after a warm-up and the median is kept.
+Results are written as JSON to `--output`; with `--baseline` they are
+compared with a previous result file and the run fails (exit code 1) when
+a metric is worse than the baseline by more than `--threshold`.
+
+Usage:
+    python -m benchmarks.suite [--only ping,logger] [--repeat 5]
+        [--output benchmarks/results/latest.json]
+        [--baseline benchmarks/baseline.json] [--threshold 0.1] [--save-baseline]
+"""
+import argparse
+import asyncio
+import gc
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import bcrypt
+
+# Importing immutable first trips the exceptions <-> objects import cycle
+from src.application.domain.objects.value_object import ValueObject
+from src.application.domain.objects.immutable import Immutable
+
+from benchmarks.asgi import http_scope, request
+from src.infrastructure.logger import LogFormat, StreamSink, logger
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+from src.infrastructure.utils.hash import HashService
+from src.main import app
+
+DIRECTORY = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = DIRECTORY / 'results' / 'latest.json'
+DEFAULT_BASELINE = DIRECTORY / 'baseline.json'
+
+# metric name -> (value, unit, higher is better)
+Metrics = dict[str, tuple[float, str, bool]]
+
+
+class NullStream(io.TextIOBase):
+    def write(self, data: str) -> int:
+        return len(data)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Median duration of `func` over `repeat` runs, after one warm-up run, with gc paused"""
+    func()
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            durations.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return statistics.median(durations)
+
+
+async def serve(application: Any, scope: dict[str, Any], count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        status, _ = await request(application, scope)
+        latencies.append(time.perf_counter() - start)
+        if status != HTTPStatus.OK:
+            raise RuntimeError(f'{scope["path"]} returned {status}')
+    return latencies
+
+
+def bench_ping(repeat: int) -> Metrics:
+    requests = 5000
+    scope = http_scope('/ping')
+
+    async def run(application: Any) -> list[tuple[float, float, float]]:
+        await serve(application, scope, 500)
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            latencies = await serve(application, scope, requests)
+            quantiles = statistics.quantiles(latencies, n=100, method='inclusive')
+            runs.append((requests / (time.perf_counter() - start), quantiles[49] * 1e6, quantiles[98] * 1e6))
+        return runs
+
+    metrics: Metrics = {}
+    for name, application in (('middlewares_on', app), ('middlewares_off', app.router)):
+        rates, p50s, p99s = zip(*asyncio.run(run(application)), strict=True)
+        metrics[f'ping.{name}.throughput'] = (statistics.median(rates), 'req/s', True)
+        metrics[f'ping.{name}.p50'] = (statistics.median(p50s), 'us', False)
+        metrics[f'ping.{name}.p99'] = (statistics.median(p99s), 'us', False)
+    return metrics
+
+
+def bench_logger(repeat: int) -> Metrics:
+    lines = 20_000
+    log_format = logger.log_format
+    logger.set_sink(StreamSink(NullStream()))
+
+    def emit() -> None:
+        for index in range(lines):
+            logger.info('Benchmark line', index=index, user='benchmark', path='/v1/items')
+
+    metrics: Metrics = {}
+    try:
+        for fmt in (LogFormat.TEXT, LogFormat.JSON):
+            logger.set_format(fmt)
+            metrics[f'logger.{fmt.name.lower()}'] = (lines / measure(emit, repeat), 'lines/s', True)
+    finally:
+        logger.set_format(log_format)
+        logger.set_sink(StreamSink())
+    return metrics
+
+
+def bench_hash(repeat: int) -> Metrics:
+    rounds, calls = 4, 256
+    hashed = bcrypt.hashpw(b'password', bcrypt.gensalt(rounds)).decode()
+    executor = BoundedExecutor(max_workers=2, queue_limit=calls, thread_name_prefix='bcrypt-benchmark')
+    service = HashService(executor, rounds)
+
+    async def verify() -> None:
+        await asyncio.gather(*(service.verify(hashed, 'password') for _ in range(calls)))
+
+    try:
+        duration = measure(lambda: asyncio.run(verify()), repeat)
+    finally:
+        executor.shutdown()
+    return {'hash.verify': (calls / duration, 'verifies/s', True)}
+
+
+class ImmutablePoint(Immutable):
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+        super().__init__()
+
+
+class Point(ValueObject):
+    x: int
+    y: int
+
+
+def bench_objects(repeat: int) -> Metrics:
+    count = 100_000
+    metrics: Metrics = {}
+    for name, cls in (('value_object', Point), ('immutable', ImmutablePoint)):
+        duration = measure(lambda cls=cls: [cls(i, i) for i in range(count)], repeat)
+        metrics[f'objects.{name}'] = (duration / count * 1e9, 'ns', False)
+    return metrics
+
+
+CASES: dict[str, Callable[[int], Metrics]] = {
+    'ping': bench_ping,
+    'logger': bench_logger,
+    'hash': bench_hash,
+    'objects': bench_objects,
+}
+
+
+def environment() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],  # noqa: S607
+            capture_output=True, check=True, text=True, cwd=DIRECTORY,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(UTC).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print every metric next to its baseline value; returns the names of the regressed metrics"""
+    regressions = []
+    for name, metric in results['metrics'].items():
+        previous = baseline['metrics'].get(name)
+        if previous is None or not previous['value']:
+            print(f'  {name:<40} {metric["value"]:>12,.1f} {metric["unit"]:<11} (no baseline)')
+            continue
+        change = metric['value'] / previous['value'] - 1
+        worse = -change if metric['higher_is_better'] else change
+        regressed = worse > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f'  {name:<40} {metric["value"]:>12,.1f} {metric["unit"]:<11}'
+            f' baseline {previous["value"]:>12,.1f} {change:+7.1%}{"  REGRESSION" if regressed else ""}'
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', default=','.join(CASES), help='comma-separated cases to run')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown, 0.1 = 10%%')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    metrics: Metrics = {}
+    for case in args.only.split(','):
+        print(f'running {case}...', file=sys.stderr)
+        metrics.update(CASES[case.strip()](args.repeat))
+
+    results = {
+        'environment': environment(),
+        'metrics': {
+            name: {'value': round(value, 3), 'unit': unit, 'higher_is_better': higher_is_better}
+            for name, (value, unit, higher_is_better) in metrics.items()
+        },
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + '\n')
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f'baseline saved to {args.baseline}')
+
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+        print(f'compared with baseline {baseline["environment"].get("commit")} (threshold {args.threshold:.0%}):')
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} metric(s) regressed: {", ".join(regressions)}')
+            raise SystemExit(1)
+    else:
+        for name, metric in results['metrics'].items():
+            print(f'  {name:<40} {metric["value"]:>12,.1f} {metric["unit"]}')
+
+
+if __name__ == '__main__':
+    main()
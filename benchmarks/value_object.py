@@ -0,0 +1,76 @@
+"""
+Benchmark of ValueObject against Immutable.
+
+Builds `--count` two-field objects of each kind and reports construction
+time, memory per instance (tracemalloc, objects kept alive in a list),
+attribute read time and, for ValueObject, the first and the cached hash.
+
+Usage:
+    python -m benchmarks.value_object [--count 1000000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+# Importing immutable first trips the exceptions <-> objects import cycle
+from src.application.domain.objects.value_object import ValueObject
+from src.application.domain.objects.immutable import Immutable
+
+
+class ImmutableMoney(Immutable):
+    def __init__(self, amount: int, currency: str) -> None:
+        self.amount = amount
+        self.currency = currency
+        super().__init__()
+
+
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = func()
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def run(cls: type, count: int) -> None:
+    _, construction = timed(lambda: [cls(i, 'USD') for i in range(count)])
+
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls(i, 'USD') for i in range(count)]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    _, reads = timed(lambda: sum(item.amount for item in objects))
+    print(
+        f'{cls.__bases__[0].__name__:>12}: construct {construction / count * 1e9:6.0f} ns'
+        f' | {memory / count:5.0f} B/instance | read {reads / count * 1e9:4.0f} ns'
+        f' | total {construction:5.2f} s, {memory / 2**20:6.1f} MiB'
+    )
+    if isinstance(objects[0], ValueObject):
+        _, first = timed(lambda: [hash(item) for item in objects])
+        _, cached = timed(lambda: [hash(item) for item in objects])
+        print(f'{"":>12}  hash {first / count * 1e9:4.0f} ns first, {cached / count * 1e9:4.0f} ns cached')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+    for cls in (ImmutableMoney, Money):
+        run(cls, args.count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2 @@
+from src.application.abstractions.i_repository import IRepository
+from src.application.abstractions.i_unit_of_work import IUnitOfWork
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+from typing import Any, Generic, TypeVar
+
+
+EntityT = TypeVar('EntityT')
+
+
+class IRepository(ABC, Generic[EntityT]):  # noqa: UP046
+    """
+    Persistence of one entity type.
+
+    The bulk methods take plain rows (column name -> value) instead of
+    entities, so large imports skip building and tracking an object per row.
+    """
+
+    @abstractmethod
+    async def get(self, identity: Any) -> EntityT | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add(self, entity: EntityT) -> EntityT:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def insert_many(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Insert rows in bulk; returns the number of inserted rows"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        conflict_columns: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+    ) -> int:
+        """Insert rows, updating the existing ones on a key conflict; returns the number of rows sent"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def page(self, *, after: Any = None, limit: int = 100, descending: bool = False) -> list[EntityT]:
+        """Next `limit` entities ordered by key, after the key of the last entity of the previous page"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, *, batch_size: int = 1000) -> AsyncIterator[EntityT]:
+        """Iterate over all entities without loading them at once"""
+        raise NotImplementedError
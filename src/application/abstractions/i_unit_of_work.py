@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Self
+
+
+class IUnitOfWork(ABC):
+    """
+    Transaction boundary for a business operation.
+
+    Leaving the context without commit() rolls the work back.
+    """
+
+    @abstractmethod
+    async def __aenter__(self) -> Self:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        raise NotImplementedError
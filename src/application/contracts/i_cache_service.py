@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar
+
+
+T = TypeVar('T')
+
+
+class ICacheService(ABC):
+
+    @abstractmethod
+    async def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Delete every entry stored with any of the tags"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> T:
+        """Return the cached value or load, store and return it; concurrent misses share one load"""
+        raise NotImplementedError
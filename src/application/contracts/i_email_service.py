@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class IEmailService(ABC):
+
+    @abstractmethod
+    async def send(self, to: str | Sequence[str], subject: str, body: str, *, html: str | None = None) -> None:
+        """Queue a message; returns once it is queued, delivery happens in the background"""
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class IHashService(ABC):
@@ -10,3 +11,8 @@ class IHashService(ABC):
     @abstractmethod
     async def verify(self, hashed_value: str, plain_value: str) -> bool:
         raise NotImplementedError
+
+    @abstractmethod
+    async def verify_many(self, pairs: Sequence[tuple[str, str]]) -> list[bool]:
+        """Verify (hashed_value, plain_value) pairs concurrently"""
+        raise NotImplementedError
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from src.application.domain.objects.stored_file import StoredFile
+
+
+class IStorage(ABC):
+
+    @abstractmethod
+    async def save(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        content_type: str = 'application/octet-stream',
+        max_size: int | None = None,
+    ) -> StoredFile:
+        """
+        Store the stream under `key`, hashing it on the way.
+
+        Raises PayloadTooLargeError as soon as more than `max_size` bytes
+        arrived; nothing is kept from a rejected or failed upload.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stat(self, key: str) -> StoredFile:
+        """Raises StoredFileNotFoundError when there is no file under `key`"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        """Bytes `start` to `end` (inclusive, to the end of the file by default) in chunks"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def local_path(self, key: str) -> Path | None:
+        """Path of the file when it is on the local disk, so it can be sent without reading it"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections and threads"""
+        raise NotImplementedError
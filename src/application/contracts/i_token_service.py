@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any
+from src.application.domain.objects.token_claims import TokenClaims
+from src.application.domain.objects.token_pair import TokenPair
+
+
+class ITokenService(ABC):
+
+    @abstractmethod
+    def issue(self, subject: str, claims: Mapping[str, Any] | None = None) -> TokenPair:
+        """Access and refresh token of a new session"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def verify(self, token: str, kind: str = 'access') -> TokenClaims:
+        """Raises InvalidTokenError unless the token is well signed, an unexpired `kind` token and not revoked"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh(self, refresh_token: str) -> TokenPair:
+        """
+        Exchange a refresh token for a new pair; each refresh token works once.
+
+        Presenting a refresh token again revokes the whole session, as one
+        of the two parties holding it must have stolen it.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke(self, claims: TokenClaims, *, session: bool = False) -> None:
+        """Revoke the token, or every token of its session"""
+        raise NotImplementedError
@@ -1,3 +1,10 @@
 from src.application.domain.exceptions.immutable_attribute_error import ImmutableAttributeError
 from src.application.domain.exceptions.incomparable_object_error import IncomparableObjectError
 from src.application.domain.exceptions.sealed_class_error import SealedClassError
+from src.application.domain.exceptions.service_unavailable_error import ServiceUnavailableError
+from src.application.domain.exceptions.circuit_open_error import CircuitOpenError
+from src.application.domain.exceptions.payload_too_large_error import PayloadTooLargeError
+from src.application.domain.exceptions.stored_file_not_found_error import StoredFileNotFoundError
+from src.application.domain.exceptions.invalid_token_error import InvalidTokenError
+from src.application.domain.exceptions.invalid_credentials_error import InvalidCredentialsError
+from src.application.domain.exceptions.rate_limit_exceeded_error import RateLimitExceededError
@@ -0,0 +1,6 @@
+from src.application.domain.exceptions.service_unavailable_error import ServiceUnavailableError
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """Raised instead of calling a dependency whose circuit breaker is open."""
+    __slots__ = ()
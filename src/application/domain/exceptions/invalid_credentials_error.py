@@ -0,0 +1,10 @@
+from src.application.domain.enums.status_code import StatusCode
+from src.application.domain.exceptions.base import ApplicationException
+
+
+class InvalidCredentialsError(ApplicationException):
+    """Raised when a login presents an unknown username or a wrong password."""
+    __slots__ = ()
+
+    def __init__(self, message: str = 'Incorrect username or password') -> None:
+        super().__init__(StatusCode.UNAUTHORIZED, message)
@@ -0,0 +1,10 @@
+from src.application.domain.enums.status_code import StatusCode
+from src.application.domain.exceptions.base import ApplicationException
+
+
+class InvalidTokenError(ApplicationException):
+    """Raised when a token is missing, malformed, badly signed, expired or revoked."""
+    __slots__ = ()
+
+    def __init__(self, message: str = 'Invalid token') -> None:
+        super().__init__(StatusCode.UNAUTHORIZED, message)
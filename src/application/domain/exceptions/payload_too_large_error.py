@@ -0,0 +1,15 @@
+from src.application.domain.enums.status_code import StatusCode
+from src.application.domain.exceptions.base import ApplicationException
+
+
+class PayloadTooLargeError(ApplicationException):
+    """Raised as soon as an upload exceeds the maximum size, before the rest of it is read."""
+    __slots__ = ['_max_size']
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(StatusCode.PAYLOAD_TOO_LARGE, f'File exceeds the maximum size of {max_size} bytes')
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
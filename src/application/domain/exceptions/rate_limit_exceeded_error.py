@@ -0,0 +1,21 @@
+from src.application.domain.enums.status_code import StatusCode
+from src.application.domain.exceptions.base import ApplicationException
+
+
+class RateLimitExceededError(ApplicationException):
+    """Raised when a client has used up its requests for the current window."""
+    __slots__ = ['_limit', '_retry_after']
+
+    def __init__(self, limit: int, retry_after: float) -> None:
+        super().__init__(StatusCode.TOO_MANY_REQUESTS, f'Rate limit of {limit} requests exceeded, retry later')
+        self._limit = limit
+        self._retry_after = retry_after
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds after which the next request will be allowed"""
+        return self._retry_after
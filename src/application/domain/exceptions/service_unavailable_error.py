@@ -0,0 +1,21 @@
+from src.application.domain.enums.status_code import StatusCode
+from src.application.domain.exceptions.base import ApplicationException
+
+
+class ServiceUnavailableError(ApplicationException):
+    """Raised when a service is saturated and rejects new work instead of queueing it."""
+    __slots__ = ['_retry_after']
+
+    def __init__(
+        self,
+        message: str,
+        status_code: StatusCode = StatusCode.SERVICE_UNAVAILABLE,
+        retry_after: float = 1.0,
+    ) -> None:
+        super().__init__(status_code, message)
+        self._retry_after = retry_after
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds after which the client may try again"""
+        return self._retry_after
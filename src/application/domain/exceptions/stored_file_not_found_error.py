@@ -0,0 +1,10 @@
+from src.application.domain.enums.status_code import StatusCode
+from src.application.domain.exceptions.base import ApplicationException
+
+
+class StoredFileNotFoundError(ApplicationException):
+    """Raised when a storage backend has no file under the key."""
+    __slots__ = ()
+
+    def __init__(self, key: str) -> None:
+        super().__init__(StatusCode.NOT_FOUND, f'File {key!r} not found')
@@ -0,0 +1,9 @@
+from src.application.domain.objects.value_object import ValueObject
+
+
+class StoredFile(ValueObject):
+    """File kept by a storage backend; `sha256` is None when the backend cannot tell it without reading the file"""
+    key: str
+    size: int
+    content_type: str
+    sha256: str | None = None
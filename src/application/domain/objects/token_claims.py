@@ -0,0 +1,20 @@
+from collections.abc import Mapping
+from typing import Any
+from src.application.domain.objects.value_object import ValueObject
+
+
+class TokenClaims(ValueObject, comparable=False):
+    """
+    Verified content of a token.
+
+    `family` is shared by every token issued from one login through refresh
+    rotation, so revoking it ends the whole session; `extra` holds the
+    application claims.
+    """
+    subject: str
+    token_id: str
+    family: str
+    token_type: str
+    issued_at: int
+    expires_at: int
+    extra: Mapping[str, Any]
@@ -0,0 +1,9 @@
+from src.application.domain.objects.value_object import ValueObject
+
+
+class TokenPair(ValueObject):
+    """Access and refresh token issued together; `expires_in` is the access token lifetime in seconds"""
+    access_token: str
+    refresh_token: str
+    expires_in: int
+    token_type: str = 'bearer'  # noqa: S105 - OAuth2 token type, not a secret
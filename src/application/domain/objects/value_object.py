@@ -0,0 +1,137 @@
+from collections.abc import Callable
+from itertools import pairwise
+from operator import attrgetter
+from typing import Any, ClassVar, dataclass_transform, get_origin
+from src.application.domain.exceptions import ImmutableAttributeError
+from src.application.domain.objects.incomparable import Incomparable
+
+
+_HASH_SLOT = '_ValueObject__hash'
+_INCOMPARABLE_METHODS = ('__eq__', '__ne__', '__lt__', '__le__', '__gt__', '__ge__', '__hash__')
+
+
+def _is_class_var(hint: Any) -> bool:
+    if isinstance(hint, str):
+        return hint.startswith(('ClassVar', 'typing.ClassVar'))
+    return hint is ClassVar or get_origin(hint) is ClassVar
+
+
+def _no_values(_: object) -> tuple[()]:
+    return ()
+
+
+def _make_init(cls: type, fields: tuple[str, ...], defaults: dict[str, Any]) -> Callable[..., None]:
+    # The slot descriptors are called directly: assignment skips the frozen
+    # __setattr__ and costs one C call per field
+    hash_slot = next(base.__dict__[_HASH_SLOT] for base in cls.__mro__ if _HASH_SLOT in base.__dict__)
+    namespace: dict[str, Any] = {'__vo_defaults': defaults, '__vo_set_hash': hash_slot.__set__}
+    parameters = ['self']
+    body = ['    __vo_set_hash(self, None)']
+    for index, field in enumerate(fields):
+        owner = next(base for base in cls.__mro__ if field in base.__dict__.get('__slots__', ()))
+        namespace[f'__vo_set_{index}'] = owner.__dict__[field].__set__
+        parameters.append(f'{field}=__vo_defaults[{field!r}]' if field in defaults else field)
+        body.append(f'    __vo_set_{index}(self, {field})')
+    if hasattr(cls, '__post_init__'):
+        body.append('    self.__post_init__()')
+    source = f'def __init__({", ".join(parameters)}):\n' + '\n'.join(body)
+    exec(source, namespace)  # noqa: S102
+    init: Callable[..., None] = namespace['__init__']
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    return init
+
+
+@dataclass_transform(frozen_default=True)
+class _ValueObjectMeta(type):
+    """Turns the annotated fields of a value object class into slots and generates its __init__"""
+    __fields__: tuple[str, ...]
+
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        *,
+        comparable: bool = True,
+        **kwargs: Any,
+    ) -> '_ValueObjectMeta':
+        annotations = namespace.get('__annotations__', {})
+        own = tuple(field for field, hint in annotations.items() if field != _HASH_SLOT and not _is_class_var(hint))
+        inherited: tuple[str, ...] = next((base.__fields__ for base in bases if isinstance(base, _ValueObjectMeta)), ())
+        defaults: dict[str, Any] = {}
+        for base in reversed(bases):
+            defaults.update(getattr(base, '__defaults__', {}))
+        # A class attribute with the same name as a slot would shadow it
+        defaults.update({field: namespace.pop(field) for field in own if field in namespace})
+
+        fields = inherited + own
+        for previous, field in pairwise(fields):
+            if previous in defaults and field not in defaults:
+                raise TypeError(f"{name}: field '{field}' without a default follows a field with a default")
+
+        namespace.setdefault('__slots__', own)
+        namespace['__fields__'] = fields
+        namespace['__defaults__'] = defaults
+        namespace['__match_args__'] = fields
+        if not comparable:
+            namespace.update({method: Incomparable.__dict__[method] for method in _INCOMPARABLE_METHODS})
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        if '__init__' not in namespace:
+            cls.__init__ = _make_init(cls, fields, defaults)  # type: ignore[misc]
+        cls._ValueObject__values = attrgetter(*fields) if fields else staticmethod(_no_values)  # type: ignore[attr-defined]
+        return cls
+
+
+class ValueObject(metaclass=_ValueObjectMeta):
+    """
+    Base class for compact immutable value objects.
+
+    Annotated class attributes become slots and constructor parameters, in
+    declaration order (inherited fields first); a value assigned in the class
+    body is the default. Instances have no __dict__, cannot be modified once
+    created, compare equal by type and field values and cache their hash.
+    Define `__post_init__` to validate the fields after construction.
+
+    Pass `comparable=False` in the class definition for objects that must not
+    be compared or hashed (see Incomparable).
+
+    Example:
+        class Money(ValueObject):
+            amount: int
+            currency: str = 'USD'
+    """
+    __slots__ = ('__hash',)
+    # A slot, declared as ClassVar so type checkers do not take it for a field
+    __hash: ClassVar[int | None]
+    __fields__: ClassVar[tuple[str, ...]]
+    __defaults__: ClassVar[dict[str, Any]]
+    __values: ClassVar['attrgetter[Any]']
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise ImmutableAttributeError(f"Cannot modify immutable attribute '{key}'")
+
+    def __delattr__(self, key: str) -> None:
+        raise ImmutableAttributeError(f"Cannot delete immutable attribute '{key}'")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.__values(self) == self.__values(other)  # type: ignore[no-any-return]
+
+    def __hash__(self) -> int:
+        value = self.__hash
+        if value is None:
+            value = hash(self.__values(self))
+            _set_hash(self, value)
+        return value
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__fields__)
+        return f'{self.__class__.__name__}({fields})'
+
+    def __reduce__(self) -> tuple[type, tuple[Any, ...]]:
+        return self.__class__, tuple(getattr(self, field) for field in self.__fields__)
+
+
+_set_hash = ValueObject.__dict__[_HASH_SLOT].__set__
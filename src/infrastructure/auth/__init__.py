@@ -0,0 +1,37 @@
+from src.application.contracts.i_token_service import ITokenService
+from src.infrastructure.auth.bloom_filter import BloomFilter
+from src.infrastructure.auth.jwt_codec import JWTCodec
+from src.infrastructure.auth.memory_revocation_store import MemoryRevocationStore
+from src.infrastructure.auth.revocation_index import RevocationIndex
+from src.infrastructure.auth.revocation_store import RevocationStore
+from src.infrastructure.auth.token_service import TokenService
+from src.infrastructure.logger import logger
+from src.settings import settings
+
+
+def create_revocation_store() -> RevocationStore:
+    if settings.AUTH_REVOCATION_BACKEND == 'redis':
+        from src.infrastructure.auth.redis_revocation_store import RedisRevocationStore  # noqa: PLC0415 - redis is optional
+        return RedisRevocationStore.from_url(settings.REDIS_URL, logger, prefix=settings.AUTH_REVOCATION_PREFIX)
+    return MemoryRevocationStore()
+
+
+revocation_store = create_revocation_store()
+token_service = TokenService(
+    JWTCodec(settings.SECRET_KEY, settings.ALGORITHM),
+    RevocationIndex(
+        revocation_store,
+        logger,
+        capacity=settings.AUTH_BLOOM_CAPACITY,
+        error_rate=settings.AUTH_BLOOM_ERROR_RATE,
+        sync_interval=settings.AUTH_REVOCATION_SYNC_INTERVAL,
+    ),
+    logger,
+    access_ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    refresh_ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+    cache_size=settings.AUTH_VERIFIED_CACHE_SIZE,
+)
+
+
+async def get_token_service() -> ITokenService:
+    return token_service
@@ -0,0 +1,45 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Set membership with false positives but no false negatives.
+
+    Sized for `capacity` items at a false positive rate of `error_rate`;
+    the bit positions of an item are derived from a single blake2b digest
+    (double hashing). Items cannot be removed, the filter is rebuilt instead.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        self.capacity = capacity
+        self.size = max(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / capacity * math.log(2)), 1)
+        self.count = 0
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, item: str) -> bool:
+        # stops at the first clear bit: about two probes for an item that was never added
+        bits = self.__bits
+        first, second = self.__hashes(item)
+        for index in range(self.hashes):
+            position = (first + index * second) % self.size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add(self, item: str) -> None:
+        bits = self.__bits
+        first, second = self.__hashes(item)
+        for index in range(self.hashes):
+            position = (first + index * second) % self.size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    @staticmethod
+    def __hashes(item: str) -> tuple[int, int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
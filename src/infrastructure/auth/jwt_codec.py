@@ -0,0 +1,66 @@
+import base64
+import binascii
+import hmac
+from typing import Any
+from src.application.domain.exceptions import InvalidTokenError
+from src.infrastructure.utils.serialization import json_dumps, json_loads
+
+
+_DIGESTS = {'HS256': 'sha256', 'HS384': 'sha384', 'HS512': 'sha512'}
+_MALFORMED = 'Malformed token'
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + '=' * (-len(data) % 4))
+
+
+class JWTCodec:
+    """
+    Compact JWS tokens signed with HMAC (HS256, HS384 or HS512).
+
+    Only tokens written by this codec are accepted: the header must be the
+    exact one it writes, so a token cannot choose its own algorithm (`none`,
+    or a public key passed off as an HMAC secret). The signature is compared
+    in constant time before anything else of the token is decoded.
+    Expiry and the other claims are left to the caller.
+    """
+
+    def __init__(self, secret: str, algorithm: str = 'HS256') -> None:
+        if algorithm not in _DIGESTS:
+            message = f'Unsupported JWT algorithm: {algorithm} (supported: {", ".join(_DIGESTS)})'
+            raise ValueError(message)
+        self.algorithm = algorithm
+        self.__key = secret.encode()
+        self.__digest = _DIGESTS[algorithm]
+        self.__header = _b64encode(json_dumps({'alg': algorithm, 'typ': 'JWT'})).decode()
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        signing_input = f'{self.__header}.{_b64encode(json_dumps(payload)).decode()}'
+        return f'{signing_input}.{self.__sign(signing_input)}'
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """Payload of a token with a valid signature"""
+        # compare_digest only takes ASCII strings; no well formed token has anything else
+        if not token.isascii():
+            raise InvalidTokenError(_MALFORMED)
+        signing_input, _, signature = token.rpartition('.')
+        header, _, payload = signing_input.partition('.')
+        if header != self.__header or not payload:
+            raise InvalidTokenError(_MALFORMED)
+        if not hmac.compare_digest(self.__sign(signing_input).encode(), signature.encode()):
+            message = 'Invalid token signature'
+            raise InvalidTokenError(message)
+        try:
+            claims = json_loads(_b64decode(payload))
+        except (binascii.Error, ValueError) as e:
+            raise InvalidTokenError(_MALFORMED) from e
+        if not isinstance(claims, dict):
+            raise InvalidTokenError(_MALFORMED)
+        return claims
+
+    def __sign(self, signing_input: str) -> str:
+        return _b64encode(hmac.digest(self.__key, signing_input.encode(), self.__digest)).decode()
@@ -0,0 +1,48 @@
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from src.infrastructure.auth.revocation_store import RevocationCallback, RevocationStore
+
+
+class MemoryRevocationStore(RevocationStore):
+    """Revocations of a single worker process; they are lost on restart"""
+
+    def __init__(self) -> None:
+        self.__revoked: dict[str, float] = {}
+        self.__claimed: dict[str, float] = {}
+        self.__subscribers: list[RevocationCallback] = []
+
+    async def revoke(self, token_id: str, until: float) -> None:
+        self.__revoked[token_id] = max(until, self.__revoked.get(token_id, 0.0))
+        for callback in self.__subscribers:
+            callback(token_id)
+
+    async def is_revoked(self, token_ids: Iterable[str]) -> bool:
+        now = time.time()
+        return any(self.__revoked.get(token_id, 0.0) > now for token_id in token_ids)
+
+    async def claim(self, token_id: str, until: float) -> bool:
+        now = time.time()
+        if self.__claimed.get(token_id, 0.0) > now:
+            return False
+        self.__claimed[token_id] = until
+        return True
+
+    async def load(self) -> list[str]:
+        now = time.time()
+        self.__revoked = {token_id: until for token_id, until in self.__revoked.items() if until > now}
+        self.__claimed = {token_id: until for token_id, until in self.__claimed.items() if until > now}
+        return list(self.__revoked)
+
+    async def subscribe(self, callback: RevocationCallback) -> Callable[[], Awaitable[None]]:
+        self.__subscribers.append(callback)
+
+        async def unsubscribe() -> None:
+            self.__subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def ping(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.__subscribers.clear()
@@ -0,0 +1,105 @@
+import asyncio
+import contextlib
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.infrastructure.auth.revocation_store import RevocationCallback, RevocationStore
+from src.infrastructure.logger import Logger
+
+
+_UNAVAILABLE = 'Token revocation store is unavailable'
+
+
+class RedisRevocationStore(RevocationStore):
+    """
+    Revocations shared by all workers and nodes.
+
+    Revoked ids are members of the sorted set `<prefix>revoked` scored with
+    their expiry, pruned when the set is loaded, and published on
+    `<prefix>revoked` as well. Used single-use ids are plain keys
+    (`<prefix>used:<id>`) set with NX and expiring with the token. An
+    unreachable Redis fails closed: the check raises ServiceUnavailableError.
+    """
+
+    def __init__(self, redis: Redis, logger: Logger, prefix: str = 'auth:') -> None:
+        self.__redis = redis
+        self.__logger = logger
+        self.__prefix = prefix
+        self.__key = f'{prefix}revoked'
+
+    @classmethod
+    def from_url(cls, url: str, logger: Logger, prefix: str = 'auth:') -> 'RedisRevocationStore':
+        return cls(Redis.from_url(url), logger, prefix)
+
+    async def revoke(self, token_id: str, until: float) -> None:
+        try:
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                pipe.zadd(self.__key, {token_id: until}, gt=True)
+                pipe.publish(self.__key, token_id)
+                await pipe.execute()
+        except RedisError as e:
+            raise ServiceUnavailableError(_UNAVAILABLE) from e
+
+    async def is_revoked(self, token_ids: Iterable[str]) -> bool:
+        try:
+            scores = await self.__redis.zmscore(self.__key, list(token_ids))
+        except RedisError as e:
+            raise ServiceUnavailableError(_UNAVAILABLE) from e
+        now = time.time()
+        return any(score is not None and score > now for score in scores)
+
+    async def claim(self, token_id: str, until: float) -> bool:
+        try:
+            return bool(await self.__redis.set(f'{self.__prefix}used:{token_id}', 1, nx=True, exat=math.ceil(until)))
+        except RedisError as e:
+            raise ServiceUnavailableError(_UNAVAILABLE) from e
+
+    async def load(self) -> list[str]:
+        now = time.time()
+        try:
+            async with self.__redis.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(self.__key, '-inf', now)
+                pipe.zrange(self.__key, 0, -1)
+                _, members = await pipe.execute()
+        except RedisError as e:
+            raise ServiceUnavailableError(_UNAVAILABLE) from e
+        return [member.decode() if isinstance(member, bytes) else member for member in members]
+
+    async def subscribe(self, callback: RevocationCallback) -> Callable[[], Awaitable[None]]:
+        pubsub = self.__redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.__key)
+        except RedisError as e:
+            raise ServiceUnavailableError(_UNAVAILABLE) from e
+
+        async def listen() -> None:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        data = message['data']
+                        callback(data.decode() if isinstance(data, bytes) else data)
+                except RedisError as e:
+                    self.__logger.warning('Token revocation subscription lost, reconnecting', error=e)
+                    await asyncio.sleep(1)
+
+        task = asyncio.create_task(listen(), name='token-revocations')
+
+        async def unsubscribe() -> None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            await pubsub.aclose()
+
+        return unsubscribe
+
+    async def ping(self) -> None:
+        try:
+            await self.__redis.ping()
+        except RedisError as e:
+            raise ServiceUnavailableError(_UNAVAILABLE) from e
+
+    async def close(self) -> None:
+        await self.__redis.aclose()
@@ -0,0 +1,121 @@
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+from src.infrastructure.auth.bloom_filter import BloomFilter
+from src.infrastructure.auth.revocation_store import RevocationStore
+from src.infrastructure.logger import Logger
+from src.infrastructure.metrics import MetricFamily, counter_family, gauge_family
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class RevocationIndex:
+    """
+    Revocation checks answered locally for almost every token.
+
+    A Bloom filter of the revoked ids sits in front of the store: ids it
+    does not contain are not revoked and cost no round trip, only filter
+    hits (revoked tokens and rare false positives) are looked up in the
+    store. Revocations of other workers are added as the store broadcasts
+    them, and every `sync_interval` seconds the filter is rebuilt from the
+    store, which drops expired ids and covers broadcasts missed while the
+    subscription was down.
+    """
+
+    def __init__(
+        self,
+        store: RevocationStore,
+        logger: Logger,
+        *,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 60.0,
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.checks = 0
+        self.lookups = 0
+        self.false_positives = 0
+        self.__store = store
+        self.__logger = logger
+        self.__filter = BloomFilter(capacity, error_rate)
+        self.__added: list[str] = []
+        self.__unsubscribe: Callable[[], Awaitable[None]] | None = None
+        self.__task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self.__unsubscribe = await self.__store.subscribe(self.__add)
+        await self.sync()
+        self.__task = asyncio.create_task(self.__sync_periodically(), name='revocation-sync')
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+        if self.__unsubscribe is not None:
+            await self.__unsubscribe()
+            self.__unsubscribe = None
+        await self.__store.close()
+
+    async def is_revoked(self, *token_ids: str) -> bool:
+        self.checks += 1
+        if not any(token_id in self.__filter for token_id in token_ids):
+            return False
+        self.lookups += 1
+        revoked = await self.__store.is_revoked(token_ids)
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    async def revoke(self, token_id: str, until: float) -> None:
+        self.__add(token_id)
+        await self.__store.revoke(token_id, until)
+
+    async def claim(self, token_id: str, until: float) -> bool:
+        return await self.__store.claim(token_id, until)
+
+    async def sync(self) -> None:
+        """Rebuild the filter from the ids still revoked in the store"""
+        self.__added = []
+        revoked = await self.__store.load()
+        rebuilt = BloomFilter(max(self.capacity, 2 * len(revoked)), self.error_rate)
+        for token_id in (*revoked, *self.__added):  # ids revoked while loading may be missing from `revoked`
+            rebuilt.add(token_id)
+        self.__filter = rebuilt
+
+    def collect(self) -> list[MetricFamily]:
+        return [
+            counter_family('token_revocation_checks_total', 'Tokens checked for revocation.', [({}, self.checks)]),
+            counter_family(
+                'token_revocation_lookups_total',
+                'Revocation checks the Bloom filter could not answer, looked up in the store.',
+                [({}, self.lookups)],
+            ),
+            counter_family(
+                'token_revocation_false_positives_total',
+                'Store lookups that found the token not revoked.',
+                [({}, self.false_positives)],
+            ),
+            gauge_family(
+                'token_revocation_filter_items',
+                'Revoked ids in the local Bloom filter.',
+                [({}, len(self.__filter))],
+                aggregate='max',
+            ),
+        ]
+
+    def __add(self, token_id: str) -> None:
+        self.__filter.add(token_id)
+        self.__added.append(token_id)
+
+    async def __sync_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except Exception as e:  # noqa: BLE001
+                self.__logger.warning('Token revocation filter sync failed', error=e)
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+
+
+RevocationCallback = Callable[[str], None]
+
+
+class RevocationStore(ABC):
+    """
+    Revoked token and session ids, each kept until the unix time after which
+    the tokens it covers have expired anyway. Revocations are broadcast to
+    every subscriber so each worker can add them to its local filter.
+    """
+
+    @abstractmethod
+    async def revoke(self, token_id: str, until: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def is_revoked(self, token_ids: Iterable[str]) -> bool:
+        """Whether any of the ids is revoked"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(self, token_id: str, until: float) -> bool:
+        """Mark a single-use id as used; False when it already was"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def load(self) -> list[str]:
+        """Every id still revoked"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def subscribe(self, callback: RevocationCallback) -> Callable[[], Awaitable[None]]:
+        """Call `callback` with every revoked id; returns an unsubscribe coroutine"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ping(self) -> None:
+        """Round trip to the storage; raises ServiceUnavailableError when it is unreachable"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,138 @@
+import hashlib
+import time
+import uuid
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, cast
+from src.application.contracts.i_token_service import ITokenService
+from src.application.domain.exceptions import InvalidTokenError
+from src.application.domain.objects.token_claims import TokenClaims
+from src.application.domain.objects.token_pair import TokenPair
+from src.infrastructure.auth.jwt_codec import JWTCodec
+from src.infrastructure.auth.revocation_index import RevocationIndex
+from src.infrastructure.cache.lru_cache import MISSING, LRUCache
+from src.infrastructure.logger import Logger
+from src.infrastructure.metrics import MetricFamily, counter_family
+
+
+_REGISTERED_CLAIMS = ('sub', 'jti', 'fam', 'typ', 'iat', 'exp')
+
+
+class TokenService(ITokenService):
+    """
+    JWT access and refresh tokens of login sessions.
+
+    Every token carries the id of its session (`fam`), shared by all the
+    tokens refreshed from the same login. Verified tokens are kept in an LRU
+    of `cache_size` entries, keyed by a digest of the token and expiring
+    with it, so a token seen again skips the signature check and decoding;
+    revocation is checked on every use. Refresh tokens are single use: one
+    presented a second time has leaked, and its whole session is revoked.
+    """
+
+    def __init__(
+        self,
+        codec: JWTCodec,
+        revocations: RevocationIndex,
+        logger: Logger,
+        *,
+        access_ttl: int = 30 * 60,
+        refresh_ttl: int = 7 * 24 * 60 * 60,
+        cache_size: int = 10_000,
+    ) -> None:
+        self.access_ttl = access_ttl
+        self.refresh_ttl = refresh_ttl
+        self.hits = 0
+        self.misses = 0
+        self.__codec = codec
+        self.__revocations = revocations
+        self.__logger = logger
+        self.__verified = LRUCache(cache_size)
+
+    async def start(self) -> None:
+        await self.__revocations.start()
+
+    async def stop(self) -> None:
+        await self.__revocations.stop()
+
+    def issue(self, subject: str, claims: Mapping[str, Any] | None = None) -> TokenPair:
+        return self.__issue(subject, claims or {}, uuid.uuid4().hex)
+
+    async def verify(self, token: str, kind: str = 'access') -> TokenClaims:
+        key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        now = time.time()
+        claims = self.__verified.get(key)
+        if claims is MISSING:
+            self.misses += 1
+            claims = self.__decode(token)
+            self.__verified.set(key, claims, claims.expires_at - now)
+        else:
+            self.hits += 1
+        if claims.expires_at <= now:
+            message = 'Token has expired'
+            raise InvalidTokenError(message)
+        if claims.token_type != kind:
+            message = f'Wrong token type, expected {kind}'
+            raise InvalidTokenError(message)
+        if await self.__revocations.is_revoked(claims.token_id, claims.family):
+            message = 'Token has been revoked'
+            raise InvalidTokenError(message)
+        return cast('TokenClaims', claims)
+
+    async def refresh(self, refresh_token: str) -> TokenPair:
+        claims = await self.verify(refresh_token, 'refresh')
+        if not await self.__revocations.claim(claims.token_id, claims.expires_at):
+            await self.revoke(claims, session=True)
+            self.__logger.warning('Refresh token reused, session revoked', subject=claims.subject, session=claims.family)
+            message = 'Refresh token has already been used'
+            raise InvalidTokenError(message)
+        return self.__issue(claims.subject, claims.extra, claims.family)
+
+    async def revoke(self, claims: TokenClaims, *, session: bool = False) -> None:
+        if session:
+            # no token of the session expires later than a refresh token issued now
+            await self.__revocations.revoke(claims.family, time.time() + self.refresh_ttl)
+        else:
+            await self.__revocations.revoke(claims.token_id, claims.expires_at)
+
+    def collect(self) -> list[MetricFamily]:
+        return [
+            counter_family(
+                'token_verifications_total',
+                'Token verifications, by whether the token was already verified (cache hit).',
+                [({'cache': 'hit'}, self.hits), ({'cache': 'miss'}, self.misses)],
+            ),
+            *self.__revocations.collect(),
+        ]
+
+    def __issue(self, subject: str, extra: Mapping[str, Any], family: str) -> TokenPair:
+        now = int(time.time())
+        access_token, refresh_token = (
+            self.__codec.encode({
+                **extra,
+                'sub': subject,
+                'jti': uuid.uuid4().hex,
+                'fam': family,
+                'typ': token_type,
+                'iat': now,
+                'exp': now + ttl,
+            })
+            for token_type, ttl in (('access', self.access_ttl), ('refresh', self.refresh_ttl))
+        )
+        return TokenPair(access_token, refresh_token, self.access_ttl)
+
+    def __decode(self, token: str) -> TokenClaims:
+        payload = self.__codec.decode(token)
+        try:
+            return TokenClaims(
+                str(payload['sub']),
+                str(payload['jti']),
+                str(payload['fam']),
+                str(payload['typ']),
+                int(payload['iat']),
+                int(payload['exp']),
+                MappingProxyType({name: value for name, value in payload.items() if name not in _REGISTERED_CLAIMS}),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            message = 'Malformed token'
+            raise InvalidTokenError(message) from e
@@ -0,0 +1,30 @@
+from src.infrastructure.cache.cache_backend import CacheBackend
+from src.infrastructure.cache.cache_backend_error import CacheBackendError
+from src.infrastructure.cache.cache_service import CacheService
+from src.infrastructure.cache.cache_stats import CacheStats
+from src.infrastructure.cache.cached import cached
+from src.infrastructure.cache.lru_cache import LRUCache
+from src.infrastructure.cache.memory_cache_backend import MemoryCacheBackend
+from src.infrastructure.logger import logger
+from src.settings import settings
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == 'redis':
+        from src.infrastructure.cache.redis_cache_backend import RedisCacheBackend  # noqa: PLC0415 - redis is optional
+        return RedisCacheBackend.from_url(settings.REDIS_URL, logger, prefix=settings.CACHE_PREFIX)
+    return MemoryCacheBackend()
+
+
+cache_service = CacheService(
+    backend=create_cache_backend(),
+    logger=logger,
+    l1_max_entries=settings.CACHE_L1_MAX_ENTRIES,
+    l1_ttl=settings.CACHE_L1_TTL,
+    default_ttl=settings.CACHE_DEFAULT_TTL,
+    prefix=settings.CACHE_PREFIX,
+)
+
+
+async def get_cache() -> CacheService:
+    return cache_service
@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+
+InvalidationCallback = Callable[[list[str]], None]
+
+
+class CacheBackend(ABC):
+    """
+    Shared (L2) cache storage.
+
+    Values are opaque bytes. Deleting keys is broadcast to every subscriber,
+    so each worker can drop the same keys from its in-process cache. Every tag
+    has a generation bumped by each invalidation, so a value loaded while its
+    tags were invalidated can be recognised as stale and not written.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        tags: Sequence[str] = (),
+        generations: Sequence[int] | None = None,
+    ) -> bool:
+        """
+        Store the value; with `generations` (from `tag_generations(tags)`) the write is
+        skipped and False returned when any of the tags has been invalidated since
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        """Atomically delete all keys stored with the tags, bump the tags' generations and return the keys"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def tag_generations(self, tags: Sequence[str]) -> list[int]:
+        """Current generation of each tag"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def subscribe(self, callback: InvalidationCallback) -> Callable[[], Awaitable[None]]:
+        """Call `callback` with the deleted keys of every invalidation; returns an unsubscribe coroutine"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ping(self) -> None:
+        """Round trip to the storage; raises CacheBackendError when it is unreachable"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections"""
+        raise NotImplementedError
@@ -0,0 +1,2 @@
+class CacheBackendError(Exception):
+    """Raised when the shared cache backend is unreachable or fails."""
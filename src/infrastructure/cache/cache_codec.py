@@ -0,0 +1,98 @@
+import datetime
+import decimal
+import importlib
+import uuid
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+from pydantic import BaseModel
+from src.infrastructure.utils.serialization import json_dumps, json_loads
+
+
+_TAG = '__cache_type__'
+_NATIVE = (str, int, float, bool, type(None))
+# datetime before date, a datetime is a date
+_SCALARS: tuple[tuple[type, str, Callable[[Any], str]], ...] = (
+    (datetime.datetime, 'datetime', datetime.datetime.isoformat),
+    (datetime.date, 'date', datetime.date.isoformat),
+    (uuid.UUID, 'uuid', str),
+    (decimal.Decimal, 'decimal', str),
+)
+_PARSERS: dict[str, Callable[[str], Any]] = {
+    'datetime': datetime.datetime.fromisoformat,
+    'date': datetime.date.fromisoformat,
+    'uuid': uuid.UUID,
+    'decimal': decimal.Decimal,
+}
+
+
+@cache
+def _model_class(path: str) -> type[BaseModel]:
+    module_name, _, qualname = path.partition(':')
+    target: Any = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        target = getattr(target, name)
+    if not (isinstance(target, type) and issubclass(target, BaseModel)):
+        message = f'{path} is not a pydantic model'
+        raise TypeError(message)
+    return target
+
+
+def _encode_model(value: BaseModel) -> dict[str, Any]:
+    cls = type(value)
+    if '<locals>' in cls.__qualname__:
+        message = f'Cannot cache {cls.__qualname__}, a model defined in a function cannot be imported back'
+        raise TypeError(message)
+    return {_TAG: 'model', 'class': f'{cls.__module__}:{cls.__qualname__}', 'value': value.model_dump(mode='json')}
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, _NATIVE):
+        return value
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            message = 'Cached dicts must have str keys'
+            raise TypeError(message)
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {_TAG: 'tuple', 'value': [_encode(item) for item in value]}
+    if isinstance(value, BaseModel):
+        return _encode_model(value)
+    for scalar_type, tag, to_string in _SCALARS:
+        if isinstance(value, scalar_type):
+            return {_TAG: tag, 'value': to_string(value)}
+    message = f'Cannot cache a value of type {type(value).__qualname__}'
+    raise TypeError(message)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    tag = value.get(_TAG)
+    if tag is None:
+        return {key: _decode(item) for key, item in value.items()}
+    if tag == 'tuple':
+        return tuple(_decode(item) for item in value['value'])
+    if tag == 'model':
+        return _model_class(value['class']).model_validate(value['value'])
+    return _PARSERS[tag](value['value'])
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    JSON document of a cached value.
+
+    JSON values round-trip as they are; tuples, datetimes, dates, UUIDs,
+    Decimals and pydantic models (`model_dump(mode='json')`) are stored with
+    a type tag and come back as the same type. Any other type raises
+    TypeError rather than being cached in a lossy form.
+    """
+    return json_dumps(_encode(value))
+
+
+def decode_value(data: bytes) -> Any:
+    return _decode(json_loads(data))
@@ -0,0 +1,172 @@
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, TypeVar, cast
+from src.application.contracts.i_cache_service import ICacheService
+from src.infrastructure.cache.cache_backend import CacheBackend
+from src.infrastructure.cache.cache_backend_error import CacheBackendError
+from src.infrastructure.cache.cache_codec import decode_value, encode_value
+from src.infrastructure.cache.cache_stats import CacheStats
+from src.infrastructure.cache.lru_cache import MISSING, LRUCache
+from src.infrastructure.logger import Logger
+from src.infrastructure.utils.single_flight import SingleFlight
+
+
+T = TypeVar('T')
+
+
+class CacheService(ICacheService):
+    """
+    Two-tier cache: per-worker LRU (L1) in front of a shared backend (L2).
+
+    Values are stored in L2 by `encode_value`: JSON values and a few tagged
+    types (pydantic models, datetimes, UUIDs...) round-trip, anything else
+    raises TypeError. L1 hands out the same object to every caller, so
+    cached values must not be mutated. L1 entries live at most
+    `l1_ttl` seconds and are dropped on every invalidation broadcast by the
+    backend. A load whose tags are invalidated while it runs is returned to its
+    callers but not cached. Concurrent misses of one key share a single load, and backend
+    failures degrade to loading from the source instead of failing the request.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        logger: Logger,
+        l1_max_entries: int = 10_000,
+        l1_ttl: float = 30.0,
+        default_ttl: float = 300.0,
+        prefix: str = 'cache:',
+    ) -> None:
+        self.backend = backend
+        self.stats = CacheStats()
+        self.__logger = logger
+        self.__l1 = LRUCache(l1_max_entries)
+        self.__l1_ttl = l1_ttl
+        self.__default_ttl = default_ttl
+        self.__prefix = prefix
+        self.__loads = SingleFlight()
+        self.__unsubscribe: Callable[[], Awaitable[None]] | None = None
+
+    @property
+    def evictions(self) -> int:
+        return self.__l1.evictions
+
+    async def start(self) -> None:
+        """Subscribe to invalidations broadcast by other workers"""
+        try:
+            self.__unsubscribe = await self.backend.subscribe(self.__on_invalidated)
+        except CacheBackendError as e:
+            self.stats.backend_errors += 1
+            self.__logger.warning('Cache invalidation subscription failed', error=e)
+
+    async def stop(self) -> None:
+        if self.__unsubscribe is not None:
+            await self.__unsubscribe()
+            self.__unsubscribe = None
+        await self.backend.close()
+        self.__l1.clear()
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        value = await self.__get(self.__prefix + key)
+        return default if value is MISSING else value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None, tags: Iterable[str] = ()) -> None:
+        await self.__set(self.__prefix + key, value, self.__default_ttl if ttl is None else ttl, tags)
+
+    async def delete(self, *keys: str) -> None:
+        full_keys = [self.__prefix + key for key in keys]
+        self.__on_invalidated(full_keys)
+        try:
+            await self.backend.delete(full_keys)
+        except CacheBackendError as e:
+            self.__backend_failed(e)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        try:
+            keys = await self.backend.invalidate_tags(tags)
+        except CacheBackendError as e:
+            self.__backend_failed(e)
+            return
+        self.__on_invalidated(keys)
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> T:
+        full_key = self.__prefix + key
+        value = await self.__get(full_key)
+        if value is not MISSING:
+            return cast('T', value)
+
+        if full_key in self.__loads:
+            self.stats.shared_loads += 1
+        return await self.__loads.do(
+            full_key, lambda: self.__load(full_key, loader, self.__default_ttl if ttl is None else ttl, tags)
+        )
+
+    async def __load(self, key: str, loader: Callable[[], Awaitable[T]], ttl: float, tags: Iterable[str]) -> T:
+        self.stats.loads += 1
+        tags = list(tags)
+        generations = await self.__tag_generations(tags)
+        value = await loader()
+        await self.__set(key, value, ttl, tags, generations)
+        return value
+
+    async def __tag_generations(self, tags: list[str]) -> list[int] | None:
+        if not tags:
+            return None
+        try:
+            return await self.backend.tag_generations(tags)
+        except CacheBackendError as e:
+            self.__backend_failed(e)
+            return None
+
+    async def __get(self, key: str) -> Any:
+        value = self.__l1.get(key)
+        if value is not MISSING:
+            self.stats.l1_hits += 1
+            return value
+
+        try:
+            data = await self.backend.get(key)
+        except CacheBackendError as e:
+            self.__backend_failed(e)
+            data = None
+
+        if data is None:
+            self.stats.misses += 1
+            return MISSING
+
+        self.stats.l2_hits += 1
+        value = decode_value(data)
+        self.__l1.set(key, value, self.__l1_ttl)
+        return value
+
+    async def __set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[str],
+        generations: list[int] | None = None,
+    ) -> None:
+        data = encode_value(value)
+        try:
+            written = await self.backend.set(key, data, ttl, list(tags), generations)
+        except CacheBackendError as e:
+            self.__backend_failed(e)
+            written = True
+        if not written:
+            self.stats.stale_writes += 1
+            return
+        self.__l1.set(key, value, min(ttl, self.__l1_ttl))
+
+    def __on_invalidated(self, keys: list[str]) -> None:
+        for key in keys:
+            self.__l1.delete(key)
+
+    def __backend_failed(self, error: CacheBackendError) -> None:
+        self.stats.backend_errors += 1
+        self.__logger.warning('Cache backend error', error=error)
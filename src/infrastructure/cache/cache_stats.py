@@ -0,0 +1,18 @@
+from typing import Any
+
+
+class CacheStats:
+    """Hit, miss and load counters of a CacheService."""
+    __slots__ = ('l1_hits', 'l2_hits', 'misses', 'loads', 'shared_loads', 'stale_writes', 'backend_errors')
+
+    def __init__(self) -> None:
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.shared_loads = 0
+        self.stale_writes = 0
+        self.backend_errors = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
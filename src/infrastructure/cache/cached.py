@@ -0,0 +1,47 @@
+import functools
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+from src.application.contracts.i_cache_service import ICacheService
+from src.infrastructure.utils.single_flight import KeyBuilder, render_key
+
+
+def cached(
+    key: KeyBuilder,
+    ttl: float | None = None,
+    tags: Iterable[KeyBuilder] = (),
+    cache: ICacheService | Callable[[], ICacheService] | None = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Decorator caching the result of an async function (service method or route handler).
+
+    :param key: Key template formatted with the call arguments (`'user:{user_id}'`)
+                or a callable receiving the same arguments as the function.
+    :param ttl: Time to live in seconds, the cache default when omitted.
+    :param tags: Tag templates, rendered like the key, for tag-based invalidation.
+    :param cache: Cache instance or factory; the application cache when omitted.
+    """
+    tag_templates = tuple(tags)
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_key = render_key(key, signature, args, kwargs)
+            cache_tags = [render_key(tag, signature, args, kwargs) for tag in tag_templates]
+
+            return await _resolve(cache).get_or_set(cache_key, lambda: func(*args, **kwargs), ttl, cache_tags)
+
+        return wrapper
+
+    return decorator
+
+
+def _resolve(cache: ICacheService | Callable[[], ICacheService] | None) -> ICacheService:
+    if cache is None:
+        from src.infrastructure.cache import cache_service  # noqa: PLC0415 - avoids an import cycle
+        return cache_service
+    if isinstance(cache, ICacheService):
+        return cache
+    return cache()
@@ -0,0 +1,57 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+
+MISSING: Any = object()
+
+
+class LRUCache:
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Once `max_entries` is reached, the least recently used entry is evicted.
+    Expired entries are dropped lazily when they are read.
+    """
+
+    def __init__(self, max_entries: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.expirations = 0
+        self.__clock = clock
+        self.__entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> Any:
+        """Return the value or MISSING"""
+        entry = self.__entries.get(key)
+        if entry is None:
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= self.__clock():
+            del self.__entries[key]
+            self.expirations += 1
+            return MISSING
+
+        self.__entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+
+        self.__entries[key] = (self.__clock() + ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.__entries.clear()
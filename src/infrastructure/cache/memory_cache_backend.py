@@ -0,0 +1,82 @@
+import time
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from src.infrastructure.cache.cache_backend import CacheBackend, InvalidationCallback
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Process-local stand-in for Redis.
+
+    Behaves like RedisCacheBackend (TTL, tags, invalidation broadcast) within a
+    single process, so the cache works in tests and local runs without a server.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.__clock = clock
+        self.__values: dict[str, tuple[float, bytes]] = {}
+        self.__tags: dict[str, set[str]] = {}
+        self.__generations: dict[str, int] = {}
+        self.__subscribers: list[InvalidationCallback] = []
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self.__values.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self.__clock():
+            del self.__values[key]
+            return None
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        tags: Sequence[str] = (),
+        generations: Sequence[int] | None = None,
+    ) -> bool:
+        if generations is not None and await self.tag_generations(tags) != list(generations):
+            return False
+        self.__values[key] = (self.__clock() + ttl, value)
+        for tag in tags:
+            self.__tags.setdefault(tag, set()).add(key)
+        return True
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        for key in keys:
+            self.__values.pop(key, None)
+        self.__publish(keys)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        keys: set[str] = set()
+        for tag in tags:
+            keys |= self.__tags.pop(tag, set())
+            self.__generations[tag] = self.__generations.get(tag, 0) + 1
+        await self.delete(keys)
+        return list(keys)
+
+    async def tag_generations(self, tags: Sequence[str]) -> list[int]:
+        return [self.__generations.get(tag, 0) for tag in tags]
+
+    async def subscribe(self, callback: InvalidationCallback) -> Callable[[], Awaitable[None]]:
+        self.__subscribers.append(callback)
+
+        async def unsubscribe() -> None:
+            self.__subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def ping(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        self.__values.clear()
+        self.__tags.clear()
+        self.__generations.clear()
+
+    def __publish(self, keys: list[str]) -> None:
+        if keys:
+            for callback in self.__subscribers:
+                callback(keys)
@@ -0,0 +1,170 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import cast
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.infrastructure.cache.cache_backend import CacheBackend, InvalidationCallback
+from src.infrastructure.cache.cache_backend_error import CacheBackendError
+from src.infrastructure.logger import Logger
+from src.infrastructure.utils.serialization import json_dumps, json_loads
+
+
+# KEYS: key, tag sets, tag generations; ARGV: value, ttl (ms), expected generations (optional)
+_SET = """
+local count = (#KEYS - 1) / 2
+if #ARGV > 2 then
+    for i = 1, count do
+        if tonumber(redis.call('GET', KEYS[1 + count + i]) or '0') ~= tonumber(ARGV[2 + i]) then
+            return 0
+        end
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+for i = 2, count + 1 do
+    redis.call('SADD', KEYS[i], KEYS[1])
+    redis.call('PEXPIRE', KEYS[i], ARGV[2], 'NX')
+    redis.call('PEXPIRE', KEYS[i], ARGV[2], 'GT')
+end
+return 1
+"""
+
+# KEYS: tag sets, tag generations; ARGV: invalidation channel, generation ttl (s)
+_INVALIDATE = """
+local count = #KEYS / 2
+local keys = redis.call('SUNION', unpack(KEYS, 1, count))
+for i = 1, #keys, 1000 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 999, #keys)))
+end
+redis.call('DEL', unpack(KEYS, 1, count))
+for i = count + 1, #KEYS do
+    redis.call('INCR', KEYS[i])
+    redis.call('EXPIRE', KEYS[i], ARGV[2])
+end
+if #keys > 0 then
+    redis.call('PUBLISH', ARGV[1], cjson.encode(keys))
+end
+return keys
+"""
+
+# A generation only has to outlive the slowest load that read it
+_GENERATION_TTL = 86_400
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis cache storage shared by all workers and nodes.
+
+    Tags are Redis sets of keys (`<prefix>tag:<name>`); their TTL is only ever
+    extended (EXPIRE GT, Redis 7+) so a tag outlives every key it references.
+    Tag invalidation and generation-checked writes are Lua scripts, so a key
+    tagged concurrently is either deleted or not written at all. The scripts
+    touch keys they do not declare, so the backend needs a single Redis (no
+    Cluster). Invalidated keys are published on `<prefix>invalidate`.
+    """
+
+    def __init__(self, redis: Redis, logger: Logger, prefix: str = 'cache:') -> None:
+        self.__redis = redis
+        self.__logger = logger
+        self.__prefix = prefix
+        self.__channel = f'{prefix}invalidate'
+        self.__set_script = redis.register_script(_SET)
+        self.__invalidate_script = redis.register_script(_INVALIDATE)
+
+    @classmethod
+    def from_url(cls, url: str, logger: Logger, prefix: str = 'cache:') -> 'RedisCacheBackend':
+        return cls(Redis.from_url(url), logger, prefix)
+
+    def __tag_key(self, tag: str) -> str:
+        return f'{self.__prefix}tag:{tag}'
+
+    def __generation_key(self, tag: str) -> str:
+        return f'{self.__prefix}generation:{tag}'
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return cast('bytes | None', await self.__redis.get(key))
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        tags: Sequence[str] = (),
+        generations: Sequence[int] | None = None,
+    ) -> bool:
+        keys = [key, *map(self.__tag_key, tags), *map(self.__generation_key, tags)]
+        args: list[bytes | int] = [value, max(int(ttl * 1000), 1), *(generations or ())]
+        try:
+            return bool(await self.__set_script(keys=keys, args=args))
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        try:
+            async with self.__redis.pipeline(transaction=True) as pipe:
+                pipe.delete(*keys)
+                pipe.publish(self.__channel, json_dumps(keys))
+                await pipe.execute()
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> list[str]:
+        tags = list(tags)
+        if not tags:
+            return []
+        keys = [*map(self.__tag_key, tags), *map(self.__generation_key, tags)]
+        try:
+            members = await self.__invalidate_script(keys=keys, args=[self.__channel, _GENERATION_TTL])
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+        return [member.decode() if isinstance(member, bytes) else member for member in members]
+
+    async def tag_generations(self, tags: Sequence[str]) -> list[int]:
+        if not tags:
+            return []
+        try:
+            values = await self.__redis.mget([self.__generation_key(tag) for tag in tags])
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+        return [int(value or 0) for value in values]
+
+    async def subscribe(self, callback: InvalidationCallback) -> Callable[[], Awaitable[None]]:
+        pubsub = self.__redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.__channel)
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+        async def listen() -> None:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        callback(json_loads(message['data']))
+                except RedisError as e:
+                    self.__logger.warning('Cache invalidation subscription lost, reconnecting', error=e)
+                    await asyncio.sleep(1)
+
+        task = asyncio.create_task(listen(), name='cache-invalidation')
+
+        async def unsubscribe() -> None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            await pubsub.aclose()
+
+        return unsubscribe
+
+    async def ping(self) -> None:
+        try:
+            await self.__redis.ping()
+        except RedisError as e:
+            raise CacheBackendError(str(e)) from e
+
+    async def close(self) -> None:
+        await self.__redis.aclose()
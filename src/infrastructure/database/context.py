@@ -1,14 +1,36 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from collections.abc import AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.database import Database
+from src.infrastructure.logger import logger
 from src.settings import settings
 
 
-engine = create_async_engine(
+database = Database(
     settings.DATABASE_URL,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
-    pool_recycle=settings.DATABASE_POOL_RECYCLE,
-    echo=False
+    logger,
+    replica_urls=settings.DATABASE_REPLICAS,
+    warm_connections=settings.DATABASE_POOL_WARM_CONNECTIONS,
 )
 
-async_session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+pool_telemetry = database.telemetry
+replica_router = database.router
+async_session_maker = database.session_maker
+read_session_maker = database.read_session_maker
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """
+    Request-scoped session dependency.
+
+    The session does not hold a connection until its first query and returns
+    it to the pool on commit or rollback; whatever was not committed when the
+    request ends is rolled back.
+    """
+    async with async_session_maker() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """Request-scoped read-only session dependency; reads go to a replica when one is available"""
+    async with read_session_maker() as session:
+        yield session
@@ -0,0 +1,144 @@
+import asyncio
+import time
+from collections.abc import Sequence
+from sqlalchemy import Executable, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from src.infrastructure.database.pool_telemetry import PoolTelemetry
+from src.infrastructure.database.replica import Replica
+from src.infrastructure.database.replica_router import ReplicaRouter
+from src.infrastructure.database.routing_session import RoutingSession
+from src.infrastructure.logger import Logger
+from src.settings import settings
+
+
+class Database:
+    """
+    Engines of the primary and the read replicas, created on first use.
+
+    Nothing connects at import time: the lifespan calls start(), which creates
+    the engines, opens `warm_connections` connections per pool in parallel and
+    runs the registered warm-up statements on each of them (priming asyncpg's
+    prepared statement cache and SQLAlchemy's compiled cache), so the first
+    requests of a new worker do not pay for connection setup.
+    """
+
+    def __init__(self, url: str, logger: Logger, *, replica_urls: Sequence[str] = (), warm_connections: int = 0) -> None:
+        self.url = url
+        self.replica_urls = tuple(replica_urls)
+        self.warm_connections = warm_connections
+        self.telemetry = PoolTelemetry('primary', logger, slow_checkout=settings.DATABASE_SLOW_CHECKOUT_MS / 1000)
+        self.router = ReplicaRouter(
+            logger,
+            strategy=settings.DATABASE_REPLICA_STRATEGY,
+            max_lag=settings.DATABASE_REPLICA_MAX_LAG,
+            check_interval=settings.DATABASE_REPLICA_CHECK_INTERVAL,
+        )
+        self.session_maker = async_sessionmaker(
+            expire_on_commit=False, class_=AsyncSession, sync_session_class=RoutingSession, router=self.router
+        )
+        self.read_session_maker = async_sessionmaker(
+            expire_on_commit=False,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            router=self.router,
+            read_only=True,
+        )
+        self.__logger = logger
+        self.__warmup_statements: list[Executable] = []
+        self.__engine: AsyncEngine | None = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Primary engine; creating it also creates the replica engines and binds the session makers"""
+        if self.__engine is None:
+            self.__engine = self.__create_engine(self.url, self.telemetry)
+            self.session_maker.configure(bind=self.__engine)
+            self.read_session_maker.configure(bind=self.__engine)
+            for index, url in enumerate(self.replica_urls, start=1):
+                name = f'replica-{index}'
+                telemetry = PoolTelemetry(name, self.__logger, slow_checkout=self.telemetry.slow_checkout)
+                self.router.add(Replica(name, self.__create_engine(url, telemetry), telemetry))
+        return self.__engine
+
+    def warm_up(self, statement: Executable) -> None:
+        """
+        Run `statement` on every pre-opened connection at startup.
+
+        Register the hot queries of the service with representative
+        parameters, e.g. `select(User).where(User.id == 0)`; they run in a
+        transaction that is rolled back.
+        """
+        self.__warmup_statements.append(statement)
+
+    async def start(self) -> None:
+        engine = self.engine
+        await self.router.start()
+        if self.warm_connections:
+            await self.warm(engine, *(replica.engine for replica in self.router.available()))
+
+    async def stop(self) -> None:
+        await self.router.stop()
+        if self.__engine is not None:
+            await self.__engine.dispose()
+
+    async def ping(self) -> dict[str, int]:
+        """Run a trivial query on the primary; returns the pool status"""
+        async with self.engine.connect() as connection:
+            await connection.execute(text('SELECT 1'))
+        return self.telemetry.status()
+
+    async def warm(self, *engines: AsyncEngine) -> None:
+        count = min(self.warm_connections, settings.DATABASE_POOL_SIZE)
+        start = time.perf_counter()
+        opened = await asyncio.gather(*(self.__warm_pool(engine, count) for engine in engines))
+        if not sum(opened):
+            return
+        self.__logger.info(
+            'Database pools warmed',
+            connections=sum(opened),
+            pools=len(engines),
+            ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+
+    async def __warm_pool(self, engine: AsyncEngine, count: int) -> int:
+        # All connections are held until every one is open, otherwise the pool
+        # would hand the same connection out again
+        results = await asyncio.gather(*(engine.connect().start() for _ in range(count)), return_exceptions=True)
+        connections = [result for result in results if isinstance(result, AsyncConnection)]
+        try:
+            await asyncio.gather(*(self.__prepare(connection) for connection in connections))
+        finally:
+            await asyncio.gather(*(connection.close() for connection in connections), return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            self.__logger.warning(
+                'Database pool warm-up failed',
+                url=engine.url.render_as_string(hide_password=True),
+                failed=len(errors),
+                error=errors[0],
+            )
+        return len(connections)
+
+    async def __prepare(self, connection: AsyncConnection) -> None:
+        try:
+            for statement in self.__warmup_statements:
+                await connection.execute(statement)
+        except Exception as e:  # noqa: BLE001
+            self.__logger.warning('Database warm-up statement failed', error=e)
+        finally:
+            await connection.rollback()
+
+    @staticmethod
+    def __create_engine(url: str, telemetry: PoolTelemetry) -> AsyncEngine:
+        engine = create_async_engine(
+            url,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            poolclass=telemetry.pool_class(),
+            echo=False
+        )
+        telemetry.attach(engine)
+        return engine
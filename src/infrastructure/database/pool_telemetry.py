@@ -0,0 +1,106 @@
+import time
+from typing import Any
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+from src.infrastructure.logger import Logger
+from src.infrastructure.metrics import MetricFamily, counter_family, gauge_family, histogram_family
+from src.infrastructure.metrics.histogram import Histogram
+
+
+class PoolTelemetry:
+    """
+    Connection pool statistics for sizing DATABASE_POOL_SIZE from data.
+
+    Records how long callers wait to check out a connection and how long they
+    hold it, counts checkout timeouts and reports the pool occupancy. Slow
+    checkouts and timeouts are logged with the pool status.
+    """
+
+    def __init__(self, name: str, logger: Logger, slow_checkout: float) -> None:
+        self.name = name
+        self.slow_checkout = slow_checkout
+        self.checkout_wait = Histogram()
+        self.hold_time = Histogram()
+        self.timeouts = 0
+        self.__logger = logger
+        self.__pool: Pool | None = None
+
+    def pool_class(self) -> type[AsyncAdaptedQueuePool]:
+        """Pool class that times every checkout, to pass as `poolclass` to the engine"""
+        telemetry = self
+
+        class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+            def _do_get(self) -> ConnectionPoolEntry:
+                start = time.perf_counter()
+                try:
+                    connection = super()._do_get()
+                except exc.TimeoutError:
+                    telemetry.observe_timeout(self)
+                    raise
+                telemetry.observe_checkout(self, time.perf_counter() - start)
+                return connection
+
+        return InstrumentedAsyncPool
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Track connection hold time through pool events"""
+        self.__pool = engine.sync_engine.pool
+        event.listen(engine.sync_engine, 'checkout', self.__on_checkout)
+        event.listen(engine.sync_engine, 'checkin', self.__on_checkin)
+
+    def status(self, pool: Pool | None = None) -> dict[str, int]:
+        pool = pool or self.__pool
+        if not isinstance(pool, AsyncAdaptedQueuePool):
+            return {}
+        return {
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'checked_in': pool.checkedin(),
+            'overflow': pool.overflow(),
+        }
+
+    def observe_checkout(self, pool: Pool, seconds: float) -> None:
+        self.checkout_wait.record(seconds)
+        if seconds >= self.slow_checkout:
+            self.__logger.warning(
+                'Slow database connection checkout',
+                pool=self.name,
+                wait_ms=round(seconds * 1000, 2),
+                **self.status(pool),
+            )
+
+    def observe_timeout(self, pool: Pool) -> None:
+        self.timeouts += 1
+        self.__logger.error('Database connection checkout timed out', pool=self.name, **self.status(pool))
+
+    def collect(self) -> list[MetricFamily]:
+        labels = {'pool': self.name}
+        status = self.status()
+        return [
+            gauge_family('db_pool_size', 'Configured pool size.', [(labels, status.get('size', 0))]),
+            gauge_family('db_pool_checked_out', 'Connections currently checked out.', [(labels, status.get('checked_out', 0))]),
+            gauge_family('db_pool_overflow', 'Connections open beyond the pool size.', [(labels, max(status.get('overflow', 0), 0))]),
+            counter_family('db_pool_checkout_timeouts_total', 'Checkouts that hit pool_timeout.', [(labels, self.timeouts)]),
+            histogram_family(
+                'db_pool_checkout_wait_seconds',
+                'Time spent waiting for a pooled connection.',
+                self.checkout_wait.bounds,
+                [(labels, self.checkout_wait.counts, self.checkout_wait.sum)],
+            ),
+            histogram_family(
+                'db_pool_connection_hold_seconds',
+                'Time a connection stays checked out.',
+                self.hold_time.bounds,
+                [(labels, self.hold_time.counts, self.hold_time.sum)],
+            ),
+        ]
+
+    @staticmethod
+    def __on_checkout(_dbapi_connection: Any, record: ConnectionPoolEntry, _proxy: Any) -> None:
+        record.info['checked_out_at'] = time.perf_counter()
+
+    def __on_checkin(self, _dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop('checked_out_at', None)
+        if checked_out_at is not None:
+            self.hold_time.record(time.perf_counter() - checked_out_at)
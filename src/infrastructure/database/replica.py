@@ -0,0 +1,20 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+from src.infrastructure.database.pool_telemetry import PoolTelemetry
+
+
+class Replica:
+    """Read replica engine with its health and replication lag as last observed"""
+
+    def __init__(self, name: str, engine: AsyncEngine, telemetry: PoolTelemetry) -> None:
+        self.name = name
+        self.engine = engine
+        self.telemetry = telemetry
+        self.healthy = True
+        self.lag = 0.0
+
+    @property
+    def checked_out(self) -> int:
+        return self.telemetry.status().get('checked_out', 0)
+
+    def __repr__(self) -> str:
+        return f'Replica(name={self.name!r}, healthy={self.healthy}, lag={self.lag})'
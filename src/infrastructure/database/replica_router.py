@@ -0,0 +1,143 @@
+import asyncio
+import contextlib
+import itertools
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from typing import Literal
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from src.infrastructure.database.replica import Replica
+from src.infrastructure.logger import Logger
+from src.infrastructure.metrics import MetricFamily, gauge_family
+
+
+# Seconds the replica is behind the primary; 0 when it has replayed everything it received
+REPLICATION_LAG_QUERY = text(
+    'SELECT CASE '
+    'WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+)
+
+primary_pinned: ContextVar[bool] = ContextVar('primary_pinned', default=False)
+
+
+def pin_primary() -> None:
+    """Send the reads of the current request to the primary from now on (read-your-writes)"""
+    primary_pinned.set(True)
+
+
+class ReplicaRouter:
+    """
+    Picks a read replica for read-only sessions.
+
+    Replicas are chosen round-robin or by the fewest checked out connections.
+    A background task checks every replica and skips the ones that are down
+    or lag more than `max_lag` seconds; a disconnect seen by a query marks the
+    replica down until the next successful check. Without an available
+    replica, or once the current request has written, reads go to the primary.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        replicas: Sequence[Replica] = (),
+        *,
+        strategy: Literal['round_robin', 'least_connections'] = 'round_robin',
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self.replicas: tuple[Replica, ...] = ()
+        self.strategy = strategy
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.__logger = logger
+        self.__counter = itertools.count()
+        self.__task: asyncio.Task[None] | None = None
+
+        for replica in replicas:
+            self.add(replica)
+
+    def add(self, replica: Replica) -> None:
+        self.replicas = (*self.replicas, replica)
+        event.listen(replica.engine.sync_engine, 'handle_error', self.__on_error(replica))
+
+    def available(self) -> list[Replica]:
+        return [replica for replica in self.replicas if replica.healthy and replica.lag <= self.max_lag]
+
+    def choose(self) -> Replica | None:
+        """Replica for the next read, None to read from the primary"""
+        if primary_pinned.get():
+            return None
+        candidates = self.available()
+        if not candidates:
+            return None
+        if self.strategy == 'least_connections':
+            return min(candidates, key=lambda replica: replica.checked_out)
+        return candidates[next(self.__counter) % len(candidates)]
+
+    async def start(self) -> None:
+        if self.replicas:
+            await self.check()
+            self.__task = asyncio.create_task(self.__check_periodically(), name='replica-check')
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self.__check(replica) for replica in self.replicas))
+
+    def collect(self) -> list[MetricFamily]:
+        families = [family for replica in self.replicas for family in replica.telemetry.collect()]
+        families.append(
+            gauge_family(
+                'db_replica_healthy',
+                'Replica is used for reads (1) or skipped (0).',
+                [({'pool': replica.name}, int(replica in self.available())) for replica in self.replicas],
+                aggregate='max',
+            )
+        )
+        families.append(
+            gauge_family(
+                'db_replica_lag_seconds',
+                'Replication lag seen by the last check.',
+                [({'pool': replica.name}, replica.lag) for replica in self.replicas],
+                aggregate='max',
+            )
+        )
+        return families
+
+    async def __check_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def __check(self, replica: Replica) -> None:
+        try:
+            async with asyncio.timeout(self.check_interval), replica.engine.connect() as connection:
+                lag = float(await connection.scalar(REPLICATION_LAG_QUERY) or 0)
+        except Exception as e:  # noqa: BLE001
+            if replica.healthy:
+                self.__logger.warning('Database replica is unavailable', pool=replica.name, error=e)
+            replica.healthy = False
+            return
+
+        if lag > self.max_lag >= replica.lag:
+            self.__logger.warning('Database replica lags behind', pool=replica.name, lag=lag)
+        if not replica.healthy:
+            self.__logger.info('Database replica is available again', pool=replica.name)
+        replica.healthy = True
+        replica.lag = lag
+
+    def __on_error(self, replica: Replica) -> Callable[[ExceptionContext], None]:
+        def mark_down(context: ExceptionContext) -> None:
+            if context.is_disconnect and replica.healthy:
+                replica.healthy = False
+                self.__logger.error('Database replica disconnected', pool=replica.name)
+
+        return mark_down
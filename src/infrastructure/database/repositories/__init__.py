@@ -0,0 +1 @@
+from src.infrastructure.database.repositories.repository import Repository
@@ -0,0 +1,216 @@
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
+from itertools import chain, islice
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypeVar
+from sqlalchemy import Dialect, Select, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.application.abstractions.i_repository import IRepository
+from src.infrastructure.database.models.base import Base
+
+if TYPE_CHECKING:
+    from sqlalchemy import Column, Table
+
+
+ModelT = TypeVar('ModelT', bound=Base)
+
+
+def _chunked(rows: Iterable[Mapping[str, Any]], size: int) -> Iterator[list[Mapping[str, Any]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Repository(IRepository[ModelT]):
+    """
+    Generic repository for a model built on Base.
+
+    `insert_many` uses COPY (asyncpg `copy_records_to_table`) on PostgreSQL,
+    `upsert_many` sends `INSERT ... ON CONFLICT` in chunks of `chunk_size`
+    rows, `page` paginates by key instead of OFFSET and `stream` reads
+    through a server-side cursor. Rows are consumed lazily, so generators of
+    any size can be passed.
+    """
+
+    def __init__(self, session: AsyncSession, model: type[ModelT], *, chunk_size: int = 1000) -> None:
+        self.session = session
+        self.model = model
+        self.chunk_size = chunk_size
+        self.table: Table = model.__table__  # type: ignore[assignment]
+        self.key: Column[Any] = next(iter(self.table.primary_key.columns))
+
+    async def get(self, identity: Any) -> ModelT | None:
+        return await self.session.get(self.model, identity)
+
+    async def add(self, entity: ModelT) -> ModelT:
+        self.session.add(entity)
+        await self.session.flush()
+        return entity
+
+    async def insert_many(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Insert rows in bulk without creating ORM objects.
+
+        Columns missing from the first row get their Python-side defaults;
+        server defaults are applied by the database. Values go through the bind
+        processors of the column types, as they would in an INSERT. The COPY
+        joins the session transaction, so it is rolled back with it.
+        """
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return 0
+        rows = chain([first], iterator)
+
+        # The INSERT clause routes read-only sessions to the primary
+        connection = await self.session.connection(bind_arguments={'clause': insert(self.table)})
+        columns = list(first)
+        defaults = self.__python_defaults(columns)
+        if connection.dialect.driver != 'asyncpg' or defaults is None:
+            return await self.__insert_chunks(rows)
+
+        driver_connection: Any = (await connection.get_raw_connection()).driver_connection
+        if not driver_connection.is_in_transaction():
+            # The asyncpg adapter sends BEGIN before its first statement, which COPY bypasses:
+            # run one through the session so the COPY does not end up in autocommit
+            await connection.execute(text('SELECT 1'))
+
+        processors = self.__bind_processors([*columns, *defaults], connection.dialect)
+        status = await driver_connection.copy_records_to_table(
+            self.table.name,
+            records=(self.__record(row, columns, defaults, processors) for row in rows),
+            columns=[*columns, *defaults],
+            schema_name=self.table.schema,
+        )
+        return int(status.split()[-1])
+
+    async def upsert_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        conflict_columns: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Insert rows, updating existing ones on a conflict of `conflict_columns`.
+
+        The conflict columns default to the primary key and the updated columns
+        to every other column of the row; with nothing to update, conflicting
+        rows are skipped.
+        """
+        conflict_columns = list(conflict_columns or [column.name for column in self.table.primary_key.columns])
+        connection = await self.session.connection(bind_arguments={'clause': insert(self.table)})
+        count = 0
+
+        for chunk in _chunked(rows, chunk_size or self.chunk_size):
+            statement = self.__insert_statement(connection.dialect.name)
+            columns = update_columns or [column for column in chunk[0] if column not in conflict_columns]
+            if columns:
+                statement = statement.on_conflict_do_update(
+                    index_elements=conflict_columns,
+                    set_={column: statement.excluded[column] for column in columns},
+                )
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=conflict_columns)
+            await self.session.execute(statement, chunk)
+            count += len(chunk)
+
+        return count
+
+    async def page(
+        self,
+        *,
+        after: Any = None,
+        limit: int = 100,
+        descending: bool = False,
+        statement: Select[tuple[ModelT]] | None = None,
+    ) -> list[ModelT]:
+        """
+        Keyset pagination by primary key.
+
+        Pass the key of the last entity of the previous page as `after`; unlike
+        OFFSET the cost does not grow with the page number. `statement` can add
+        filters to the default `select(model)`.
+        """
+        statement = statement if statement is not None else select(self.model)
+        if after is not None:
+            statement = statement.where(self.key < after if descending else self.key > after)
+        statement = statement.order_by(self.key.desc() if descending else self.key).limit(limit)
+        return list((await self.session.scalars(statement)).all())
+
+    async def stream(
+        self,
+        *,
+        batch_size: int = 1000,
+        statement: Select[tuple[ModelT]] | None = None,
+    ) -> AsyncIterator[ModelT]:
+        """
+        Iterate over entities through a server-side cursor.
+
+        Rows are fetched `batch_size` at a time, so memory use does not depend
+        on the size of the result.
+        """
+        statement = statement if statement is not None else select(self.model)
+        result = await self.session.stream_scalars(statement.execution_options(yield_per=batch_size))
+        async for entity in result:
+            yield entity
+
+    async def __insert_chunks(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        count = 0
+        for chunk in _chunked(rows, self.chunk_size):
+            await self.session.execute(insert(self.table), chunk)
+            count += len(chunk)
+        return count
+
+    def __insert_statement(self, dialect: str) -> postgresql.Insert | sqlite.Insert:
+        if dialect == 'sqlite':
+            return sqlite.insert(self.table)
+        return postgresql.insert(self.table)
+
+    def __python_defaults(self, columns: Sequence[str]) -> dict[str, Callable[[Any], Any]] | None:
+        """
+        Python-side defaults of the columns not given, as COPY does not apply them;
+        None when one of them is a sequence or SQL expression COPY cannot evaluate
+        """
+        defaults: dict[str, Callable[[Any], Any]] = {}
+        for column in self.table.columns:
+            default = column.default
+            if column.name in columns or default is None:
+                continue
+            if default.is_scalar:
+                defaults[column.name] = lambda _context, value=default.arg: value  # type: ignore[attr-defined,misc]
+            elif default.is_callable:
+                # SQLAlchemy wraps callables to take the execution context
+                defaults[column.name] = default.arg  # type: ignore[attr-defined]
+            else:
+                return None
+        return defaults
+
+    def __bind_processors(self, columns: Iterable[str], dialect: Dialect) -> dict[str, Callable[[Any], Any]]:
+        """Bind processors of the column types (enums, JSON, type decorators...), which COPY does not run"""
+        processors: dict[str, Callable[[Any], Any]] = {}
+        for name in columns:
+            processor = self.table.columns[name].type.dialect_impl(dialect).bind_processor(dialect)
+            if processor is not None:
+                processors[name] = processor
+        return processors
+
+    @staticmethod
+    def __record(
+        row: Mapping[str, Any],
+        columns: Sequence[str],
+        defaults: Mapping[str, Callable[[Any], Any]],
+        processors: Mapping[str, Callable[[Any], Any]],
+    ) -> tuple[Any, ...]:
+        parameters = {column: row.get(column) for column in columns}
+        # Stand-in for the execution context context-sensitive defaults read the row from
+        context = SimpleNamespace(
+            current_parameters=parameters,
+            get_current_parameters=lambda isolate_multiinsert_groups=True: parameters,  # noqa: ARG005
+        )
+        for name, default in defaults.items():
+            parameters[name] = default(context)
+        for name, processor in processors.items():
+            parameters[name] = processor(parameters[name])
+        return tuple(parameters.values())
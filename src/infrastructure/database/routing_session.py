@@ -0,0 +1,43 @@
+from typing import Any
+from sqlalchemy import ClauseElement, Connection, Engine, Select
+from sqlalchemy.orm import Mapper, Session
+from src.infrastructure.database.replica import Replica
+from src.infrastructure.database.replica_router import ReplicaRouter, pin_primary, primary_pinned
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the reads of read-only sessions to a replica.
+
+    A read-only session sticks to the replica picked for its first read. Any
+    statement other than a plain SELECT (flush, INSERT/UPDATE/DELETE, SELECT
+    ... FOR UPDATE, raw text(), which may write) goes to the primary and pins
+    the rest of the request to it, so later reads see it.
+    """
+
+    def __init__(self, *args: Any, router: ReplicaRouter | None = None, read_only: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self.read_only = read_only
+        self.__replica: Replica | None = None
+
+    def get_bind(
+        self,
+        mapper: Mapper[Any] | type[Any] | None = None,
+        clause: ClauseElement | None = None,
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        if self._flushing or self.__is_write(clause):
+            pin_primary()
+        elif self.read_only and self.router is not None and not primary_pinned.get():
+            replica = self.__replica if self.__replica in self.router.available() else self.router.choose()
+            if replica is not None:
+                self.__replica = replica
+                return replica.engine.sync_engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    @staticmethod
+    def __is_write(clause: ClauseElement | None) -> bool:
+        if clause is None:
+            return False
+        return not isinstance(clause, Select) or clause._for_update_arg is not None  # noqa: SLF001 - no public accessor
@@ -0,0 +1,59 @@
+from collections.abc import AsyncIterator
+from types import TracebackType
+from typing import Self
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.abstractions.i_unit_of_work import IUnitOfWork
+from src.infrastructure.database.context import async_session_maker, read_session_maker
+
+
+class UnitOfWork(IUnitOfWork):
+    """
+    SQLAlchemy unit of work.
+
+    The session checks out a connection lazily on the first query and gives it
+    back on commit/rollback, so a unit of work that only touches the database
+    briefly does not pin a pooled connection for the whole request.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = async_session_maker) -> None:
+        self.__session_factory = session_factory
+        self.__session: AsyncSession | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self.__session is None:
+            msg = 'Unit of work is not started, use it as an async context manager'
+            raise RuntimeError(msg)
+        return self.__session
+
+    async def __aenter__(self) -> Self:
+        self.__session = self.__session_factory()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        session, self.__session = self.__session, None
+        if session is not None:
+            # close() rolls back anything not committed and releases the connection
+            await session.close()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+
+async def get_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    async with UnitOfWork() as unit_of_work:
+        yield unit_of_work
+
+
+async def get_read_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Unit of work whose reads go to a replica until it writes"""
+    async with UnitOfWork(read_session_maker) as unit_of_work:
+        yield unit_of_work
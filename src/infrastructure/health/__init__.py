@@ -0,0 +1,8 @@
+from src.infrastructure.health.health_check_error import HealthCheckError
+from src.infrastructure.health.health_monitor import HealthMonitor, Probe
+from src.infrastructure.health.loop_lag_probe import loop_lag_probe
+from src.infrastructure.logger import logger
+from src.settings import settings
+
+
+health_monitor = HealthMonitor(logger, interval=settings.HEALTH_CHECK_INTERVAL, timeout=settings.HEALTH_CHECK_TIMEOUT)
@@ -0,0 +1,2 @@
+class HealthCheckError(Exception):
+    """Raised by a health probe when its dependency is reachable but not fit to serve."""
@@ -0,0 +1,123 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+from src.application.domain.enums.status_code import StatusCode
+from src.infrastructure.logger import Logger
+from src.infrastructure.utils.serialization import json_dumps
+
+
+Probe = Callable[[], Awaitable[Any]]
+
+# Overall status -> HTTP status of the readiness response
+STATUS_CODES = {
+    'ok': int(StatusCode.OK.value),
+    'degraded': int(StatusCode.OK.value),
+    'starting': int(StatusCode.SERVICE_UNAVAILABLE.value),
+    'down': int(StatusCode.SERVICE_UNAVAILABLE.value),
+    'stale': int(StatusCode.SERVICE_UNAVAILABLE.value),
+}
+
+
+class HealthMonitor:
+    """
+    Checks dependencies in the background and serves the last result.
+
+    Every `interval` seconds the registered probes run concurrently, each
+    bounded by `timeout`. A probe returns optional details (e.g. the pool
+    status) or raises when its dependency is down. The result of a round,
+    with the latency and time of every check, is encoded once, so liveness
+    and readiness requests never touch a dependency however often they come.
+
+    The service is `down` when a critical dependency is, `degraded` when only
+    non-critical ones are, and `stale` when no round finished for
+    `stale_after` seconds (the checker itself is stuck); the age of the last
+    round is added to every response.
+    """
+
+    __live = json_dumps({'status': 'ok'})
+    __stale = json_dumps({'status': 'stale'})
+
+    def __init__(self, logger: Logger, *, interval: float = 5.0, timeout: float = 2.0, stale_after: float | None = None) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = 3 * interval if stale_after is None else stale_after
+        self.__logger = logger
+        self.__probes: dict[str, tuple[Probe, bool]] = {}
+        self.__failing: set[str] = set()
+        self.__status = 'starting'
+        self.__prefix = json_dumps({'checks': {}})[:-1] + b',"status":'
+        self.__checked_at = time.monotonic()
+        self.__statuses = {status: json_dumps(status) for status in STATUS_CODES}
+        self.__task: asyncio.Task[None] | None = None
+
+    def register(self, name: str, probe: Probe, *, critical: bool = True) -> None:
+        """Check `probe` in every round; a non-critical dependency being down only degrades the service"""
+        self.__probes[name] = (probe, critical)
+
+    async def start(self) -> None:
+        await self.check()
+        self.__task = asyncio.create_task(self.__check_periodically(), name='health-check')
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+
+    async def check(self) -> None:
+        results = await asyncio.gather(*(self.__check(name, probe) for name, (probe, _) in self.__probes.items()))
+        checks = dict(zip(self.__probes, results, strict=True))
+        down = [name for name, result in checks.items() if result['status'] == 'down']
+        if any(self.__probes[name][1] for name in down):
+            self.__status = 'down'
+        else:
+            self.__status = 'degraded' if down else 'ok'
+        self.__prefix = json_dumps({'checks': checks})[:-1] + b',"status":'
+        self.__checked_at = time.monotonic()
+
+    def liveness(self) -> tuple[int, bytes]:
+        """The process serves requests and the checker is not stuck"""
+        if time.monotonic() - self.__checked_at > self.stale_after:
+            return int(StatusCode.SERVICE_UNAVAILABLE.value), self.__stale
+        return int(StatusCode.OK.value), self.__live
+
+    def readiness(self) -> tuple[int, bytes]:
+        """Result of the last round with its age in seconds"""
+        age = time.monotonic() - self.__checked_at
+        status = 'stale' if age > self.stale_after else self.__status
+        body = self.__prefix + self.__statuses[status] + b',"age":' + f'{age:.3f}'.encode() + b'}'
+        return STATUS_CODES[status], body
+
+    async def __check_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    async def __check(self, name: str, probe: Probe) -> dict[str, Any]:
+        checked_at = datetime.now(UTC).isoformat(timespec='milliseconds')
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.timeout):
+                details = await probe()
+        except Exception as e:  # noqa: BLE001
+            # The response is public: only the exception type goes in it, the message
+            # (hosts, users, driver details...) only in the log
+            error = f'no response in {self.timeout} s' if isinstance(e, TimeoutError) else type(e).__name__
+            if name not in self.__failing:
+                self.__failing.add(name)
+                self.__logger.warning('Health check failed', dependency=name, error=error, detail=str(e))
+            result: dict[str, Any] = {'status': 'down', 'error': error}
+        else:
+            if name in self.__failing:
+                self.__failing.discard(name)
+                self.__logger.info('Health check recovered', dependency=name)
+            result = {'status': 'up'}
+            if details is not None:
+                result['details'] = details
+        result['latency_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        result['checked_at'] = checked_at
+        return result
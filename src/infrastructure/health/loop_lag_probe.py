@@ -0,0 +1,16 @@
+from src.infrastructure.health.health_check_error import HealthCheckError
+from src.infrastructure.health.health_monitor import Probe
+from src.infrastructure.utils.loop_monitor import LoopMonitor
+
+
+def loop_lag_probe(monitor: LoopMonitor, max_lag: float) -> Probe:
+    """Probe failing while the p99 event loop lag of the recent window is above `max_lag` seconds"""
+    async def probe() -> dict[str, float]:
+        snapshot = monitor.snapshot()
+        lag = snapshot['lag_p99']
+        if lag > max_lag:
+            message = f'event loop lag p99 {lag * 1000:.0f} ms is above {max_lag * 1000:.0f} ms'
+            raise HealthCheckError(message)
+        return snapshot
+
+    return probe
@@ -1,6 +1,9 @@
 from src.infrastructure.logger.log_format import LogFormat
 from src.infrastructure.logger.log_levels import LogLevel
 from src.infrastructure.logger.logger import Logger
+from src.infrastructure.logger.lazy import Lazy, lazy
+from src.infrastructure.logger.log_sink import LogSink, QueueSink, StreamSink
+from src.infrastructure.logger.overflow_policy import OverflowPolicy
 from src.settings import settings
 
 
@@ -18,7 +21,29 @@ log_formats = {
     'TEXT': LogFormat.TEXT,
 }
 
-logger = Logger(min_level=log_levels.get(settings.LOG_LEVEL, LogLevel.INFO), log_format=log_formats.get(settings.LOG_FORMAT, LogFormat.JSON))
+overflow_policies = {
+    'BLOCK': OverflowPolicy.BLOCK,
+    'DROP_LOW': OverflowPolicy.DROP_LOW,
+    'DROP': OverflowPolicy.DROP,
+}
+
+if settings.LOG_ASYNC:
+    log_sink: LogSink = QueueSink(
+        capacity=settings.LOG_BUFFER_SIZE,
+        batch_size=settings.LOG_BATCH_SIZE,
+        overflow_policy=overflow_policies.get(settings.LOG_OVERFLOW_POLICY, OverflowPolicy.BLOCK),
+    )
+else:
+    log_sink = StreamSink()
+
+logger = Logger(
+    min_level=log_levels.get(settings.LOG_LEVEL, LogLevel.INFO),
+    log_format=log_formats.get(settings.LOG_FORMAT, LogFormat.JSON),
+    sink=log_sink,
+    capture_location=(
+        settings.LOG_CAPTURE_LOCATION if settings.LOG_CAPTURE_LOCATION is not None else settings.LOG_LEVEL == 'DEBUG'
+    ),
+)
 
 
 async def get_logger() -> Logger:
@@ -0,0 +1,22 @@
+from typing import Any, Callable
+
+
+class Lazy:
+    """
+    Deferred log field value.
+
+    The wrapped callable is only invoked when the log line is actually emitted,
+    so expensive values cost nothing when the level is disabled.
+    """
+    __slots__ = ('_func',)
+
+    def __init__(self, func: Callable[[], Any]) -> None:
+        self._func = func
+
+    def resolve(self) -> Any:
+        return self._func()
+
+
+def lazy(func: Callable[[], Any]) -> Lazy:
+    """Wrap a zero-argument callable as a deferred log field value"""
+    return Lazy(func)
@@ -0,0 +1,78 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+from src.infrastructure.logger.log_format import LogFormat
+from src.infrastructure.logger.log_record import LogRecord
+from src.infrastructure.utils.serialization import json_dumps
+
+
+class LogFormatter(ABC):
+    """
+    Renders a LogRecord into a single output line.
+
+    The second-resolution part of the timestamp is rendered once per second and
+    cached, only the microseconds are formatted for every record.
+    """
+
+    def __init__(self) -> None:
+        self.__cached_second: tuple[int, str] = (-1, '')
+
+    def format_timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, prefix = self.__cached_second
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+            self.__cached_second = (second, prefix)
+        return f'{prefix}.{int((created - second) * 1_000_000):06d}'
+
+    @abstractmethod
+    def format(self, record: LogRecord) -> str:
+        raise NotImplementedError
+
+
+class TextFormatter(LogFormatter):
+    """`timestamp - LEVEL - trace_id - file:line - message key=value`"""
+
+    def format(self, record: LogRecord) -> str:
+        location = f'{record.file}:{record.line} - ' if record.file is not None else ''
+        line = (
+            f'{self.format_timestamp(record.created)} - {record.level.name} - '
+            f'{record.trace_id} - {location}{record.message}'
+        )
+        if record.fields:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in record.fields.items())
+        if record.exception is not None:
+            line += f'\nTraceback:\n{record.exception}'
+        return line
+
+
+class JsonFormatter(LogFormatter):
+    """One JSON object per line, structured fields are merged into the top level."""
+
+    reserved_keys = frozenset({'timestamp', 'level', 'file', 'line', 'trace_id', 'message', 'exception'})
+
+    def format(self, record: LogRecord) -> str:
+        data: dict[str, Any] = {
+            'timestamp': self.format_timestamp(record.created),
+            'level': record.level.name,
+        }
+        if record.file is not None:
+            data['file'] = record.file
+            data['line'] = record.line
+        data['trace_id'] = record.trace_id
+        data['message'] = record.message
+
+        if record.fields:
+            for key, value in record.fields.items():
+                data[f'field_{key}' if key in self.reserved_keys else key] = value
+
+        if record.exception is not None:
+            data['exception'] = record.exception
+
+        return json_dumps(data).decode()
+
+
+def create_formatter(log_format: LogFormat) -> LogFormatter:
+    if log_format == LogFormat.JSON:
+        return JsonFormatter()
+    return TextFormatter()
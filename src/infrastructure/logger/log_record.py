@@ -0,0 +1,27 @@
+from typing import Any
+from src.infrastructure.logger.log_levels import LogLevel
+
+
+class LogRecord:
+    """Single log event handed from the Logger to a LogFormatter."""
+    __slots__ = ('created', 'level', 'trace_id', 'message', 'fields', 'file', 'line', 'exception')
+
+    def __init__(
+        self,
+        created: float,
+        level: LogLevel,
+        trace_id: str,
+        message: str,
+        fields: dict[str, Any] | None = None,
+        file: str | None = None,
+        line: int = 0,
+        exception: str | None = None,
+    ) -> None:
+        self.created = created
+        self.level = level
+        self.trace_id = trace_id
+        self.message = message
+        self.fields = fields
+        self.file = file
+        self.line = line
+        self.exception = exception
@@ -0,0 +1,165 @@
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TextIO
+from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.overflow_policy import OverflowPolicy
+
+
+class LogSink(ABC):
+    """Destination for formatted log lines."""
+
+    @abstractmethod
+    def write(self, line: str, level: LogLevel) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Write out any buffered lines."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush and release the sink."""
+        self.flush()
+
+
+class StreamSink(LogSink):
+    """Writes every line synchronously to the stream (stdout by default)."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.__stream = stream
+
+    def write(self, line: str, level: LogLevel) -> None:  # noqa: ARG002
+        (self.__stream or sys.stdout).write(line + '\n')
+
+    def flush(self) -> None:
+        (self.__stream or sys.stdout).flush()
+
+
+class QueueSink(LogSink):
+    """
+    Non-blocking sink backed by a bounded buffer and a background writer thread.
+
+    Callers only append the line to the buffer; the writer thread drains it and
+    emits up to `batch_size` lines with a single write call. When the buffer is
+    full the configured OverflowPolicy decides whether the caller waits for free
+    space (BLOCK), DEBUG/INFO lines are discarded (DROP_LOW) or any line is
+    discarded (DROP). Every discarded line is counted in `dropped`.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        capacity: int = 10_000,
+        batch_size: int = 512,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        flush_interval: float = 0.5,
+    ) -> None:
+        if capacity < 1:
+            msg = 'Capacity must be positive'
+            raise ValueError(msg)
+
+        self.__stream = stream
+        self.__capacity = capacity
+        self.__batch_size = max(batch_size, 1)
+        self.__overflow_policy = overflow_policy
+        self.__flush_interval = flush_interval
+        self.__buffer: deque[str] = deque()
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+        self.__drained = threading.Condition(self.__lock)
+        self.__in_flight = 0
+        self.__closed = False
+        self.dropped = 0
+        self.written = 0
+        self.__thread = threading.Thread(target=self.__run, name='log-sink-writer', daemon=True)
+        self.__thread.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__buffer)
+
+    def write(self, line: str, level: LogLevel) -> None:
+        with self.__lock:
+            closed = self.__closed
+            if not closed:
+                closed = not self.__enqueue(line, level)
+
+        if closed:
+            # The writer thread is gone: fall back to a synchronous write so late
+            # log lines (after shutdown) are not lost.
+            self.__emit([line])
+
+    def __enqueue(self, line: str, level: LogLevel) -> bool:
+        """Append the line to the buffer; returns False if the sink was closed meanwhile."""
+        if len(self.__buffer) >= self.__capacity:
+            if self.__overflow_policy == OverflowPolicy.DROP or (
+                self.__overflow_policy == OverflowPolicy.DROP_LOW and level <= LogLevel.INFO
+            ):
+                self.dropped += 1
+                return True
+
+            while len(self.__buffer) >= self.__capacity and not self.__closed:
+                self.__not_full.wait()
+
+            if self.__closed:
+                return False
+
+        self.__buffer.append(line)
+        self.__not_empty.notify()
+        return True
+
+    def flush(self) -> None:
+        """Block until every line buffered so far has been written."""
+        with self.__lock:
+            self.__not_empty.notify()
+            while (self.__buffer or self.__in_flight) and self.__thread.is_alive():
+                self.__drained.wait(self.__flush_interval)
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__not_empty.notify()
+            self.__not_full.notify_all()
+        self.__thread.join()
+
+    def __run(self) -> None:
+        while True:
+            with self.__lock:
+                while not self.__buffer and not self.__closed:
+                    self.__not_empty.wait(self.__flush_interval)
+
+                if not self.__buffer and self.__closed:
+                    self.__drained.notify_all()
+                    return
+
+                count = min(len(self.__buffer), self.__batch_size)
+                batch = [self.__buffer.popleft() for _ in range(count)]
+                self.__in_flight = count
+                self.__not_full.notify_all()
+
+            written = self.__emit(batch)
+
+            with self.__lock:
+                self.__in_flight = 0
+                if written:
+                    self.written += count
+                else:
+                    self.dropped += count
+                if not self.__buffer:
+                    self.__drained.notify_all()
+
+    def __emit(self, batch: list[str]) -> bool:
+        stream = self.__stream or sys.stdout
+        try:
+            stream.write('\n'.join(batch) + '\n')
+            stream.flush()
+        except (OSError, ValueError):
+            # The stream is gone (closed pipe, interpreter shutdown); losing the
+            # batch is preferable to killing the writer thread.
+            return False
+        return True
@@ -1,13 +1,15 @@
-import traceback
-import inspect
 import sys
-import json
-from datetime import datetime
+import time
+import traceback
 from typing import Callable, Optional, Dict, Any
 from uuid import uuid4
 from contextvars import ContextVar
 from src.infrastructure.logger import LogFormat
+from src.infrastructure.logger.lazy import Lazy
+from src.infrastructure.logger.log_formatter import LogFormatter, create_formatter
 from src.infrastructure.logger.log_levels import LogLevel
+from src.infrastructure.logger.log_record import LogRecord
+from src.infrastructure.logger.log_sink import LogSink, StreamSink
 
 
 trace_id_var: ContextVar[str] = ContextVar('trace_id', default='N/A')
@@ -17,7 +19,7 @@ class Logger:
 
     """
     Synchronous custom logger with ContextVar support for trace_id.
-    Supports JSON and text logging formats.
+    Supports JSON and text logging formats and structured fields.
     Singleton pattern.
     """
 
@@ -34,10 +36,17 @@ class Logger:
         log_format: LogFormat = __default_format,
         min_level: LogLevel = LogLevel.INFO,
         id_generator: Optional[Callable[[], str]] = lambda: str(uuid4()),
+        sink: Optional[LogSink] = None,
+        *,
+        capture_location: bool = True,
     ):
         self.log_format = log_format
         self.min_level = min_level
         self.id_generator = id_generator
+        self.sink = sink if sink is not None else StreamSink()
+        self.capture_location = capture_location
+        self._formatter: LogFormatter = create_formatter(log_format)
+        self._min_value: int = min_level.value
 
     def set_format(self, log_format: LogFormat) -> None:
         """Set log format using LogFormat enum"""
@@ -45,9 +54,24 @@ class Logger:
             raise ValueError('Log format must be an instance of LogFormat enum')
 
         self.log_format = log_format
+        self._formatter = create_formatter(log_format)
 
     def set_min_level(self, level: LogLevel) -> None:
         self.min_level = level
+        self._min_value = level.value
+
+    def set_sink(self, sink: LogSink) -> None:
+        """Replace the sink, flushing everything buffered in the previous one"""
+        previous, self.sink = self.sink, sink
+        previous.close()
+
+    def flush(self) -> None:
+        """Block until all buffered log lines are written"""
+        self.sink.flush()
+
+    def close(self) -> None:
+        """Flush buffered log lines and stop the sink"""
+        self.sink.close()
 
     def new_trace_id(self) -> str:
         """Create and set new trace_id in context"""
@@ -69,68 +93,71 @@ class Logger:
         """Clear the trace_id in the context"""
         trace_id_var.set('N/A')
 
-    def _prepare_log_data(self, level: LogLevel, message: str) -> dict[str, Any]:
-        current_frame = inspect.currentframe()
-        if (current_frame and
-            current_frame.f_back and
-            current_frame.f_back.f_back and
-            current_frame.f_back.f_back.f_back):
-            frame = current_frame.f_back.f_back.f_back
-            filename = frame.f_code.co_filename
-            line_number = frame.f_lineno
-        else:
-            filename = "unknown"
-            line_number = 0
-
-        log_data = {
-            'timestamp': datetime.now().isoformat(),
-            'level': level.name,
-            'file': filename,
-            'line': line_number,
-            'trace_id': trace_id_var.get(),
-            'message': message,
-        }
-
-        if level == LogLevel.EXCEPTION:
-            log_data['exception'] = traceback.format_exc()
-
-        return log_data
-
-    def _log(self, level: LogLevel, message: str) -> None:
-        if level >= self.min_level:
-            log_data = self._prepare_log_data(level, message)
-
-            if self.log_format == LogFormat.JSON:
-                log_message = json.dumps(log_data, ensure_ascii=False)
-            else:
-                # Default text format
-                log_message = (
-                    f"{log_data['timestamp']} - {log_data['level']} - "
-                    f"{log_data['trace_id']} - {log_data['file']}:{log_data['line']} - "
-                    f"{log_data['message']}"
-                )
-                if 'exception' in log_data:
-                    log_message += f"\nTraceback:\n{log_data['exception']}"
-
-            self._write(log_message)
-
-    def _write(self, message: str) -> None:
-        sys.stdout.write(message + "\n")
-
-    def debug(self, message: str) -> None:
-        self._log(LogLevel.DEBUG, message)
-
-    def info(self, message: str) -> None:
-        self._log(LogLevel.INFO, message)
-
-    def warning(self, message: str) -> None:
-        self._log(LogLevel.WARNING, message)
-
-    def error(self, message: str) -> None:
-        self._log(LogLevel.ERROR, message)
-
-    def critical(self, message: str) -> None:
-        self._log(LogLevel.CRITICAL, message)
-
-    def exception(self, message: str) -> None:
-        self._log(LogLevel.EXCEPTION, message)
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a record of the given level would be emitted"""
+        return level.value >= self._min_value
+
+    def _capture_location(self) -> tuple[Optional[str], int]:
+        if not self.capture_location:
+            return None, 0
+        try:
+            # 0 - _capture_location, 1 - _log, 2 - public level method, 3 - caller
+            frame = sys._getframe(3)  # noqa: SLF001
+        except ValueError:
+            return 'unknown', 0
+        return frame.f_code.co_filename, frame.f_lineno
+
+    def _log(self, level: LogLevel, message: str, args: tuple[Any, ...], fields: dict[str, Any]) -> None:
+        if level.value < self._min_value:
+            return
+
+        if args:
+            message = message % tuple(arg.resolve() if isinstance(arg, Lazy) else arg for arg in args)
+        if fields:
+            for key, value in fields.items():
+                if isinstance(value, Lazy):
+                    fields[key] = value.resolve()
+
+        file, line = self._capture_location()
+        record = LogRecord(
+            created=time.time(),
+            level=level,
+            trace_id=trace_id_var.get(),
+            message=message,
+            fields=fields,
+            file=file,
+            line=line,
+            exception=traceback.format_exc() if level == LogLevel.EXCEPTION else None,
+        )
+        self._write(self._formatter.format(record), level)
+
+    def _write(self, message: str, level: LogLevel) -> None:
+        self.sink.write(message, level)
+
+    def log(self, level: LogLevel, message: str, *args: Any, **fields: Any) -> None:
+        """
+        Log a message with an explicit level.
+
+        `args` are %-interpolated into the message and `fields` are attached as
+        structured data, both only when the level is enabled. Wrap expensive
+        values with `lazy()` to defer computing them as well.
+        """
+        self._log(level, message, args, fields)
+
+    def debug(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.DEBUG, message, args, fields)
+
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.INFO, message, args, fields)
+
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.WARNING, message, args, fields)
+
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.ERROR, message, args, fields)
+
+    def critical(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.CRITICAL, message, args, fields)
+
+    def exception(self, message: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.EXCEPTION, message, args, fields)
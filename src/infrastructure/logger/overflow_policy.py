@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """Enum for queue sink behaviour when the buffer is full"""
+    BLOCK = 'block'
+    DROP_LOW = 'drop_low'
+    DROP = 'drop'
@@ -0,0 +1,55 @@
+from typing import TYPE_CHECKING
+from src.application.contracts.i_email_service import IEmailService
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.infrastructure.mail.email_queue import EmailQueue
+from src.infrastructure.mail.memory_email_queue import MemoryEmailQueue
+from src.infrastructure.logger import logger
+from src.settings import settings
+
+if TYPE_CHECKING:
+    from src.infrastructure.mail.email_service import EmailService
+
+
+def create_email_queue() -> EmailQueue:
+    if settings.EMAIL_QUEUE_BACKEND == 'redis':
+        from src.infrastructure.mail.redis_email_queue import RedisEmailQueue  # noqa: PLC0415 - redis is optional
+        return RedisEmailQueue.from_url(settings.REDIS_URL, key=settings.EMAIL_QUEUE_KEY)
+    return MemoryEmailQueue(settings.EMAIL_QUEUE_LIMIT)
+
+
+def create_email_service() -> 'EmailService | None':
+    """Email service of the SMTP settings, None when SMTP_HOST is not set"""
+    if settings.SMTP_HOST is None:
+        return None
+    from src.infrastructure.mail.email_service import EmailService  # noqa: PLC0415 - aiosmtplib is optional
+    from src.infrastructure.mail.smtp_pool import SMTPPool  # noqa: PLC0415 - aiosmtplib is optional
+
+    pool = SMTPPool(
+        settings.SMTP_HOST,
+        settings.SMTP_PORT,
+        username=settings.SMTP_USERNAME,
+        password=settings.SMTP_PASSWORD,
+        tls=settings.SMTP_TLS,
+        size=settings.EMAIL_POOL_SIZE,
+        timeout=settings.SMTP_TIMEOUT,
+    )
+    return EmailService(
+        create_email_queue(),
+        pool,
+        logger,
+        sender=settings.EMAIL_FROM or settings.SMTP_USERNAME or f'noreply@{settings.SMTP_HOST}',
+        batch_size=settings.EMAIL_BATCH_SIZE,
+        retries=settings.EMAIL_RETRIES,
+        retry_delay=settings.EMAIL_RETRY_DELAY,
+        drain_timeout=settings.EMAIL_DRAIN_TIMEOUT,
+    )
+
+
+email_service = create_email_service()
+
+
+async def get_email_service() -> IEmailService:
+    if email_service is None:
+        message = 'Email is not configured'
+        raise ServiceUnavailableError(message)
+    return email_service
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+
+class EmailQueue(ABC):
+    """
+    Encoded messages waiting to be sent.
+
+    A `persistent` queue keeps its messages when the process stops, so the
+    service does not have to drain it on shutdown.
+    """
+
+    persistent = False
+
+    @abstractmethod
+    async def put(self, message: bytes) -> None:
+        """Raises ServiceUnavailableError when the queue is full or unreachable"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_batch(self, size: int, wait: float) -> list[bytes]:
+        """Up to `size` messages, waiting at most `wait` seconds for the first one"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def requeue(self, messages: Sequence[bytes]) -> None:
+        """Put messages taken with get_batch back at the front of the queue"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def size(self) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,164 @@
+import asyncio
+import contextlib
+from collections.abc import Sequence
+from email import policy
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from src.application.contracts.i_email_service import IEmailService
+from src.infrastructure.logger import Logger
+from src.infrastructure.mail.email_queue import EmailQueue
+from src.infrastructure.mail.smtp_pool import SMTPPool, is_permanent
+from src.infrastructure.metrics import MetricFamily, counter_family
+from src.infrastructure.utils.jitter import Jitter
+from src.infrastructure.utils.retry import backoff_delay
+from src.infrastructure.utils.serialization import json_dumps, json_loads
+
+
+class EmailService(IEmailService):
+    """
+    Sends mail in the background so requests never wait for SMTP.
+
+    send() builds the MIME document on a worker thread (the email package
+    needs about 2 ms per message), so an invalid message (a header with a
+    line break) fails in the caller, and queues it. A dispatcher task started
+    from the lifespan takes up to `batch_size` messages at a time and sends
+    them concurrently over the connection pool, whose size bounds the
+    concurrency. Transient failures (connection errors, 4xx replies) are
+    retried with jittered exponential backoff up to `retries` attempts;
+    permanent ones (5xx replies, refused recipients) and unreadable queue
+    entries are logged and dropped without stopping the dispatcher.
+
+    On stop the dispatcher drains the queue for up to `drain_timeout`
+    seconds, or only finishes the current batch when the queue is
+    persistent; unsent messages of an interrupted batch go back to the queue.
+    """
+
+    def __init__(
+        self,
+        queue: EmailQueue,
+        pool: SMTPPool,
+        logger: Logger,
+        *,
+        sender: str,
+        batch_size: int = 50,
+        retries: int = 5,
+        retry_delay: float = 1.0,
+        drain_timeout: float = 10.0,
+    ) -> None:
+        self.sender = sender
+        self.batch_size = batch_size
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.drain_timeout = drain_timeout
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.__queue = queue
+        self.__pool = pool
+        self.__logger = logger
+        self.__domain = sender.rpartition('@')[2] or None
+        self.__draining = False
+        self.__task: asyncio.Task[None] | None = None
+
+    async def send(self, to: str | Sequence[str], subject: str, body: str, *, html: str | None = None) -> None:
+        recipients = [to] if isinstance(to, str) else list(to)
+        message = await asyncio.to_thread(self.__build, recipients, subject, body, html)
+        await self.__queue.put(json_dumps({'to': recipients, 'message': message}))
+
+    async def start(self) -> None:
+        self.__draining = False
+        self.__task = asyncio.create_task(self.__dispatch(), name='email-dispatcher')
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__draining = True
+            try:
+                await asyncio.wait_for(asyncio.shield(self.__task), self.drain_timeout)
+            except TimeoutError:
+                self.__task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self.__task
+            self.__task = None
+        if not self.__queue.persistent and (left := await self.__queue.size()):
+            self.__logger.warning('Unsent emails dropped on shutdown', count=left)
+        await self.__pool.close()
+        await self.__queue.close()
+
+    def collect(self) -> list[MetricFamily]:
+        return [
+            counter_family('emails_sent_total', 'Emails accepted by the SMTP server.', [({}, self.sent)]),
+            counter_family('emails_failed_total', 'Emails dropped after a permanent error or the last retry.', [({}, self.failed)]),
+            counter_family('email_retries_total', 'Email delivery attempts retried after a transient error.', [({}, self.retried)]),
+        ]
+
+    async def __dispatch(self) -> None:
+        while True:
+            try:
+                batch = await self.__queue.get_batch(self.batch_size, 0 if self.__draining else 1.0)
+            except Exception as e:  # noqa: BLE001
+                self.__logger.warning('Email queue is unavailable', error=e)
+                await asyncio.sleep(self.retry_delay)
+                continue
+            if batch:
+                try:
+                    await self.__send_batch(batch)
+                except Exception as e:
+                    self.__logger.exception('Email batch failed', count=len(batch), error=e)
+            if self.__draining and (not batch or self.__queue.persistent):
+                return
+
+    async def __send_batch(self, batch: list[bytes]) -> None:
+        items, tasks = [], []
+        for item in batch:
+            try:
+                envelope = json_loads(item)
+                recipients, message = list(envelope['to']), str(envelope['message'])
+            except (ValueError, TypeError, KeyError) as e:
+                self.failed += 1
+                self.__logger.exception('Unreadable email dropped from the queue', error=e)
+                continue
+            items.append(item)
+            tasks.append(asyncio.create_task(self.__deliver(recipients, message)))
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # gather has already cancelled the deliveries still running when this is raised
+            unsent = [item for item, task in zip(items, tasks, strict=True) if task.cancelled() or not task.done()]
+            for task in tasks:
+                task.cancel()
+            await self.__queue.requeue(unsent)
+            raise
+
+    def __build(self, recipients: list[str], subject: str, body: str, html: str | None) -> str:
+        """Encoded document; raises ValueError for a header that would inject other headers"""
+        message = EmailMessage(policy=policy.SMTP)
+        message['From'] = self.sender
+        message['To'] = ', '.join(recipients)
+        message['Subject'] = subject
+        message['Date'] = formatdate(usegmt=True)
+        message['Message-ID'] = make_msgid(domain=self.__domain)
+        message.set_content(body)
+        if html is not None:
+            message.add_alternative(html, subtype='html')
+        return message.as_string()
+
+    async def __deliver(self, recipients: list[str], message: str) -> None:
+        previous_delay = self.retry_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self.__pool.acquire() as connection:
+                    await connection.sendmail(self.sender, recipients, message)
+            except Exception as e:  # noqa: BLE001
+                error = e
+            else:
+                self.sent += 1
+                return
+            if is_permanent(error) or attempt == self.retries:
+                break
+            self.retried += 1
+            previous_delay = backoff_delay(Jitter.FULL, attempt, self.retry_delay, 2.0, 30.0, previous_delay)
+            await asyncio.sleep(previous_delay)
+        self.failed += 1
+        self.__logger.error('Email delivery failed', to=recipients, attempts=attempt, error=error)
@@ -0,0 +1,42 @@
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Sequence
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.infrastructure.mail.email_queue import EmailQueue
+
+
+class MemoryEmailQueue(EmailQueue):
+    """Process-local queue of at most `max_size` messages; whatever is left when the process stops is lost"""
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self.__messages: deque[bytes] = deque()
+        self.__ready = asyncio.Event()
+
+    async def put(self, message: bytes) -> None:
+        if len(self.__messages) >= self.max_size:
+            error = 'Email queue is full, try again later'
+            raise ServiceUnavailableError(error)
+        self.__messages.append(message)
+        self.__ready.set()
+
+    async def get_batch(self, size: int, wait: float) -> list[bytes]:
+        if not self.__messages:
+            self.__ready.clear()
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(wait):
+                    await self.__ready.wait()
+        messages = self.__messages
+        return [messages.popleft() for _ in range(min(size, len(messages)))]
+
+    async def requeue(self, messages: Sequence[bytes]) -> None:
+        self.__messages.extendleft(reversed(messages))
+        if messages:
+            self.__ready.set()
+
+    async def size(self) -> int:
+        return len(self.__messages)
+
+    async def close(self) -> None:
+        self.__messages.clear()
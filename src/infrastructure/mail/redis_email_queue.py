@@ -0,0 +1,53 @@
+from collections.abc import Sequence
+from typing import cast
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.infrastructure.mail.email_queue import EmailQueue
+
+
+class RedisEmailQueue(EmailQueue):
+    """
+    Queue in a Redis list shared by all workers, kept across restarts.
+
+    Messages are popped in batches; a batch being sent when the process is
+    killed (not stopped) is lost, the rest of the queue is not.
+    """
+
+    persistent = True
+
+    def __init__(self, redis: Redis, key: str = 'email:queue') -> None:
+        self.__redis = redis
+        self.__key = key
+
+    @classmethod
+    def from_url(cls, url: str, key: str = 'email:queue') -> 'RedisEmailQueue':
+        return cls(Redis.from_url(url), key)
+
+    async def put(self, message: bytes) -> None:
+        try:
+            await self.__redis.rpush(self.__key, message)
+        except RedisError as e:
+            error = 'Email queue is unavailable, try again later'
+            raise ServiceUnavailableError(error) from e
+
+    async def get_batch(self, size: int, wait: float) -> list[bytes]:
+        messages = cast('list[bytes] | None', await self.__redis.lpop(self.__key, size))
+        if messages or wait <= 0:
+            return messages or []
+        # BLPOP has no count: wait for the first message, then take the rest of the batch
+        popped = await self.__redis.blpop([self.__key], timeout=wait)
+        if popped is None:
+            return []
+        rest = cast('list[bytes] | None', await self.__redis.lpop(self.__key, size - 1)) if size > 1 else None
+        return [popped[1], *(rest or ())]
+
+    async def requeue(self, messages: Sequence[bytes]) -> None:
+        if messages:
+            await self.__redis.lpush(self.__key, *reversed(messages))
+
+    async def size(self) -> int:
+        return int(await self.__redis.llen(self.__key))
+
+    async def close(self) -> None:
+        await self.__redis.aclose()
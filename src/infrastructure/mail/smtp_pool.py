@@ -0,0 +1,93 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator
+from aiosmtplib import SMTP, SMTPException, SMTPRecipientsRefused, SMTPResponseException
+
+
+def is_permanent(error: BaseException) -> bool:
+    """SMTP errors that another attempt will not fix: 5xx replies and refused recipients"""
+    if isinstance(error, SMTPResponseException):
+        return error.code >= 500
+    return isinstance(error, SMTPRecipientsRefused)
+
+
+class SMTPPool:
+    """
+    Authenticated SMTP connections reused across messages.
+
+    At most `size` connections are open and callers wait for a free one, so
+    `size` also bounds the messages sent at the same time. A connection is
+    opened (TLS handshake and login) on first need and kept; one that failed
+    is closed instead of being returned, one that was idle for more than
+    `max_idle` seconds (servers drop idle clients) is replaced.
+
+    `tls` means implicit TLS on port 465 and STARTTLS on any other port.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        username: str | None = None,
+        password: str | None = None,
+        tls: bool = True,
+        size: int = 2,
+        timeout: float = 10.0,
+        max_idle: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.__username = username
+        self.__password = password
+        self.__tls = tls
+        self.__slots = asyncio.Semaphore(size)
+        self.__idle: list[tuple[SMTP, float]] = []
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[SMTP]:
+        async with self.__slots:
+            connection = await self.__take()
+            try:
+                yield connection
+            except BaseException:
+                connection.close()
+                raise
+            self.__idle.append((connection, time.monotonic()))
+
+    async def close(self) -> None:
+        idle, self.__idle = self.__idle, []
+        for connection, _ in idle:
+            with contextlib.suppress(SMTPException, OSError, TimeoutError):
+                await connection.quit()
+
+    async def __take(self) -> SMTP:
+        now = time.monotonic()
+        while self.__idle:
+            connection, since = self.__idle.pop()
+            if connection.is_connected and now - since < self.max_idle:
+                return connection
+            connection.close()
+        return await self.__connect()
+
+    async def __connect(self) -> SMTP:
+        implicit_tls = self.__tls and self.port == 465
+        connection = SMTP(
+            hostname=self.host,
+            port=self.port,
+            use_tls=implicit_tls,
+            start_tls=self.__tls and not implicit_tls,
+            timeout=self.timeout,
+        )
+        await connection.connect()
+        try:
+            if self.__username is not None:
+                await connection.login(self.__username, self.__password or '')
+        except BaseException:
+            connection.close()
+            raise
+        return connection
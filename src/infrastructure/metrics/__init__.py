@@ -0,0 +1,17 @@
+from src.infrastructure.metrics.families import MetricFamily, counter_family, gauge_family, histogram_family
+from src.infrastructure.metrics.histogram import DEFAULT_BUCKETS, Histogram, log_linear_buckets
+from src.infrastructure.metrics.request_metrics import RequestMetrics
+from src.infrastructure.metrics.metrics_store import MetricsStore
+from src.infrastructure.metrics.prometheus import render_prometheus
+from src.infrastructure.logger import logger
+from src.settings import settings
+
+
+request_metrics = RequestMetrics()
+
+metrics_store = MetricsStore(
+    directory=settings.METRICS_DIR,
+    flush_interval=settings.METRICS_FLUSH_INTERVAL,
+    logger=logger,
+)
+metrics_store.register(request_metrics.collect)
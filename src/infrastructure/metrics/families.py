@@ -0,0 +1,52 @@
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+
+MetricFamily = dict[str, Any]
+Labels = Mapping[str, str | int]
+
+
+def _labels(labels: Labels) -> list[list[str]]:
+    return [[key, str(value)] for key, value in labels.items()]
+
+
+def counter_family(name: str, help_text: str, samples: Iterable[tuple[Labels, float]]) -> MetricFamily:
+    """Monotonic counter, summed over all workers (including exited ones)"""
+    return {
+        'name': name,
+        'type': 'counter',
+        'help': help_text,
+        'samples': [[_labels(labels), value] for labels, value in samples],
+    }
+
+
+def gauge_family(
+    name: str,
+    help_text: str,
+    samples: Iterable[tuple[Labels, float]],
+    aggregate: Literal['sum', 'max'] = 'sum',
+) -> MetricFamily:
+    """Point-in-time value, summed (or maxed) over live workers only"""
+    return {
+        'name': name,
+        'type': 'gauge',
+        'help': help_text,
+        'aggregate': aggregate,
+        'samples': [[_labels(labels), value] for labels, value in samples],
+    }
+
+
+def histogram_family(
+    name: str,
+    help_text: str,
+    buckets: Iterable[float],
+    samples: Iterable[tuple[Labels, Iterable[int], float]],
+) -> MetricFamily:
+    """Fixed-bucket histogram (non-cumulative counts, +Inf last), summed over all workers"""
+    return {
+        'name': name,
+        'type': 'histogram',
+        'help': help_text,
+        'buckets': list(buckets),
+        'samples': [[_labels(labels), list(counts), total] for labels, counts, total in samples],
+    }
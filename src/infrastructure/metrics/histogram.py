@@ -0,0 +1,59 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+
+def log_linear_buckets(lowest: float = 0.0001, highest: float = 30.0, steps: Sequence[float] = (1, 2.5, 5)) -> tuple[float, ...]:
+    """
+    Build HDR-style bucket upper bounds: every decade between `lowest` and
+    `highest` is split at the same relative steps, so the relative error is
+    bounded across the whole range.
+    """
+    bounds: list[float] = []
+    decade = lowest
+    while decade <= highest:
+        bounds.extend(round(decade * step, 10) for step in steps if decade * step <= highest)
+        decade *= 10
+    return tuple(sorted(set(bounds)))
+
+
+DEFAULT_BUCKETS = log_linear_buckets()
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Counts live in a preallocated array (the last slot is the +Inf bucket), so
+    recording is a bisect over the bounds and an in-place increment.
+    """
+    __slots__ = ('bounds', 'counts', 'sum')
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = array('Q', bytes(8 * (len(bounds) + 1)))
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate of the q-quantile, interpolated linearly inside its bucket"""
+        total = self.count
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index else 0.0
+                return lower + (self.bounds[index] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
@@ -0,0 +1,225 @@
+import asyncio
+import contextlib
+import fcntl
+import json
+import os
+import shutil
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+from src.infrastructure.logger import Logger
+from src.infrastructure.metrics.families import MetricFamily
+
+
+Collector = Callable[[], list[MetricFamily]]
+
+_COMPACTED = 'compacted.json'
+
+
+def _started_at(pid: int) -> str | None:
+    """Start time of the process in clock ticks since boot, None where /proc is unavailable"""
+    try:
+        stat = Path(f'/proc/{pid}/stat').read_text(encoding='ascii')
+    except OSError:
+        return None
+    return stat.rsplit(')', 1)[1].split()[19]
+
+
+def _is_alive(pid: int, started_at: str | None) -> bool:
+    """Whether the process still runs; the start time tells a reused PID apart"""
+    if started_at is not None and Path('/proc').is_dir():
+        return _started_at(pid) == started_at
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsStore:
+    """
+    Shares metrics between worker processes through per-worker files.
+
+    Every worker periodically dumps the families of its registered collectors
+    to `<directory>/<generation>/<pid>-<start time>.json`; the generation
+    identifies the master process, so snapshots of an earlier run are never
+    merged (they are removed at start), and the start time keeps a reused PID
+    from overwriting an exited worker's file. A scrape on any worker refreshes its own file and
+    merges all of them, so one scrape shows the whole container. Counters and
+    histograms of exited workers are folded into `compacted.json` so they stay
+    monotonic, their gauges are dropped.
+    """
+
+    def __init__(self, directory: str, flush_interval: float, logger: Logger) -> None:
+        self.root = Path(directory)
+        self.directory = self.root / self.__generation()
+        self.flush_interval = flush_interval
+        self.__logger = logger
+        self.__collectors: list[Collector] = []
+        self.__task: asyncio.Task[None] | None = None
+        self.__worker: tuple[int, str | None] | None = None
+
+    @property
+    def worker_file(self) -> Path:
+        pid, started_at = self.__identity()
+        return self.directory / f'{pid}-{started_at or 0}.json'
+
+    def register(self, collector: Collector) -> None:
+        self.__collectors.append(collector)
+
+    def collect_local(self) -> list[MetricFamily]:
+        return [family for collector in self.__collectors for family in collector()]
+
+    async def start(self) -> None:
+        # Recomputed here in case the store was imported before the workers were forked
+        self.directory = self.root / self.__generation()
+        await asyncio.to_thread(self.__prepare)
+        self.__task = asyncio.create_task(self.__flush_periodically(), name='metrics-flush')
+
+    async def stop(self) -> None:
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        await asyncio.to_thread(self.__write, self.collect_local())
+
+    async def collect(self) -> list[MetricFamily]:
+        """Refresh this worker's file and return families merged over all workers"""
+        await self.flush()
+        return await asyncio.to_thread(self.__aggregate)
+
+    async def __flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except OSError as e:
+                self.__logger.warning('Failed to write metrics snapshot', error=e)
+
+    def __identity(self) -> tuple[int, str | None]:
+        pid = os.getpid()
+        if self.__worker is None or self.__worker[0] != pid:
+            self.__worker = (pid, _started_at(pid))
+        return self.__worker
+
+    @staticmethod
+    def __generation() -> str:
+        master = os.getppid()
+        return f'{master}-{_started_at(master) or 0}'
+
+    def __prepare(self) -> None:
+        """Create this generation's directory and remove snapshots left by earlier runs"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for path in self.root.iterdir():
+            if path == self.directory:
+                continue
+            if path.is_dir():
+                master, _, started_at = path.name.partition('-')
+                if master.isdigit() and _is_alive(int(master), started_at if started_at != '0' else None):
+                    continue
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.suffix in {'.json', '.tmp'}:
+                path.unlink(missing_ok=True)
+
+    def __write(self, families: list[MetricFamily]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        pid, started_at = self.__identity()
+        self.__replace(self.worker_file, {'pid': pid, 'started_at': started_at, 'families': families})
+
+    @staticmethod
+    def __replace(target: Path, content: Any) -> None:
+        temporary = target.with_suffix('.tmp')
+        temporary.write_text(json.dumps(content), encoding='utf-8')
+        temporary.replace(target)
+
+    @staticmethod
+    def __read(path: Path) -> dict[str, Any] | None:
+        try:
+            snapshot = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return snapshot if 'families' in snapshot else None
+
+    def __aggregate(self) -> list[MetricFamily]:
+        live: list[list[MetricFamily]] = []
+        dead: list[Path] = []
+        for path in self.directory.glob('*.json'):
+            if path.name == _COMPACTED:
+                continue
+            snapshot = self.__read(path)
+            if snapshot is None:
+                continue
+            if _is_alive(snapshot['pid'], snapshot.get('started_at')):
+                live.append(snapshot['families'])
+            else:
+                dead.append(path)
+
+        if dead:
+            try:
+                self.__compact()
+            except OSError as e:
+                self.__logger.warning('Failed to compact metrics of exited workers', error=e)
+        compacted = self.__read(self.directory / _COMPACTED)
+        return self.__combine([compacted['families'] if compacted else [], *live])
+
+    def __compact(self) -> None:
+        """Fold the counters and histograms of exited workers into the compacted file and delete their files"""
+        with (self.directory / '.lock').open('w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            target = self.directory / _COMPACTED
+            compacted = self.__read(target) or {'families': [], 'absorbed': []}
+            # A file listed as absorbed was merged before its deletion was interrupted
+            absorbed = {name for name in compacted['absorbed'] if (self.directory / name).exists()}
+            dead: list[Path] = []
+            families = [compacted['families']]
+            for path in self.directory.glob('*.json'):
+                snapshot = None if path.name == _COMPACTED else self.__read(path)
+                if snapshot is None or _is_alive(snapshot['pid'], snapshot.get('started_at')):
+                    continue
+                dead.append(path)
+                if path.name not in absorbed:
+                    families.append([family for family in snapshot['families'] if family['type'] != 'gauge'])
+                    absorbed.add(path.name)
+
+            self.__replace(target, {'families': self.__combine(families), 'absorbed': sorted(absorbed)})
+            for path in dead:
+                path.unlink(missing_ok=True)
+
+    def __combine(self, snapshots: Iterable[list[MetricFamily]]) -> list[MetricFamily]:
+        merged: dict[str, MetricFamily] = {}
+        samples: dict[str, dict[Any, list[Any]]] = {}
+
+        for families in snapshots:
+            for family in families:
+                name = family['name']
+                if name not in merged:
+                    merged[name] = {**family, 'samples': []}
+                    samples[name] = {}
+                elif merged[name].get('buckets') != family.get('buckets'):
+                    continue
+                self.__merge(family, samples[name])
+
+        for name, family in merged.items():
+            family['samples'] = list(samples[name].values())
+        return list(merged.values())
+
+    @staticmethod
+    def __merge(family: MetricFamily, target: dict[Any, list[Any]]) -> None:
+        for sample in family['samples']:
+            key = tuple(map(tuple, sample[0]))
+            current = target.get(key)
+            if current is None:
+                target[key] = [sample[0], *sample[1:]]
+            elif family['type'] == 'histogram':
+                current[1] = [a + b for a, b in zip(current[1], sample[1], strict=True)]
+                current[2] += sample[2]
+            elif family.get('aggregate') == 'max':
+                current[1] = max(current[1], sample[1])
+            else:
+                current[1] += sample[1]
@@ -0,0 +1,38 @@
+from src.infrastructure.metrics.families import MetricFamily
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _render_labels(labels: list[list[str]], extra: str = '') -> str:
+    pairs = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def render_prometheus(families: list[MetricFamily]) -> str:
+    """Render metric families in the Prometheus text exposition format"""
+    lines: list[str] = []
+
+    for family in families:
+        name = family['name']
+        lines.append(f'# HELP {name} {family["help"]}')
+        lines.append(f'# TYPE {name} {family["type"]}')
+
+        if family['type'] != 'histogram':
+            lines.extend(f'{name}{_render_labels(labels)} {value}' for labels, value in sorted(family['samples']))
+            continue
+
+        bounds = [*(format(bound, 'g') for bound in family['buckets']), '+Inf']
+        for labels, counts, total in sorted(family['samples']):
+            cumulative = 0
+            for bound, count in zip(bounds, counts, strict=True):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(f'{name}_bucket{_render_labels(labels, le)} {cumulative}')
+            lines.append(f'{name}_sum{_render_labels(labels)} {total}')
+            lines.append(f'{name}_count{_render_labels(labels)} {cumulative}')
+
+    return '\n'.join(lines) + '\n'
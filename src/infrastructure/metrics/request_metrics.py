@@ -0,0 +1,40 @@
+from src.infrastructure.metrics.families import MetricFamily, histogram_family
+from src.infrastructure.metrics.histogram import DEFAULT_BUCKETS, Histogram
+
+
+class RequestMetrics:
+    """
+    Per-worker request latency histograms keyed by route template, method and status.
+
+    Histograms are stored in nested dicts (route -> method -> status) so that
+    recording an already seen series does not allocate a key tuple.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.bounds = bounds
+        self.__series: dict[str, dict[str, dict[int, Histogram]]] = {}
+
+    def observe(self, route: str, method: str, status: int, seconds: float) -> None:
+        by_method = self.__series.get(route)
+        if by_method is None:
+            by_method = self.__series[route] = {}
+        by_status = by_method.get(method)
+        if by_status is None:
+            by_status = by_method[method] = {}
+        histogram = by_status.get(status)
+        if histogram is None:
+            histogram = by_status[status] = Histogram(self.bounds)
+        histogram.record(seconds)
+
+    def collect(self) -> list[MetricFamily]:
+        return [histogram_family(
+            'http_request_duration_seconds',
+            'HTTP request latency by route template, method and status.',
+            self.bounds,
+            (
+                ({'route': route, 'method': method, 'status': status}, histogram.counts, histogram.sum)
+                for route, by_method in self.__series.items()
+                for method, by_status in by_method.items()
+                for status, histogram in by_status.items()
+            ),
+        )]
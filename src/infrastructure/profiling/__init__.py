@@ -0,0 +1,5 @@
+from src.infrastructure.profiling.profile_store import ProfileStore
+from src.settings import settings
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, max_files=settings.PROFILING_MAX_FILES)
@@ -0,0 +1,58 @@
+import re
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+
+class ProfileStore:
+    """
+    Directory of saved request profiles, named by trace id and a random suffix.
+
+    Only the newest `max_files` profiles are kept. Names are restricted to a
+    safe character set, so a name taken from a request cannot leave the
+    directory.
+    """
+
+    suffix = '.speedscope.json'
+    __safe_name = re.compile(r'[A-Za-z0-9_.-]{1,128}')
+
+    def __init__(self, directory: str | Path, max_files: int = 100) -> None:
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def valid_name(self, name: str) -> bool:
+        return self.__safe_name.fullmatch(name) is not None
+
+    def save(self, name: str, data: str) -> Path:
+        """Write a profile (blocking, call it from a thread) and delete the oldest ones over the limit"""
+        if not self.valid_name(name):
+            raise ValueError(f'Invalid profile name: {name!r}')
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f'{name}{self.suffix}'
+        temporary = path.with_suffix('.tmp')
+        temporary.write_text(data, encoding='utf-8')
+        temporary.replace(path)
+        for stale in self.list()[self.max_files:]:
+            (self.directory / f'{stale["name"]}{self.suffix}').unlink(missing_ok=True)
+        return path
+
+    def list(self) -> list[dict[str, Any]]:
+        """Name, size and creation time of the saved profiles, newest first"""
+        profiles = []
+        for path in self.directory.glob(f'*{self.suffix}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            profiles.append({
+                'name': path.name.removesuffix(self.suffix),
+                'size': stat.st_size,
+                'created_at': datetime.fromtimestamp(stat.st_mtime, UTC),
+            })
+        return sorted(profiles, key=lambda profile: profile['created_at'], reverse=True)
+
+    def path(self, name: str) -> Path | None:
+        if not self.valid_name(name):
+            return None
+        path = self.directory / f'{name}{self.suffix}'
+        return path if path.is_file() else None
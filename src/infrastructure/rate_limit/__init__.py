@@ -0,0 +1,16 @@
+from src.infrastructure.rate_limit.rate_limit_backend import RateLimitBackend
+from src.infrastructure.rate_limit.rate_limit_result import RateLimitResult
+from src.infrastructure.rate_limit.memory_rate_limit_backend import MemoryRateLimitBackend
+from src.infrastructure.rate_limit.sliding_window import sliding_window_hit
+from src.infrastructure.logger import logger
+from src.settings import settings
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == 'redis':
+        from src.infrastructure.rate_limit.redis_rate_limit_backend import RedisRateLimitBackend  # noqa: PLC0415 - redis is optional
+        return RedisRateLimitBackend.from_url(settings.REDIS_URL, logger)
+    return MemoryRateLimitBackend()
+
+
+rate_limit_backend = create_rate_limit_backend()
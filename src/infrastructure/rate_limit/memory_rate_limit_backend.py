@@ -0,0 +1,41 @@
+import time
+from collections.abc import Callable
+from src.infrastructure.rate_limit.rate_limit_backend import RateLimitBackend
+from src.infrastructure.rate_limit.rate_limit_result import RateLimitResult
+from src.infrastructure.rate_limit.sliding_window import sliding_window_hit
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Single-node rate limit counters.
+
+    Every key holds three numbers. Keys idle for two windows no longer affect
+    the estimate and are swept at most once per `sweep_interval` seconds.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, sweep_interval: float = 60.0) -> None:
+        self.__clock = clock
+        self.__sweep_interval = sweep_interval
+        self.__states: dict[str, list[float]] = {}
+        self.__next_sweep = clock() + sweep_interval
+
+    def __len__(self) -> int:
+        return len(self.__states)
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now = self.__clock()
+        if now >= self.__next_sweep:
+            self.__sweep(now, window)
+
+        state = self.__states.get(key)
+        if state is None:
+            state = self.__states[key] = [0.0, 0, 0]
+        return sliding_window_hit(state, now, limit, window)
+
+    async def close(self) -> None:
+        self.__states.clear()
+
+    def __sweep(self, now: float, window: float) -> None:
+        threshold = now - 2 * window
+        self.__states = {key: state for key, state in self.__states.items() if state[0] > threshold}
+        self.__next_sweep = now + self.__sweep_interval
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from src.infrastructure.rate_limit.rate_limit_result import RateLimitResult
+
+
+class RateLimitBackend(ABC):
+    """Storage of per-key request counters."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        """Count one request for `key`, allowing at most `limit` requests per `window` seconds"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
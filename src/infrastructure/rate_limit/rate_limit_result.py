@@ -0,0 +1,10 @@
+class RateLimitResult:
+    """Outcome of counting one request against a rate limit."""
+    __slots__ = ('allowed', 'limit', 'remaining', 'retry_after', 'reset_after')
+
+    def __init__(self, *, allowed: bool, limit: int, remaining: int, retry_after: float, reset_after: float) -> None:
+        self.allowed = allowed
+        self.limit = limit
+        self.remaining = remaining
+        self.retry_after = retry_after
+        self.reset_after = reset_after
@@ -0,0 +1,84 @@
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.infrastructure.logger import Logger
+from src.infrastructure.rate_limit.rate_limit_backend import RateLimitBackend
+from src.infrastructure.rate_limit.rate_limit_result import RateLimitResult
+
+
+# Same algorithm as sliding_window_hit, executed atomically on the Redis server
+# with the server clock so all nodes share one time source.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local window_start = math.floor(now / window) * window
+
+local state = redis.call('HMGET', KEYS[1], 'start', 'previous', 'current')
+local start = tonumber(state[1]) or window_start
+local previous = tonumber(state[2]) or 0
+local current = tonumber(state[3]) or 0
+if start ~= window_start then
+    if window_start - start == window then previous = current else previous = 0 end
+    current = 0
+end
+
+local elapsed = now - window_start
+local estimated = previous * (1 - elapsed / window) + current
+local allowed = 1
+local retry_after = 0
+if estimated + 1 > limit then
+    allowed = 0
+    if current <= limit - 1 and previous > 0 then
+        retry_after = window_start + window * (1 - (limit - 1 - current) / previous) - now
+    else
+        retry_after = window_start + window + window * (1 - (limit - 1) / math.max(current, 1)) - now
+    end
+else
+    current = current + 1
+end
+
+redis.call('HSET', KEYS[1], 'start', window_start, 'previous', previous, 'current', current)
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 2000))
+return {allowed, tostring(estimated), tostring(retry_after), tostring(window - elapsed)}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Rate limit counters shared by all nodes.
+
+    One small hash per key, expiring after two idle windows. When Redis is
+    unreachable requests are let through (fail open) and a warning is logged.
+    """
+
+    def __init__(self, redis: Redis, logger: Logger, prefix: str = 'rate_limit:') -> None:
+        self.__redis = redis
+        self.__logger = logger
+        self.__prefix = prefix
+        self.__script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, logger: Logger, prefix: str = 'rate_limit:') -> 'RedisRateLimitBackend':
+        return cls(Redis.from_url(url), logger, prefix)
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        try:
+            allowed, estimated, retry_after, reset_after = await self.__script(
+                keys=[self.__prefix + key], args=[limit, window]
+            )
+        except RedisError as e:
+            self.__logger.warning('Rate limit backend error, request allowed', error=e)
+            return RateLimitResult(allowed=True, limit=limit, remaining=limit, retry_after=0.0, reset_after=window)
+
+        remaining = 0 if not allowed else max(int(limit - float(estimated) - 1), 0)
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=remaining,
+            retry_after=max(float(retry_after), 0.0),
+            reset_after=float(reset_after),
+        )
+
+    async def close(self) -> None:
+        await self.__redis.aclose()
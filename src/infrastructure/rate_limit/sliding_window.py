@@ -0,0 +1,41 @@
+import math
+from src.infrastructure.rate_limit.rate_limit_result import RateLimitResult
+
+
+def sliding_window_hit(
+    state: list[float],
+    now: float,
+    limit: int,
+    window: float,
+) -> RateLimitResult:
+    """
+    Count one request with the sliding window counter algorithm.
+
+    `state` is `[window_start, previous_count, current_count]` and is updated in
+    place, so memory per key is constant. The request rate is estimated as the
+    current fixed window count plus the previous window count weighted by how
+    much of it still overlaps the sliding window.
+    RedisRateLimitBackend runs the same algorithm in a Lua script.
+    """
+    window_start = math.floor(now / window) * window
+    if state[0] != window_start:
+        state[1] = state[2] if window_start - state[0] == window else 0
+        state[2] = 0
+        state[0] = window_start
+
+    _, previous, current = state
+    elapsed = now - window_start
+    estimated = previous * (1 - elapsed / window) + current
+    reset_after = window - elapsed
+
+    if estimated + 1 > limit:
+        if current <= limit - 1 and previous > 0:
+            retry_after = window_start + window * (1 - (limit - 1 - current) / previous) - now
+        else:
+            retry_after = window_start + window + window * (1 - (limit - 1) / max(current, 1)) - now
+        return RateLimitResult(allowed=False, limit=limit, remaining=0, retry_after=max(retry_after, 0.0), reset_after=reset_after)
+
+    state[2] = current + 1
+    return RateLimitResult(
+        allowed=True, limit=limit, remaining=max(int(limit - estimated - 1), 0), retry_after=0.0, reset_after=reset_after
+    )
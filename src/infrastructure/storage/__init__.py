@@ -0,0 +1,39 @@
+from src.application.contracts.i_storage import IStorage
+from src.infrastructure.storage.local_storage import LocalStorage
+from src.infrastructure.storage.storage_key import valid_key
+from src.infrastructure.logger import logger
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+from src.settings import settings
+
+
+def create_storage() -> IStorage:
+    if settings.STORAGE_BACKEND == 's3':
+        from src.infrastructure.storage.s3_storage import S3Storage  # noqa: PLC0415 - boto3 is optional
+        if settings.S3_BUCKET_NAME is None:
+            message = 'S3_BUCKET_NAME is required with STORAGE_BACKEND=s3'
+            raise ValueError(message)
+        executor = BoundedExecutor(
+            max_workers=settings.S3_WORKERS,
+            queue_limit=settings.S3_QUEUE_LIMIT,
+            thread_name_prefix='s3',
+        )
+        return S3Storage.from_config(
+            settings.S3_BUCKET_NAME,
+            executor,
+            logger,
+            endpoint_url=settings.S3_ENDPOINT,
+            access_key=settings.S3_ACCESS_KEY,
+            secret_key=settings.S3_SECRET_KEY,
+            region=settings.S3_REGION,
+            part_size=settings.S3_PART_SIZE,
+            max_concurrency=settings.S3_MAX_CONCURRENCY,
+            chunk_size=settings.STORAGE_CHUNK_SIZE,
+        )
+    return LocalStorage(settings.UPLOAD_DIR, chunk_size=settings.STORAGE_CHUNK_SIZE)
+
+
+storage = create_storage()
+
+
+async def get_storage() -> IStorage:
+    return storage
@@ -0,0 +1,110 @@
+import asyncio
+import hashlib
+import mimetypes
+import stat
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from typing import IO, Any
+from src.application.contracts.i_storage import IStorage
+from src.application.domain.exceptions import StoredFileNotFoundError
+from src.application.domain.objects.stored_file import StoredFile
+from src.infrastructure.storage.size_limit import limit_size
+from src.infrastructure.storage.storage_key import valid_key
+
+
+def _write(file: IO[bytes], digest: Any, data: bytearray) -> None:
+    digest.update(data)
+    file.write(data)
+
+
+def _move(temporary: Path, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary.replace(path)
+
+
+class LocalStorage(IStorage):
+    """
+    Files in a local directory.
+
+    An upload is collected into `chunk_size` blocks, each hashed and written
+    in one call on a worker thread, into a temporary file that is moved into
+    place once complete: readers never see a partial file and a rejected
+    upload leaves nothing behind. The content type is not stored, it is
+    guessed from the extension of the key.
+    """
+
+    __uploads = '.uploads'
+
+    def __init__(self, directory: str | Path, chunk_size: int = 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.chunk_size = chunk_size
+
+    async def save(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        content_type: str = 'application/octet-stream',
+        max_size: int | None = None,
+    ) -> StoredFile:
+        if not valid_key(key):
+            raise ValueError(f'Invalid storage key: {key!r}')
+        temporary = self.directory / self.__uploads / uuid.uuid4().hex
+        await asyncio.to_thread(temporary.parent.mkdir, parents=True, exist_ok=True)
+        file = await asyncio.to_thread(temporary.open, 'wb')
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
+        try:
+            async for chunk in limit_size(chunks, max_size):
+                size += len(chunk)
+                buffer += chunk
+                if len(buffer) >= self.chunk_size:
+                    await asyncio.to_thread(_write, file, digest, buffer)
+                    buffer.clear()
+            await asyncio.to_thread(_write, file, digest, buffer)
+            await asyncio.to_thread(file.close)
+            await asyncio.to_thread(_move, temporary, self.directory / key)
+        except BaseException:
+            file.close()
+            temporary.unlink(missing_ok=True)
+            raise
+        return StoredFile(key, size, content_type, digest.hexdigest())
+
+    async def stat(self, key: str) -> StoredFile:
+        path = self.local_path(key)
+        try:
+            result = await asyncio.to_thread(path.stat) if path is not None else None
+        except (FileNotFoundError, NotADirectoryError):
+            result = None
+        if result is None or not stat.S_ISREG(result.st_mode):
+            raise StoredFileNotFoundError(key)
+        content_type, _ = mimetypes.guess_type(key)
+        return StoredFile(key, result.st_size, content_type or 'application/octet-stream')
+
+    async def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        stored = await self.stat(key)
+        remaining = (stored.size if end is None else min(end + 1, stored.size)) - start
+        file = await asyncio.to_thread((self.directory / key).open, 'rb')
+        try:
+            await asyncio.to_thread(file.seek, start)
+            while remaining > 0:
+                data = await asyncio.to_thread(file.read, min(self.chunk_size, remaining))
+                if not data:
+                    return
+                remaining -= len(data)
+                yield data
+        finally:
+            file.close()
+
+    async def delete(self, key: str) -> None:
+        path = self.local_path(key)
+        if path is not None:
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+
+    def local_path(self, key: str) -> Path | None:
+        return self.directory / key if valid_key(key) else None
+
+    async def close(self) -> None:
+        pass
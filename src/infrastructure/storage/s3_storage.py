@@ -0,0 +1,222 @@
+import asyncio
+import contextlib
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar, cast
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from src.application.contracts.i_storage import IStorage
+from src.application.domain.exceptions import StoredFileNotFoundError
+from src.application.domain.objects.stored_file import StoredFile
+from src.infrastructure.logger import Logger
+from src.infrastructure.storage.size_limit import limit_size
+from src.infrastructure.storage.storage_key import valid_key
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+
+
+T = TypeVar('T')
+
+_NOT_FOUND_CODES = frozenset({'404', 'NoSuchKey', 'NotFound'})
+
+
+class S3Storage(IStorage):
+    """
+    Files in an S3 bucket, or on any S3-compatible server through `endpoint_url`.
+
+    boto3 blocks, so every call runs on a bounded thread pool. An upload that
+    fits in one part is a single PUT; a larger one becomes a multipart upload
+    whose parts are sent while the next ones are still being received, with
+    at most `max_concurrency` parts of one upload in flight (and in memory).
+    A rejected or failed upload is aborted. The SHA-256 is stored in the
+    object metadata of single-part uploads only, multipart metadata has to
+    be set before the content is known.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        executor: BoundedExecutor,
+        logger: Logger,
+        *,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        chunk_size: int = 1024 * 1024,
+    ) -> None:
+        self.bucket = bucket
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+        self.__client = client
+        self.__executor = executor
+        self.__logger = logger
+
+    @classmethod
+    def from_config(
+        cls,
+        bucket: str,
+        executor: BoundedExecutor,
+        logger: Logger,
+        *,
+        endpoint_url: str | None = None,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        region: str = 'us-east-1',
+        **kwargs: Any,
+    ) -> 'S3Storage':
+        client = boto3.client(
+            's3',
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region,
+            config=Config(max_pool_connections=executor.max_workers, retries={'mode': 'standard'}),
+        )
+        return cls(client, bucket, executor, logger, **kwargs)
+
+    async def save(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        content_type: str = 'application/octet-stream',
+        max_size: int | None = None,
+    ) -> StoredFile:
+        if not valid_key(key):
+            raise ValueError(f'Invalid storage key: {key!r}')
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
+        upload_id: str | None = None
+        parts: list[asyncio.Task[dict[str, Any]]] = []
+        try:
+            async for chunk in limit_size(chunks, max_size):
+                size += len(chunk)
+                buffer += chunk
+                if len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        upload_id = await self.__create_multipart_upload(key, content_type)
+                    await self.__send_part(key, upload_id, parts, digest, bytes(buffer))
+                    buffer.clear()
+
+            if upload_id is None:
+                data = bytes(buffer)
+                await self.__call(digest.update, data)
+                await self.__call(
+                    self.__client.put_object,
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=data,
+                    ContentType=content_type,
+                    Metadata={'sha256': digest.hexdigest()},
+                )
+            else:
+                if buffer:
+                    await self.__send_part(key, upload_id, parts, digest, bytes(buffer))
+                await self.__call(
+                    self.__client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={'Parts': list(await asyncio.gather(*parts))},
+                )
+        except BaseException:
+            await self.__abort(key, upload_id, parts)
+            raise
+        return StoredFile(key, size, content_type, digest.hexdigest())
+
+    async def stat(self, key: str) -> StoredFile:
+        if not valid_key(key):
+            raise StoredFileNotFoundError(key)
+        try:
+            head = await self.__call(self.__client.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            raise self.__not_found(key, e) from e
+        return StoredFile(
+            key,
+            head['ContentLength'],
+            head.get('ContentType', 'application/octet-stream'),
+            head.get('Metadata', {}).get('sha256'),
+        )
+
+    async def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        if not valid_key(key):
+            raise StoredFileNotFoundError(key)
+        byte_range = f'bytes={start}-{"" if end is None else end}'
+        try:
+            response = await self.__call(self.__client.get_object, Bucket=self.bucket, Key=key, Range=byte_range)
+        except ClientError as e:
+            raise self.__not_found(key, e) from e
+        body = response['Body']
+        try:
+            while data := await self.__call(body.read, self.chunk_size):
+                yield data
+        finally:
+            body.close()
+
+    async def delete(self, key: str) -> None:
+        if valid_key(key):
+            await self.__call(self.__client.delete_object, Bucket=self.bucket, Key=key)
+
+    def local_path(self, key: str) -> Path | None:  # noqa: ARG002
+        return None
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.__executor.shutdown)
+        self.__client.close()
+
+    async def __call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self.__executor.run(partial(func, *args, **kwargs))
+
+    async def __create_multipart_upload(self, key: str, content_type: str) -> str:
+        response = await self.__call(
+            self.__client.create_multipart_upload, Bucket=self.bucket, Key=key, ContentType=content_type
+        )
+        return str(response['UploadId'])
+
+    async def __send_part(
+        self,
+        key: str,
+        upload_id: str,
+        parts: list[asyncio.Task[dict[str, Any]]],
+        digest: Any,
+        data: bytes,
+    ) -> None:
+        """Hash the part and start sending it, after waiting for a free slot among the parts in flight"""
+        await self.__call(digest.update, data)
+        in_flight = {part for part in parts if not part.done()}
+        if len(in_flight) >= self.max_concurrency:
+            await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for part in parts:
+            if part.done():
+                part.result()  # a failed part fails the upload now rather than at the end
+        parts.append(asyncio.create_task(self.__upload_part(key, upload_id, len(parts) + 1, data)))
+
+    async def __upload_part(self, key: str, upload_id: str, number: int, data: bytes) -> dict[str, Any]:
+        response = await self.__call(
+            self.__client.upload_part, Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=data
+        )
+        return {'PartNumber': number, 'ETag': response['ETag']}
+
+    async def __abort(self, key: str, upload_id: str | None, parts: list[asyncio.Task[dict[str, Any]]]) -> None:
+        for part in parts:
+            part.cancel()
+        await asyncio.gather(*parts, return_exceptions=True)
+        if upload_id is None:
+            return
+        with contextlib.suppress(asyncio.CancelledError):
+            try:
+                await asyncio.shield(
+                    self.__call(self.__client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id)
+                )
+            except Exception as e:  # noqa: BLE001
+                self.__logger.warning('S3 multipart upload abort failed', key=key, upload_id=upload_id, error=e)
+
+    @staticmethod
+    def __not_found(key: str, error: ClientError) -> Exception:
+        if error.response.get('Error', {}).get('Code') in _NOT_FOUND_CODES:
+            return StoredFileNotFoundError(key)
+        return cast('Exception', error)
@@ -0,0 +1,12 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from src.application.domain.exceptions import PayloadTooLargeError
+
+
+async def limit_size(chunks: AsyncIterable[bytes], max_size: int | None) -> AsyncIterator[bytes]:
+    """Pass the chunks through, raising PayloadTooLargeError with the first one past `max_size` bytes"""
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise PayloadTooLargeError(max_size)
+        yield chunk
@@ -0,0 +1,9 @@
+import re
+
+
+_SAFE_KEY = re.compile(r'[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*(?:/[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*)*')
+
+
+def valid_key(key: str) -> bool:
+    """`/`-separated names of letters, digits, `_`, `-` and inner dots, so a key cannot leave the storage root"""
+    return len(key) <= 512 and _SAFE_KEY.fullmatch(key) is not None
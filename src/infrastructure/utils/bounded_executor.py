@@ -0,0 +1,86 @@
+import asyncio
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+from src.application.domain.exceptions import ServiceUnavailableError
+
+
+T = TypeVar('T')
+
+
+class BoundedExecutor:
+    """
+    Runs blocking functions in a dedicated, size-bounded thread pool.
+
+    At most `max_workers` calls run at once and at most `queue_limit` more may
+    wait for a thread; beyond that calls are rejected with ServiceUnavailableError
+    instead of queueing forever. Intended for CPU-bound work in C extensions that
+    release the GIL (bcrypt, hashlib, compression), so the threads really run in
+    parallel with the event loop.
+
+    A slot is freed when its call finishes in the thread, not when the caller
+    stops waiting: a cancelled call that already started keeps its thread busy,
+    so it keeps counting against the bound until it is done.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int, thread_name_prefix: str) -> None:
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.thread_name_prefix = thread_name_prefix
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__pending = 0
+        self.__lock = threading.Lock()  # slots are freed from the pool threads
+
+    @property
+    def pending(self) -> int:
+        """Calls currently running or waiting for a thread"""
+        return self.__pending
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.queue_limit
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        [future] = self.submit_many(func, [args])
+        return await future
+
+    def submit_many(self, func: Callable[..., T], arguments: Sequence[tuple[Any, ...]]) -> list[asyncio.Future[T]]:
+        """
+        Start one call per tuple of arguments, or none of them and raise
+        ServiceUnavailableError when there is no room for all.
+
+        Cancelling a returned future cancels its call if it has not started yet.
+        """
+        with self.__lock:
+            if self.__pending + len(arguments) > self.capacity:
+                message = f'{self.thread_name_prefix} executor is saturated, try again later'
+                raise ServiceUnavailableError(message)
+            self.__pending += len(arguments)
+        futures: list[asyncio.Future[T]] = []
+        try:
+            executor = self.__get_executor()
+            for args in arguments:
+                future = executor.submit(func, *args)
+                future.add_done_callback(self.__release)
+                futures.append(asyncio.wrap_future(future))
+        finally:
+            if len(futures) < len(arguments):
+                self.__release(count=len(arguments) - len(futures))
+        return futures
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+            )
+        return self.__executor
+
+    def __release(self, _future: Future[Any] | None = None, count: int = 1) -> None:
+        with self.__lock:
+            self.__pending -= count
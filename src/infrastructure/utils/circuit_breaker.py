@@ -0,0 +1,107 @@
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+from src.application.domain.exceptions import CircuitOpenError
+from src.infrastructure.logger import Logger
+from src.infrastructure.utils.circuit_state import CircuitState
+
+
+T = TypeVar('T')
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a dependency is down.
+
+    After `failure_threshold` consecutive failures the circuit opens and every
+    call raises CircuitOpenError without touching the dependency. Once
+    `recovery_timeout` seconds have passed the circuit is half-open: up to
+    `half_open_max_calls` trial calls go through, a success closes the circuit
+    and a failure opens it again. Only exceptions matching `failure_exceptions`
+    count as failures.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        logger: Logger,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_exceptions: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_exceptions = failure_exceptions
+        self.failures = 0
+        self.rejected = 0
+        self.__logger = logger
+        self.__state = CircuitState.CLOSED
+        self.__opened_at = 0.0
+        self.__trial_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self.__state == CircuitState.OPEN and self.retry_after <= 0:
+            return CircuitState.HALF_OPEN
+        return self.__state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial call through"""
+        return max(self.__opened_at + self.recovery_timeout - time.monotonic(), 0.0)
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call is not allowed right now"""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return
+        if state == CircuitState.HALF_OPEN and self.__trial_calls < self.half_open_max_calls:
+            if self.__state == CircuitState.OPEN:
+                self.__transition(CircuitState.HALF_OPEN)
+            self.__trial_calls += 1
+            return
+
+        self.rejected += 1
+        msg = f'{self.name} is unavailable'
+        raise CircuitOpenError(msg, retry_after=self.retry_after or self.recovery_timeout)
+
+    def on_success(self) -> None:
+        self.failures = 0
+        if self.__state != CircuitState.CLOSED:
+            self.__transition(CircuitState.CLOSED)
+
+    def on_failure(self, error: BaseException) -> None:
+        if not isinstance(error, self.failure_exceptions):
+            # Not a dependency failure (e.g. a validation error); free the trial slot
+            if self.__state == CircuitState.HALF_OPEN:
+                self.__trial_calls = max(self.__trial_calls - 1, 0)
+            return
+
+        self.failures += 1
+        if self.__state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.__opened_at = time.monotonic()
+            self.__transition(CircuitState.OPEN, error=error)
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args: object, **kwargs: object) -> T:
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            self.on_failure(e)
+            raise
+        self.on_success()
+        return result
+
+    def __transition(self, state: CircuitState, error: BaseException | None = None) -> None:
+        previous, self.__state = self.__state, state
+        self.__trial_calls = 0
+        if state == CircuitState.OPEN:
+            self.__logger.warning(
+                'Circuit breaker opened', circuit=self.name, failures=self.failures, error=error, previous=previous.value
+            )
+        else:
+            self.__logger.info('Circuit breaker state changed', circuit=self.name, state=state.value, previous=previous.value)
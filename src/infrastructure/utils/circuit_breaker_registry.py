@@ -0,0 +1,50 @@
+from typing import Any
+from src.infrastructure.logger import Logger, logger
+from src.infrastructure.metrics import MetricFamily, counter_family, gauge_family
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+from src.infrastructure.utils.circuit_state import CircuitState
+from src.settings import settings
+
+
+class CircuitBreakerRegistry:
+    """One shared CircuitBreaker per dependency name within the worker"""
+
+    def __init__(self, logger: Logger, **defaults: Any) -> None:
+        self.__logger = logger
+        self.__defaults = defaults
+        self.__breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str, **options: Any) -> CircuitBreaker:
+        """Breaker of the dependency; `options` only apply when it is created"""
+        breaker = self.__breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, self.__logger, **{**self.__defaults, **options})
+            self.__breakers[name] = breaker
+        return breaker
+
+    def collect(self) -> list[MetricFamily]:
+        breakers = list(self.__breakers.values())
+        return [
+            gauge_family(
+                'circuit_breaker_state',
+                'Circuit breaker state (1 for the current state).',
+                [
+                    ({'circuit': breaker.name, 'state': state.value}, int(breaker.state == state))
+                    for breaker in breakers
+                    for state in CircuitState
+                ],
+                aggregate='max',
+            ),
+            counter_family(
+                'circuit_breaker_rejected_total',
+                'Calls rejected by an open circuit.',
+                [({'circuit': breaker.name}, breaker.rejected) for breaker in breakers],
+            ),
+        ]
+
+
+circuit_breakers = CircuitBreakerRegistry(
+    logger,
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=settings.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+)
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """Enum for circuit breaker states"""
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
@@ -1,18 +1,53 @@
+import asyncio
+from collections.abc import Sequence
 import bcrypt
 from src.application.contracts.i_hash_service import IHashService
-from src.infrastructure.logger import Logger
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+from src.settings import settings
+
+
+hash_executor = BoundedExecutor(
+    max_workers=settings.HASH_WORKERS,
+    queue_limit=settings.HASH_QUEUE_LIMIT,
+    thread_name_prefix='bcrypt',
+)
+
+
+def _hash(value: bytes, rounds: int) -> str:
+    return bcrypt.hashpw(value, bcrypt.gensalt(rounds)).decode()
+
+
+def _verify(plain_value: bytes, hashed_value: bytes) -> bool:
+    return bcrypt.checkpw(plain_value, hashed_value)
 
 
 class HashService(IHashService):
+    """
+    bcrypt hashing executed on a bounded thread pool.
 
-    def __init__(self, logger: Logger):
-        self.__logger = logger
+    bcrypt releases the GIL, so hashing runs in parallel with the event loop;
+    when the pool and its queue are full, calls fail fast with ServiceUnavailableError.
+    """
+
+    def __init__(self, executor: BoundedExecutor = hash_executor, rounds: int = settings.HASH_ROUNDS):
+        self.__executor = executor
+        self.__rounds = rounds
 
     async def hash(self, value: str) -> str:
-        hashed_value = bcrypt.hashpw(value.encode(), bcrypt.gensalt())
-        self.__logger.info(f'Hash value {hashed_value.decode()}')
-        return hashed_value.decode()
+        return await self.__executor.run(_hash, value.encode(), self.__rounds)
 
     async def verify(self, hashed_value: str, plain_value: str) -> bool:
-        self.__logger.info(f'Hash value {hashed_value}')
-        return bcrypt.checkpw(plain_value.encode(), hashed_value.encode())
+        return await self.__executor.run(_verify, plain_value.encode(), hashed_value.encode())
+
+    async def verify_many(self, pairs: Sequence[tuple[str, str]]) -> list[bool]:
+        # All or nothing: either every pair gets a slot or the call fails fast
+        return await asyncio.gather(*self.__executor.submit_many(
+            _verify, [(plain_value.encode(), hashed_value.encode()) for hashed_value, plain_value in pairs]
+        ))
+
+
+hash_service = HashService()
+
+
+async def get_hash_service() -> IHashService:
+    return hash_service
@@ -0,0 +1,104 @@
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from src.infrastructure.metrics.histogram import Histogram
+
+
+def _consume(attempt: asyncio.Future[Any]) -> None:
+    """Retrieve the exception of an abandoned attempt so it is not reported as unhandled"""
+    if not attempt.cancelled():
+        attempt.exception()
+
+
+class Hedge:
+    """
+    Fires a backup attempt when the first one is slower than usual.
+
+    The backup starts `after_ms` after the first attempt or, without a fixed
+    delay, once the call takes longer than the `percentile` of its observed
+    latency (no hedging until `min_samples` calls were seen). The first
+    successful attempt wins and the other is cancelled; if one attempt fails
+    the other may still succeed. Use only for idempotent calls.
+    """
+
+    def __init__(self, after_ms: float | None = None, *, percentile: float = 0.95, min_samples: int = 100) -> None:
+        self.after_ms = after_ms
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.latency = Histogram()
+        self.hedged = 0
+        self.backup_wins = 0
+
+    def delay(self) -> float | None:
+        """Seconds to wait before the backup attempt, None to not hedge"""
+        if self.after_ms is not None:
+            return self.after_ms / 1000
+        if self.latency.count < self.min_samples:
+            return None
+        return self.latency.quantile(self.percentile)
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        first = asyncio.ensure_future(func(*args, **kwargs))
+        attempts: list[asyncio.Future[Any]] = [first]
+        try:
+            delay = self.delay()
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                self.hedged += 1
+                attempts.append(asyncio.ensure_future(func(*args, **kwargs)))
+
+            winner = await self.__first_success(attempts)
+            if winner is not first:
+                self.backup_wins += 1
+            result = winner.result()
+        finally:
+            # Losers (and both attempts when the caller is cancelled) are cancelled
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+                attempt.add_done_callback(_consume)
+
+        self.latency.record(time.perf_counter() - start)
+        return result
+
+    @staticmethod
+    async def __first_success(attempts: list[asyncio.Future[Any]]) -> asyncio.Future[Any]:
+        """First attempt to succeed, or the first one that failed when none did"""
+        pending = set(attempts)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in done:
+                # A cancelled attempt counts as failed; exception() would raise CancelledError
+                if not attempt.cancelled() and attempt.exception() is None:
+                    return attempt
+        return next((attempt for attempt in attempts if not attempt.cancelled()), attempts[0])
+
+
+def hedged(
+    after_ms: float | None = None,
+    *,
+    percentile: float = 0.95,
+    min_samples: int = 100,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Decorator hedging slow calls of an idempotent async function with a second attempt.
+
+    :param after_ms: Fixed delay before the backup attempt (in milliseconds).
+    :param percentile: Latency percentile after which to hedge when `after_ms` is not set.
+    :param min_samples: Calls observed before percentile-based hedging starts.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        hedge = Hedge(after_ms, percentile=percentile, min_samples=min_samples)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await hedge.call(func, *args, **kwargs)
+
+        wrapper.hedge = hedge  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
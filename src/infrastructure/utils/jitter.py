@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Jitter(Enum):
+    """Enum for randomising retry delays so callers do not retry in lockstep"""
+    NONE = 'none'
+    FULL = 'full'
+    DECORRELATED = 'decorrelated'
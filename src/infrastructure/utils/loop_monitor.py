@@ -0,0 +1,127 @@
+import asyncio
+import contextlib
+import contextvars
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from src.infrastructure.logger import Logger, logger
+from src.infrastructure.metrics import MetricFamily, counter_family, gauge_family
+from src.settings import settings
+
+
+class LoopMonitor:
+    """
+    Measures event loop lag and reports callbacks that block the loop.
+
+    A task sleeps `interval` in a loop and records how late it wakes up in a
+    rolling window of `window` samples. A watchdog thread follows the
+    heartbeat of that task: when the loop has not come back to it for more
+    than `slow_callback` seconds, whatever runs on the loop is blocking it,
+    and its stack (taken from the loop thread while it is still blocked) is
+    logged once per stall with the trace id of the running task.
+    """
+
+    def __init__(self, logger: Logger, *, interval: float = 0.1, window: int = 600, slow_callback: float = 0.1) -> None:
+        self.interval = interval
+        self.slow_callback = slow_callback
+        self.stalls = 0
+        self.__logger = logger
+        self.__lags: deque[float] = deque(maxlen=window)
+        self.__heartbeat = 0.0
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__loop_thread = 0
+        self.__task: asyncio.Task[None] | None = None
+        self.__watchdog: threading.Thread | None = None
+        self.__stopped = threading.Event()
+
+    async def start(self) -> None:
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_thread = threading.get_ident()
+        self.__heartbeat = time.monotonic()
+        self.__stopped.clear()
+        self.__task = asyncio.create_task(self.__measure(), name='loop-monitor')
+        self.__watchdog = threading.Thread(target=self.__watch, name='loop-watchdog', daemon=True)
+        self.__watchdog.start()
+
+    async def stop(self) -> None:
+        self.__stopped.set()
+        if self.__task is not None:
+            self.__task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__task
+            self.__task = None
+        if self.__watchdog is not None:
+            await asyncio.to_thread(self.__watchdog.join)
+            self.__watchdog = None
+
+    def snapshot(self) -> dict[str, float]:
+        """Lag percentiles over the window (seconds) and the number of stalls"""
+        lags = sorted(self.__lags)
+        if not lags:
+            return {'lag_p50': 0.0, 'lag_p99': 0.0, 'lag_max': 0.0, 'stalls': self.stalls}
+        return {
+            'lag_p50': lags[int(0.5 * (len(lags) - 1))],
+            'lag_p99': lags[int(0.99 * (len(lags) - 1))],
+            'lag_max': lags[-1],
+            'stalls': self.stalls,
+        }
+
+    def collect(self) -> list[MetricFamily]:
+        snapshot = self.snapshot()
+        return [
+            gauge_family(
+                'event_loop_lag_seconds',
+                'Event loop lag over the recent window of the most lagging worker.',
+                [({'quantile': '0.5'}, snapshot['lag_p50']), ({'quantile': '0.99'}, snapshot['lag_p99']),
+                 ({'quantile': '1'}, snapshot['lag_max'])],
+                aggregate='max',
+            ),
+            counter_family(
+                'event_loop_stalls_total',
+                'Callbacks that blocked the event loop for longer than the slow callback threshold.',
+                [({}, self.stalls)],
+            ),
+        ]
+
+    async def __measure(self) -> None:
+        while True:
+            start = time.monotonic()
+            self.__heartbeat = start
+            await asyncio.sleep(self.interval)
+            self.__lags.append(max(time.monotonic() - start - self.interval, 0.0))
+
+    def __watch(self) -> None:
+        reported = 0.0
+        while not self.__stopped.wait(self.slow_callback / 2):
+            heartbeat = self.__heartbeat
+            blocked = time.monotonic() - heartbeat - self.interval
+            if blocked > self.slow_callback and heartbeat != reported:
+                reported = heartbeat
+                self.stalls += 1
+                self.__report(blocked)
+
+    def __report(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self.__loop_thread)  # noqa: SLF001
+        stack = ''.join(traceback.format_stack(frame)) if frame is not None else ''
+        task = asyncio.current_task(self.__loop) if self.__loop is not None else None
+        get_context = getattr(task, 'get_context', None)  # Task.get_context() is available from Python 3.12
+        # Log within a copy of the task context so the record carries its trace id; the
+        # context itself cannot be entered here while the loop thread is running in it
+        context = get_context().copy() if get_context is not None else contextvars.Context()
+        context.run(
+            self.__logger.warning,
+            'Event loop blocked',
+            blocked_ms=round(blocked * 1000, 1),
+            task=task.get_name() if task is not None else None,
+            stack=stack,
+        )
+
+
+loop_monitor = LoopMonitor(
+    logger,
+    interval=settings.LOOP_MONITOR_INTERVAL,
+    window=settings.LOOP_MONITOR_WINDOW,
+    slow_callback=settings.LOOP_MONITOR_SLOW_CALLBACK_MS / 1000,
+)
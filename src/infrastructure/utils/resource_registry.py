@@ -0,0 +1,57 @@
+import inspect
+import time
+from collections.abc import Awaitable, Callable
+from src.infrastructure.logger import Logger
+
+
+Hook = Callable[[], Awaitable[None] | None]
+
+
+class ResourceRegistry:
+    """
+    Starts and stops application resources from the lifespan.
+
+    Resources start one by one in registration order and stop in reverse
+    order. If a resource fails to start, the ones already started are stopped
+    before the error propagates; a failing stop is logged and the remaining
+    resources are still stopped.
+    """
+
+    def __init__(self, logger: Logger) -> None:
+        self.__logger = logger
+        self.__resources: list[tuple[str, Hook | None, Hook | None]] = []
+        self.__started: list[tuple[str, Hook | None]] = []
+        self.startup_times: dict[str, float] = {}
+
+    def register(self, name: str, start: Hook | None = None, stop: Hook | None = None) -> None:
+        self.__resources.append((name, start, stop))
+
+    async def start(self) -> None:
+        for name, start, stop in self.__resources:
+            began = time.perf_counter()
+            try:
+                if start is not None:
+                    await self.__call(start)
+            except Exception:
+                self.__logger.exception('Resource failed to start', resource=name)
+                await self.stop()
+                raise
+            self.__started.append((name, stop))
+            self.startup_times[name] = time.perf_counter() - began
+            self.__logger.debug('Resource started', resource=name, ms=round(self.startup_times[name] * 1000, 1))
+
+    async def stop(self) -> None:
+        while self.__started:
+            name, stop = self.__started.pop()
+            if stop is None:
+                continue
+            try:
+                await self.__call(stop)
+            except Exception:
+                self.__logger.exception('Resource failed to stop', resource=name)
+
+    @staticmethod
+    async def __call(hook: Hook) -> None:
+        result = hook()
+        if inspect.isawaitable(result):
+            await result
@@ -1,45 +1,128 @@
 import asyncio
+import contextlib
 import functools
+import random
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
 from typing import Callable, Any, Awaitable
+from src.application.domain.exceptions import CircuitOpenError
 from src.infrastructure.logger import Logger, logger
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+from src.infrastructure.utils.jitter import Jitter
+from src.settings import settings
+
+
+_deadline: ContextVar[float | None] = ContextVar('retry_deadline', default=None)
+
+
+def remaining_budget() -> float | None:
+    """Seconds left of the current retry budget, None outside of any budget"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def time_budget(seconds: float) -> Iterator[None]:
+    """
+    Limit the time all retries inside the block may spend.
+
+    Budgets only shrink: a nested budget never extends the one of the caller,
+    so retries nested in retries stop at the outermost deadline instead of
+    multiplying the total wait.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(deadline, current))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def backoff_delay(jitter: Jitter, attempt: int, delay: float, backoff: float, max_delay: float, previous: float) -> float:
+    """
+    Delay before the next attempt.
+
+    FULL picks uniformly between 0 and the exponential delay, DECORRELATED
+    between `delay` and three times the previous delay; both spread the
+    retries of many callers failing at once.
+    """
+    exponential = min(delay * backoff ** (attempt - 1), max_delay)
+    if jitter == Jitter.FULL:
+        return random.uniform(0, exponential)  # noqa: S311
+    if jitter == Jitter.DECORRELATED:
+        return min(random.uniform(delay, max(previous, delay) * 3), max_delay)  # noqa: S311
+    return exponential
 
 
 def retry(
     retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
+    *,
+    max_delay: float = 30.0,
+    jitter: Jitter = Jitter.FULL,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+    deadline: float | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
 
     """
-    Decorator for retrying an async function on any exception.
-    :param retries: Number of retries.
+    Decorator for retrying an async function on retryable exceptions.
+    :param retries: Number of attempts.
     :param delay: Initial delay between retries (in seconds).
     :param backoff: Multiplier to increase the delay after each failed retries.
+    :param max_delay: Upper bound of a single delay (in seconds).
+    :param jitter: Randomisation of the delays.
+    :param retry_on: Exceptions worth retrying; anything else is raised at once.
+    :param deadline: Time budget of all attempts (in seconds), RETRY_DEADLINE by default.
+    :param breaker: Circuit breaker of the called dependency; an open circuit fails fast.
     """
 
     def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
 
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            current_delay = delay
+            previous_delay = delay
             __logger: Logger = logger
 
             func_name = getattr(func, '__qualname__', getattr(func, '__name__', 'unknown_function'))
 
-            for attempt in range(1, retries + 1):
-                try:
-                    __logger.debug(f'Attempting {attempt} execution {func_name}')
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    __logger.debug(
-                        f'Error in {func_name}: {e} '
-                        f'(attempt {attempt} of {retries}). Retry in {current_delay:.1f} sec'
-                    )
-                    if attempt == retries:
-                        __logger.debug(f'All attempts for {func_name} exhausted.')
+            with time_budget(deadline if deadline is not None else settings.RETRY_DEADLINE):
+                for attempt in range(1, retries + 1):
+                    if breaker is not None:
+                        breaker.before_call()
+                    try:
+                        __logger.debug('Attempting %d execution %s', attempt, func_name)
+                        result = await func(*args, **kwargs)
+                    except CircuitOpenError:
+                        raise
+                    except retry_on as e:
+                        if breaker is not None:
+                            breaker.on_failure(e)
+                        current_delay = backoff_delay(jitter, attempt, delay, backoff, max_delay, previous_delay)
+                        previous_delay = current_delay
+                        budget = remaining_budget()
+                        __logger.debug(
+                            'Error in %s: %s (attempt %d of %d). Retry in %.1f sec',
+                            func_name, e, attempt, retries, current_delay,
+                        )
+                        if attempt == retries:
+                            __logger.debug('All attempts for %s exhausted.', func_name)
+                            raise
+                        if budget is not None and current_delay >= budget:
+                            __logger.debug('Retry budget for %s exhausted.', func_name)
+                            raise
+                        await asyncio.sleep(current_delay)
+                    except BaseException as e:
+                        if breaker is not None:
+                            breaker.on_failure(e)
                         raise
-                    await asyncio.sleep(current_delay)
-                    current_delay *= backoff
+                    else:
+                        if breaker is not None:
+                            breaker.on_success()
+                        return result
 
         return wrapper
 
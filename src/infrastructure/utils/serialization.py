@@ -0,0 +1,22 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON: bool = orjson is not None
+
+
+def json_dumps(value: Any) -> bytes:
+    """Encode to compact UTF-8 JSON, with orjson when it is installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,83 @@
+import asyncio
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
+
+
+T = TypeVar('T')
+
+KeyBuilder = str | Callable[..., str]
+
+
+def render_key(template: KeyBuilder, signature: inspect.Signature, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Key of a call: the template formatted with the bound arguments, or the callable's result"""
+    if callable(template):
+        return template(*args, **kwargs)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return template.format(**bound.arguments)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one execution.
+
+    The first caller starts the call in its own task; callers arriving while
+    it runs await the same task and get its result or exception. Waiting is
+    shielded: a cancelled caller does not cancel the call the others wait for.
+    The key is released when the call finishes, so later calls run again.
+    """
+
+    def __init__(self) -> None:
+        self.shared = 0
+        self.__inflight: dict[str, asyncio.Task[Any]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__inflight
+
+    def __len__(self) -> int:
+        return len(self.__inflight)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        task = self.__inflight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(func())
+            self.__inflight[key] = task
+            task.add_done_callback(functools.partial(self.__release, key))
+        return cast('T', await asyncio.shield(task))
+
+    def __release(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self.__inflight.get(key) is task:
+            del self.__inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled
+            task.exception()
+
+
+def singleflight(
+    key: KeyBuilder,
+    group: SingleFlight | None = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Decorator making concurrent calls with the same key share one execution.
+
+    :param key: Key template formatted with the call arguments (`'user:{user_id}'`)
+                or a callable receiving the same arguments as the function.
+    :param group: SingleFlight to use; each decorated function gets its own by default.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+        flight = group or SingleFlight()
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await flight.do(render_key(key, signature, args, kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.single_flight = flight  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
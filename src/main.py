@@ -1,28 +1,74 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
-from fastapi import FastAPI, Depends, HTTPException, APIRouter, status
-from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
-from fastapi.responses import HTMLResponse
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from src.application.domain.exceptions import ImmutableAttributeError, IncomparableObjectError, SealedClassError
+from fastapi import FastAPI, APIRouter
+from src.infrastructure.auth import revocation_store, token_service
+from src.infrastructure.cache import cache_service
+from src.infrastructure.database.context import database, pool_telemetry, replica_router
+from src.infrastructure.health import health_monitor, loop_lag_probe
 from src.infrastructure.logger import logger
-from src.presentation.handlers import immutable_attribute_error_handler, incomparable_object_error_handler, sealed_class_error_handler
-from src.presentation.middleware.timing import TimingMiddleware
-from src.presentation.middleware.trace_id import TraceIDMiddleware
+from src.infrastructure.mail import email_service
+from src.infrastructure.metrics import metrics_store, request_metrics
+from src.infrastructure.profiling import profile_store
+from src.infrastructure.rate_limit import rate_limit_backend
+from src.infrastructure.storage import storage
+from src.infrastructure.utils.circuit_breaker_registry import circuit_breakers
+from src.infrastructure.utils.hash import hash_executor
+from src.infrastructure.utils.loop_monitor import loop_monitor
+from src.infrastructure.utils.resource_registry import ResourceRegistry
+from src.presentation.docs import api_docs
+from src.presentation.handlers import problem_handler
+from src.presentation.middleware.profiling import ProfilingMiddleware
+from src.presentation.middleware.rate_limit import RateLimitMiddleware, combine_keys, key_functions
+from src.presentation.middleware.request_context import RequestContextMiddleware
+from src.presentation.responses import FastJSONResponse
+from src.presentation.routing.auth import auth_router
+from src.presentation.routing.docs import docs_router
+from src.presentation.routing.files import files_router
+from src.presentation.routing.health import health_router
+from src.presentation.routing.metrics import metrics_router
+from src.presentation.routing.profiles import profiles_router
 from src.settings import settings
 
 
+resources = ResourceRegistry(logger)
+if settings.METRICS_ENABLED:
+    resources.register('metrics', metrics_store.start, metrics_store.stop)
+resources.register('database', database.start, database.stop)
+resources.register('cache', cache_service.start, cache_service.stop)
+resources.register('rate_limit', stop=rate_limit_backend.close)
+resources.register('auth', token_service.start, token_service.stop)
+resources.register('hash_executor', stop=hash_executor.shutdown)
+resources.register('storage', stop=storage.close)
+if email_service is not None:
+    resources.register('email', email_service.start, email_service.stop)
+if settings.LOOP_MONITOR_ENABLED:
+    resources.register('loop_monitor', loop_monitor.start, loop_monitor.stop)
+    health_monitor.register('event_loop', loop_lag_probe(loop_monitor, settings.HEALTH_MAX_LOOP_LAG_MS / 1000))
+health_monitor.register('database', database.ping)
+if settings.CACHE_BACKEND == 'redis':
+    health_monitor.register('redis', cache_service.backend.ping, critical=False)
+if settings.AUTH_REVOCATION_BACKEND == 'redis':
+    # Authenticated requests fail closed without it
+    health_monitor.register('revocation_store', revocation_store.ping)
+resources.register('health', health_monitor.start, health_monitor.stop)
+
+
 @asynccontextmanager
 async def lifespan(_application: FastAPI) -> AsyncGenerator:
+    await resources.start()
     logger.info('API Started')
     yield
+    await resources.stop()
     logger.info('API Stopped')
+    logger.close()
 
 
 app: FastAPI = FastAPI(
     redoc_url=None,
     docs_url=None,
+    openapi_url=None,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     title='FastAPI Template',
     version='1.0.0',
     description='',
@@ -32,50 +78,50 @@ app: FastAPI = FastAPI(
     }
 )
 
-# Initialize HTTP Basic authentication
-security = HTTPBasic(description='Basic Authentication')
-
-# Function to verify user credentials
-async def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)) -> None:
-    """Validates the user's credentials using a hashed password."""
-    correct_username = settings.DOCS_USERNAME  # Username
-    correct_password = settings.DOCS_PASSWORD  # Password hash
-
-    if credentials.username != correct_username or not credentials.password == correct_password:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Incorrect username or password')
+if settings.METRICS_ENABLED:
+    metrics_store.register(pool_telemetry.collect)
+    metrics_store.register(replica_router.collect)
+    metrics_store.register(circuit_breakers.collect)
+    metrics_store.register(token_service.collect)
+    if settings.LOOP_MONITOR_ENABLED:
+        metrics_store.register(loop_monitor.collect)
+    if email_service is not None:
+        metrics_store.register(email_service.collect)
 
 app_router = APIRouter(prefix='/v1')
+app_router.include_router(auth_router)
+app_router.include_router(files_router)
 app.include_router(app_router)
+app.include_router(health_router)
+app.include_router(docs_router)
+resources.register('docs', lambda: api_docs.build(app))
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_router)
+if settings.PROFILING_ENABLED:
+    app.include_router(profiles_router)
 
-# Added middleware
-app.add_middleware(TraceIDMiddleware, logger=logger)
-app.add_middleware(TimingMiddleware, logger=logger)
+# Added middleware (the last added runs first)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        logger=logger,
+        store=profile_store,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        interval=settings.PROFILING_INTERVAL,
+    )
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        backend=rate_limit_backend,
+        limit=settings.RATE_LIMIT_REQUESTS,
+        window=settings.RATE_LIMIT_WINDOW,
+        key_function=combine_keys(*(key_functions[key.strip()] for key in settings.RATE_LIMIT_KEYS.split(','))),
+    )
+app.add_middleware(RequestContextMiddleware, logger=logger, metrics=request_metrics if settings.METRICS_ENABLED else None)
 
 # Added exception handlers
-app.add_exception_handler(ImmutableAttributeError, immutable_attribute_error_handler)
-app.add_exception_handler(IncomparableObjectError, incomparable_object_error_handler)
-app.add_exception_handler(SealedClassError, sealed_class_error_handler)
-
+problem_handler.install(app)
 
-@app.get('/docs', include_in_schema=False)
-async def custom_swagger_ui_html(_credentials: HTTPBasicCredentials = Depends(verify_credentials)) -> HTMLResponse:
-    """Custom Swagger documentation, protected with basic authentication."""
-    return get_swagger_ui_html(
-        openapi_url=getattr(app, 'openapi_url', '/openapi.json'),
-        title=getattr(app, 'title', 'FastAPI') + ' - Swagger UI',
-        oauth2_redirect_url=getattr(app, 'swagger_ui_oauth2_redirect_url', None),
-        swagger_js_url='https://unpkg.com/swagger-ui-dist@5/swagger-ui-bundle.js',
-        swagger_css_url='https://unpkg.com/swagger-ui-dist@5/swagger-ui.css',
-    )
-
-@app.get('/redoc', include_in_schema=False)
-async def custom_redoc_html(_credentials: HTTPBasicCredentials = Depends(verify_credentials)) -> HTMLResponse:
-    """Custom ReDoc documentation, protected with basic authentication."""
-    return get_redoc_html(
-        openapi_url=getattr(app, 'openapi_url', '/openapi.json'),
-        title=getattr(app, 'title', 'FastAPI') + ' - ReDoc',
-        redoc_js_url='https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js',
-    )
 
 @app.get('/ping')
 async def ping() -> dict[str, str]:
@@ -0,0 +1,5 @@
+from pathlib import Path
+from src.presentation.docs.api_docs import ApiDocs
+
+
+api_docs = ApiDocs(Path(__file__).resolve().parent / 'static')
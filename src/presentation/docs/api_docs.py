@@ -0,0 +1,88 @@
+import asyncio
+from pathlib import Path
+from fastapi import FastAPI
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from src.infrastructure.utils.serialization import json_dumps
+from src.presentation.responses import StaticContent
+
+
+_MEDIA_TYPES = {
+    '.js': 'text/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.png': 'image/png',
+    '.txt': 'text/plain; charset=utf-8',
+}
+
+
+class ApiDocs:
+    """
+    Swagger UI, ReDoc and the OpenAPI schema, built once per worker.
+
+    build() runs from the lifespan, when every route is registered: it
+    renders the schema and both pages and reads the bundled Swagger UI and
+    ReDoc files from `assets`, all as StaticContent compressed on a worker
+    thread. Nothing is loaded from a CDN. Pages and the schema are
+    revalidated on every visit (a 304 when nothing changed); the assets are
+    linked with their digest in the query string and cached for a year.
+    """
+
+    def __init__(
+        self,
+        assets: Path,
+        *,
+        openapi_url: str = '/openapi.json',
+        assets_url: str = '/docs/static',
+        page_cache_control: str = 'private, no-cache',
+        asset_cache_control: str = 'private, max-age=31536000, immutable',
+    ) -> None:
+        self.assets = assets
+        self.openapi_url = openapi_url
+        self.assets_url = assets_url
+        self.page_cache_control = page_cache_control
+        self.asset_cache_control = asset_cache_control
+        self.__pages: dict[str, StaticContent] = {}
+        self.__assets: dict[str, StaticContent] = {}
+
+    async def build(self, app: FastAPI) -> None:
+        self.__assets = await asyncio.to_thread(self.__load_assets)
+        self.__pages = await asyncio.to_thread(self.__render_pages, app)
+
+    def page(self, name: str) -> StaticContent:
+        """`swagger`, `redoc` or `openapi`"""
+        return self.__pages[name]
+
+    def asset(self, name: str) -> StaticContent | None:
+        return self.__assets.get(name)
+
+    def __load_assets(self) -> dict[str, StaticContent]:
+        return {
+            path.name: StaticContent(path.read_bytes(), _MEDIA_TYPES[path.suffix], self.asset_cache_control)
+            for path in sorted(self.assets.iterdir())
+            if path.suffix in _MEDIA_TYPES
+        }
+
+    def __render_pages(self, app: FastAPI) -> dict[str, StaticContent]:
+        swagger_ui = get_swagger_ui_html(
+            openapi_url=self.openapi_url,
+            title=f'{app.title} - Swagger UI',
+            oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
+            swagger_js_url=self.__asset_url('swagger-ui-bundle.js'),
+            swagger_css_url=self.__asset_url('swagger-ui.css'),
+            swagger_favicon_url=self.__asset_url('favicon-32x32.png'),
+        )
+        redoc = get_redoc_html(
+            openapi_url=self.openapi_url,
+            title=f'{app.title} - ReDoc',
+            redoc_js_url=self.__asset_url('redoc.standalone.js'),
+            redoc_favicon_url=self.__asset_url('favicon-32x32.png'),
+            with_google_fonts=False,
+        )
+        html = 'text/html; charset=utf-8'
+        return {
+            'swagger': StaticContent(bytes(swagger_ui.body), html, self.page_cache_control),
+            'redoc': StaticContent(bytes(redoc.body), html, self.page_cache_control),
+            'openapi': StaticContent(json_dumps(app.openapi()), 'application/json', self.page_cache_control),
+        }
+
+    def __asset_url(self, name: str) -> str:
+        return f'{self.assets_url}/{name}?v={self.__assets[name].digest[:12]}'
@@ -1,3 +1,23 @@
-from src.presentation.handlers.sealed_class_error_handler import sealed_class_error_handler
-from src.presentation.handlers.immutable_attribute_error_handler import immutable_attribute_error_handler
-from src.presentation.handlers.incomparable_object_error_handler import incomparable_object_error_handler
+from src.application.domain.exceptions import (
+    ImmutableAttributeError,
+    IncomparableObjectError,
+    InvalidTokenError,
+    RateLimitExceededError,
+    SealedClassError,
+    ServiceUnavailableError,
+)
+from src.application.domain.exceptions.base import ApplicationException
+from src.presentation.handlers.problem_handler import ProblemHandler
+from src.presentation.handlers.rate_limit_headers import rate_limit_headers
+from src.presentation.handlers.retry_after_headers import retry_after_headers
+from src.presentation.handlers.bearer_challenge_headers import bearer_challenge_headers
+
+
+problem_handler = ProblemHandler()
+problem_handler.register(ApplicationException)
+problem_handler.register(ServiceUnavailableError, 'Service unavailable', headers=retry_after_headers)
+problem_handler.register(InvalidTokenError, headers=bearer_challenge_headers)
+problem_handler.register(RateLimitExceededError, headers=rate_limit_headers)
+problem_handler.register(ImmutableAttributeError, 'Error in data types')
+problem_handler.register(IncomparableObjectError, 'Error in data types')
+problem_handler.register(SealedClassError, 'Error in data types')
@@ -0,0 +1,6 @@
+from src.application.domain.exceptions import InvalidTokenError
+
+
+def bearer_challenge_headers(exc: InvalidTokenError) -> dict[str, str]:
+    description = exc.message.replace('\\', '\\\\').replace('"', '\\"')
+    return {'WWW-Authenticate': f'Bearer error="invalid_token", error_description="{description}"'}
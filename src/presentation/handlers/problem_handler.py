@@ -0,0 +1,86 @@
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from src.application.domain.enums.status_code import StatusCode
+from src.infrastructure.logger.logger import trace_id_var
+from src.infrastructure.utils.serialization import json_dumps
+
+
+HeadersFactory = Callable[[Any], dict[str, str]]
+
+
+class ProblemHandler:
+    """
+    Single exception handler that renders domain exceptions as problem details (RFC 9457).
+
+    Exception classes are registered with a title and, optionally, a function
+    returning extra response headers; an exception is handled by the closest
+    registered class in its MRO. The exception's `status_code` becomes the
+    HTTP status and `message` the `detail`, the trace id of the request is
+    added as `trace_id`.
+
+    Everything but the trace id is encoded once per (exception class, message)
+    and kept in an LRU of `max_bodies` entries, so repeated errors, e.g. a
+    burst of 503s during an outage, only cost a dictionary lookup.
+    """
+
+    media_type = 'application/problem+json'
+
+    def __init__(self, max_bodies: int = 1024) -> None:
+        self.__problems: dict[type[Exception], tuple[str | None, HeadersFactory | None]] = {}
+        self.__resolved: dict[type[Exception], tuple[str | None, HeadersFactory | None]] = {}
+        self.__encode = lru_cache(maxsize=max_bodies)(self.__encode_body)
+
+    def register(
+        self,
+        exc_class: type[Exception],
+        title: str | None = None,
+        *,
+        headers: HeadersFactory | None = None,
+    ) -> None:
+        """
+        Handle `exc_class` and its subclasses.
+
+        `title` defaults to the name of the status code; `headers`
+        receives the exception and returns headers to add to the response.
+        """
+        self.__problems[exc_class] = (title, headers)
+        self.__resolved.clear()
+        self.__encode.cache_clear()
+
+    def install(self, app: FastAPI) -> None:
+        for exc_class in self.__problems:
+            app.add_exception_handler(exc_class, self.handle)
+
+    async def handle(self, _request: Request, exc: Exception) -> Response:
+        return self.render(exc)
+
+    def render(self, exc: Exception) -> Response:
+        """Problem details response of a registered exception, for code running outside the exception handlers"""
+        exc_class = type(exc)
+        status_code, prefix = self.__encode(exc_class, exc.status_code, exc.message)  # type: ignore[attr-defined,arg-type]
+        body = prefix + json_dumps(trace_id_var.get()) + b'}'
+        _, headers = self.__resolve(exc_class)
+        return Response(body, status_code, headers(exc) if headers is not None else None, self.media_type)
+
+    def __resolve(self, exc_class: type[Exception]) -> tuple[str | None, HeadersFactory | None]:
+        problem = self.__resolved.get(exc_class)
+        if problem is None:
+            problem = next(self.__problems[base] for base in exc_class.__mro__ if base in self.__problems)
+            self.__resolved[exc_class] = problem
+        return problem
+
+    def __encode_body(self, exc_class: type[Exception], status: StatusCode, message: str) -> tuple[int, bytes]:
+        """HTTP status and the body up to the trace id value, which changes on every request"""
+        status_code = int(status.value)
+        title, _ = self.__resolve(exc_class)
+        problem = {
+            'type': 'about:blank',
+            'title': title or status.name.replace('_', ' ').title(),
+            'status': status_code,
+            'detail': message,
+        }
+        return status_code, json_dumps(problem)[:-1] + b',"trace_id":'
+
@@ -0,0 +1,13 @@
+import math
+from src.application.domain.exceptions import RateLimitExceededError
+
+
+def rate_limit_headers(exc: RateLimitExceededError) -> dict[str, str]:
+    # Retry-After and the reset use the same value so clients can rely on either
+    retry_after = str(math.ceil(exc.retry_after))
+    return {
+        'Retry-After': retry_after,
+        'X-RateLimit-Limit': str(exc.limit),
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Reset': retry_after,
+    }
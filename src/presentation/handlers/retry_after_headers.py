@@ -0,0 +1,6 @@
+import math
+from src.application.domain.exceptions import ServiceUnavailableError
+
+
+def retry_after_headers(exc: ServiceUnavailableError) -> dict[str, str]:
+    return {'Retry-After': str(max(math.ceil(exc.retry_after), 1))}
@@ -0,0 +1,113 @@
+import asyncio
+import random
+import time
+import uuid
+from typing import Any
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.logger import Logger
+from src.infrastructure.logger.logger import trace_id_var
+from src.infrastructure.profiling import ProfileStore
+from src.presentation.security import basic_credentials, docs_credentials_valid
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that profiles single requests on demand.
+
+    A request is profiled when it carries an `X-Profile` header and the docs
+    credentials (as the header value, `X-Profile: Basic <base64>`, or in the
+    `Authorization` header), or when it is picked by `sample_rate`. The
+    request runs under pyinstrument's statistical profiler in async mode, so
+    only this request's task is sampled, and the speedscope profile is saved
+    under the trace id plus a random suffix, returned in the `X-Profile-ID`
+    header.
+
+    Requests that are not profiled only pay for one header scan. One request
+    per worker is profiled at a time; others are served normally meanwhile.
+    """
+
+    header_name = b'x-profile'
+    response_header = b'x-profile-id'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: Logger,
+        store: ProfileStore,
+        *,
+        sample_rate: float = 0.0,
+        interval: float = 0.001,
+    ) -> None:
+        from pyinstrument import Profiler  # noqa: PLC0415 - pyinstrument is optional
+
+        self.app = app
+        self.logger = logger
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.__profiler_class = Profiler
+        self.__active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or self.__active or not self.__requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self.__active = True
+        try:
+            await self.__profile(scope, receive, send)
+        finally:
+            self.__active = False
+
+    def __requested(self, scope: Scope) -> bool:
+        if self.sample_rate and random.random() < self.sample_rate:  # noqa: S311
+            return True
+
+        profile = authorization = None
+        for name, value in scope['headers']:
+            if name == self.header_name:
+                profile = value
+            elif name == b'authorization':
+                authorization = value
+        if profile is None:
+            return False
+        credentials = basic_credentials(profile) or (basic_credentials(authorization) if authorization else None)
+        if credentials is None or not docs_credentials_valid(*credentials):
+            self.logger.warning('Profiling request rejected', path=scope['path'])
+            return False
+        return True
+
+    async def __profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # The trace id may come from the client: the random suffix keeps it from
+        # naming, and so overwriting, a profile that already exists
+        trace_id = trace_id_var.get()
+        suffix = uuid.uuid4().hex
+        name = f'{trace_id[:64]}-{suffix}' if self.store.valid_name(trace_id) and trace_id != 'N/A' else suffix
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                message['headers'] = [*message.get('headers', ()), (self.response_header, name.encode())]
+            await send(message)
+
+        profiler = self.__profiler_class(interval=self.interval, async_mode='enabled')
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            duration = time.perf_counter() - start
+            try:
+                await asyncio.to_thread(self.__save, profiler, name)
+            except Exception as e:  # noqa: BLE001
+                self.logger.warning('Request profile could not be saved', profile=name, error=e)
+            else:
+                self.logger.info(
+                    'Request profiled', method=scope['method'], path=scope['path'], profile=name,
+                    ms=round(duration * 1000, 1),
+                )
+
+    def __save(self, profiler: Any, name: str) -> None:
+        from pyinstrument.renderers import SpeedscopeRenderer  # noqa: PLC0415 - pyinstrument is optional
+
+        self.store.save(name, profiler.output(SpeedscopeRenderer()))
@@ -0,0 +1,116 @@
+from collections.abc import Awaitable, Callable, Iterable
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.application.domain.exceptions import RateLimitExceededError
+from src.application.domain.exceptions.base import ApplicationException
+from src.infrastructure import auth
+from src.infrastructure.rate_limit import RateLimitBackend
+from src.presentation.handlers import problem_handler
+from src.settings import settings
+
+
+KeyFunction = Callable[[Scope], Awaitable[str]]
+
+
+def _header(scope: Scope, name: bytes) -> bytes | None:
+    for header_name, value in scope['headers']:
+        if header_name == name:
+            return bytes(value)
+    return None
+
+
+def _client_ip(scope: Scope, trusted_proxies: int) -> str:
+    if trusted_proxies > 0:
+        hops = [
+            hop.strip()
+            for header_name, value in scope['headers'] if header_name == b'x-forwarded-for'
+            for hop in bytes(value).split(b',')
+        ]
+        hops = [hop for hop in hops if hop]
+        if hops:
+            return hops[max(len(hops) - trusted_proxies, 0)].decode('latin-1')
+    client = scope.get('client')
+    return client[0] if client else 'unknown'
+
+
+async def client_ip_key(scope: Scope) -> str:
+    """
+    Client address; behind RATE_LIMIT_TRUSTED_PROXIES proxies, the X-Forwarded-For hop
+    appended by the outermost one (anything to its left is chosen by the client)
+    """
+    return f'ip:{_client_ip(scope, settings.RATE_LIMIT_TRUSTED_PROXIES)}'
+
+
+async def auth_subject_key(scope: Scope) -> str:
+    """Subject of the verified access token; requests without a valid one fall back to the client address"""
+    authorization = _header(scope, b'authorization')
+    if authorization:
+        scheme, _, token = authorization.decode('latin-1').partition(' ')
+        if scheme.lower() == 'bearer' and token:
+            try:
+                claims = await auth.token_service.verify(token.strip())
+            except ApplicationException:
+                pass
+            else:
+                return f'subject:{claims.subject}'
+    return await client_ip_key(scope)
+
+
+async def route_key(scope: Scope) -> str:
+    return f'{scope["method"]} {scope["path"]}'
+
+
+key_functions: dict[str, KeyFunction] = {
+    'ip': client_ip_key,
+    'subject': auth_subject_key,
+    'route': route_key,
+}
+
+
+def combine_keys(*functions: KeyFunction) -> KeyFunction:
+    """Key function limiting every combination of the given keys separately"""
+    if len(functions) == 1:
+        return functions[0]
+
+    async def key_function(scope: Scope) -> str:
+        return '|'.join([await function(scope) for function in functions])
+
+    return key_function
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI rate limiter.
+
+    Every request not in the excluded paths is counted against `limit` requests
+    per `window` seconds for the key produced by `key_function`. Rejected
+    requests get 429 with `Retry-After` and `X-RateLimit-*` headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: RateLimitBackend,
+        limit: int = settings.RATE_LIMIT_REQUESTS,
+        window: float = settings.RATE_LIMIT_WINDOW,
+        key_function: KeyFunction = client_ip_key,
+        excluded_paths: Iterable[str] | None = None,
+    ) -> None:
+        self.app = app
+        self.backend = backend
+        self.limit = limit
+        self.window = window
+        self.key_function = key_function
+        self.excluded_paths = frozenset(settings.EXCLUDED_PATHS if excluded_paths is None else excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['path'] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        result = await self.backend.hit(await self.key_function(scope), self.limit, self.window)
+        if result.allowed:
+            await self.app(scope, receive, send)
+            return
+
+        response = problem_handler.render(RateLimitExceededError(result.limit, result.retry_after))
+        await response(scope, receive, send)
@@ -0,0 +1,104 @@
+import functools
+import time
+import uuid
+from collections.abc import Iterable
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.logger import Logger, lazy
+from src.infrastructure.logger.logger import trace_id_var
+from src.infrastructure.metrics import RequestMetrics
+from src.settings import settings
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that sets the request trace id and measures request time.
+
+    The trace id is taken from the `X-Trace-ID` request header (or generated),
+    stored in the logger context and echoed in the response headers. Requests to
+    excluded paths are only timed. When `metrics` is given, the duration is
+    recorded per route template, method and status.
+    """
+
+    header_name = b'x-trace-id'
+    unmatched_route = '<unmatched>'
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: Logger,
+        excluded_paths: Iterable[str] | None = None,
+        metrics: RequestMetrics | None = None,
+    ) -> None:
+        self.app = app
+        self.logger = logger
+        self.metrics = metrics
+        self.excluded_paths = frozenset(settings.EXCLUDED_PATHS if excluded_paths is None else excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        traced = scope['path'] not in self.excluded_paths
+
+        if traced:
+            trace_id = self._get_trace_id(scope)
+            trace_header = (self.header_name, trace_id.encode('latin-1'))
+            token = trace_id_var.set(trace_id)
+            # Built once, on the first line that is emitted, for the message and the field alike
+            url = lazy(functools.cache(lambda: str(URL(scope=scope))))
+            self.logger.info(
+                'Request started: %s %s - TraceID: %s', scope['method'], url, trace_id, method=scope['method'], url=url
+            )
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                if traced:
+                    message['headers'] = [*message.get('headers', ()), trace_header]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+            if traced:
+                self.logger.info(
+                    'Request finished: %s %s - TraceID: %s - Status: %s',
+                    scope['method'],
+                    url,
+                    trace_id,
+                    status_code,
+                    method=scope['method'],
+                    url=url,
+                    status=status_code,
+                )
+        finally:
+            self._record_timing(scope, status_code, start_time)
+            if traced:
+                trace_id_var.reset(token)
+
+    def _get_trace_id(self, scope: Scope) -> str:
+        for name, value in scope['headers']:
+            if name == self.header_name and value:
+                trace_id: str = value.decode('latin-1')
+                return trace_id
+        return str(uuid.uuid4())
+
+    def _record_timing(self, scope: Scope, status_code: int, start_time: float) -> None:
+        duration = time.perf_counter() - start_time  # seconds
+        if self.metrics is not None:
+            # The router stores the matched route in the scope; using its template
+            # instead of the raw path keeps the label cardinality bounded.
+            route = getattr(scope.get('route'), 'path_format', self.unmatched_route)
+            self.metrics.observe(route, scope['method'], status_code, duration)
+
+        self.logger.debug(
+            'Request timing',
+            method=scope['method'],
+            path=scope['path'],
+            status=status_code,
+            duration_ms=round(duration * 1000, 2),
+        )
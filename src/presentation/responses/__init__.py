@@ -0,0 +1,3 @@
+from src.presentation.responses.fast_json_response import FastJSONResponse
+from src.presentation.responses.stored_file_response import stored_file_response
+from src.presentation.responses.static_content import StaticContent
@@ -0,0 +1,21 @@
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json, to_jsonable_python
+from src.infrastructure.utils.serialization import HAS_ORJSON, orjson
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson, or pydantic-core when orjson is not installed.
+
+    Content that orjson does not know natively (pydantic models, Decimal, ...)
+    is converted by pydantic-core; already encoded JSON bytes are sent as they
+    are.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if HAS_ORJSON:
+            return orjson.dumps(content, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+        return to_json(content)
@@ -0,0 +1,79 @@
+import gzip
+import hashlib
+from fastapi import Request, Response
+from src.application.domain.enums.status_code import StatusCode
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+def _encoding_qualities(accept_encoding: str) -> dict[str, float]:
+    """q-value of every coding of an `Accept-Encoding` header: 1 when not given, 0 when malformed"""
+    qualities = {}
+    for item in accept_encoding.lower().split(','):
+        coding, *parameters = item.split(';')
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip()] = quality
+    return qualities
+
+
+class StaticContent:
+    """
+    A body that never changes once built, served from memory.
+
+    The body is compressed once, with gzip and with brotli when the `brotli`
+    package is installed, and each request gets the smallest variant its
+    `Accept-Encoding` allows. Every variant has a strong ETag derived from
+    the SHA-256 of the body; a request whose `If-None-Match` lists one of
+    them gets 304 without a body.
+    """
+
+    def __init__(self, body: bytes, media_type: str, cache_control: str = 'no-cache', min_size: int = 512) -> None:
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+        self.__variants: dict[str, tuple[bytes, str]] = {'identity': (body, f'"{self.digest}"')}
+        if len(body) >= min_size:
+            if brotli is not None:
+                self.__add('br', brotli.compress(body, quality=9))
+            self.__add('gzip', gzip.compress(body, 9, mtime=0))
+        self.__etags = frozenset(etag for _, etag in self.__variants.values())
+
+    def respond(self, request: Request) -> Response:
+        coding = self.__negotiate(request.headers.get('accept-encoding', ''))
+        body, etag = self.__variants[coding]
+        headers = {'ETag': etag, 'Cache-Control': self.cache_control, 'Vary': 'Accept-Encoding'}
+        if self.__matches(request.headers.get('if-none-match')):
+            return Response(status_code=int(StatusCode.NOT_MODIFIED.value), headers=headers)
+        if coding != 'identity':
+            headers['Content-Encoding'] = coding
+        return Response(body, media_type=self.media_type, headers=headers)
+
+    def __add(self, coding: str, body: bytes) -> None:
+        if len(body) < len(self.__variants['identity'][0]):
+            self.__variants[coding] = (body, f'"{self.digest}-{coding}"')
+
+    def __negotiate(self, accept_encoding: str) -> str:
+        if len(self.__variants) > 1 and accept_encoding:
+            qualities = _encoding_qualities(accept_encoding)
+            for coding in ('br', 'gzip'):  # smallest first
+                # `*` stands for the codings not listed, so it cannot bring back one excluded with q=0
+                if coding in self.__variants and qualities.get(coding, qualities.get('*', 0.0)) > 0:
+                    return coding
+        return 'identity'
+
+    def __matches(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+        return any(tag.strip().removeprefix('W/') in self.__etags for tag in if_none_match.split(','))
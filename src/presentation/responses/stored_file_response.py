@@ -0,0 +1,60 @@
+import re
+from fastapi import status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from src.application.contracts.i_storage import IStorage
+from src.application.domain.objects.stored_file import StoredFile
+
+
+_RANGE = re.compile(r'bytes=(\d*)-(\d*)')
+
+
+def _requested_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    First and last byte of a single `bytes=` range, clipped to the file.
+
+    None means the whole file (no header, a malformed one or several ranges,
+    which a server may ignore); an empty range (first > last) is not
+    satisfiable.
+    """
+    match = _RANGE.fullmatch(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        return max(size - int(last), 0), size - 1 if int(last) else -1
+    if last and int(last) < int(first):
+        return None
+    return int(first), min(int(last), size - 1) if last else size - 1
+
+
+def stored_file_response(storage: IStorage, stored: StoredFile, range_header: str | None = None) -> Response:
+    """
+    Response with a stored file, honouring the `Range` header.
+
+    Files on the local disk go through FileResponse, which handles ranges and
+    sends whole files with the `http.response.pathsend` ASGI extension when
+    the server supports it (granian does), so the server sends the file
+    itself instead of Python copying it chunk by chunk. Other backends stream
+    the requested bytes from the storage.
+    """
+    path = storage.local_path(stored.key)
+    headers = {'accept-ranges': 'bytes'}
+    if stored.sha256 is not None:
+        headers['etag'] = f'"{stored.sha256}"'
+    if path is not None:
+        return FileResponse(path, headers=headers, media_type=stored.content_type)
+
+    requested = _requested_range(range_header, stored.size)
+    if requested is None:
+        headers['content-length'] = str(stored.size)
+        return StreamingResponse(storage.read(stored.key), headers=headers, media_type=stored.content_type)
+    first, last = requested
+    if first > last:
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers={'content-range': f'bytes */{stored.size}'})
+    headers['content-range'] = f'bytes {first}-{last}/{stored.size}'
+    headers['content-length'] = str(last - first + 1)
+    return StreamingResponse(
+        storage.read(stored.key, first, last), status_code=status.HTTP_206_PARTIAL_CONTENT, headers=headers, media_type=stored.content_type
+    )
@@ -0,0 +1,61 @@
+import secrets
+from fastapi import APIRouter, Depends, Response, status
+from src.application.contracts.i_hash_service import IHashService
+from src.application.contracts.i_token_service import ITokenService
+from src.application.domain.exceptions import InvalidCredentialsError
+from src.application.domain.objects.token_claims import TokenClaims
+from src.infrastructure.auth import get_token_service
+from src.infrastructure.utils.hash import get_hash_service
+from src.presentation.responses import FastJSONResponse
+from src.presentation.schemas import LoginSchema, RefreshTokenSchema, TokenPairSchema
+from src.presentation.security import current_claims
+from src.settings import settings
+
+
+auth_router = APIRouter(prefix='/auth', tags=['Auth'])
+
+
+@auth_router.post('/login', response_model=TokenPairSchema)
+async def login(
+    body: LoginSchema,
+    hashes: IHashService = Depends(get_hash_service),
+    tokens: ITokenService = Depends(get_token_service),
+) -> FastJSONResponse:
+    """
+    Log in with the account of AUTH_USERNAME and AUTH_PASSWORD_HASH.
+
+    Replace the check with a lookup of your users. The password is verified
+    for unknown usernames as well, so both fail in the same time.
+    """
+    if settings.AUTH_USERNAME is None or settings.AUTH_PASSWORD_HASH is None:
+        raise InvalidCredentialsError
+    username_valid = secrets.compare_digest(body.username.encode(), settings.AUTH_USERNAME.encode())
+    password_valid = await hashes.verify(settings.AUTH_PASSWORD_HASH, body.password)
+    if not (username_valid and password_valid):
+        raise InvalidCredentialsError
+    pair = tokens.issue(body.username)
+    return TokenPairSchema.respond(TokenPairSchema.model_validate(pair))
+
+
+@auth_router.post('/refresh', response_model=TokenPairSchema)
+async def refresh_tokens(
+    body: RefreshTokenSchema,
+    tokens: ITokenService = Depends(get_token_service),
+) -> FastJSONResponse:
+    """
+    Exchange a refresh token for a new token pair.
+
+    A refresh token works once; presenting it again revokes the session.
+    """
+    pair = await tokens.refresh(body.refresh_token)
+    return TokenPairSchema.respond(TokenPairSchema.model_validate(pair))
+
+
+@auth_router.post('/logout', status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+async def logout(
+    claims: TokenClaims = Depends(current_claims),
+    tokens: ITokenService = Depends(get_token_service),
+) -> Response:
+    """Revoke every token of the current session."""
+    await tokens.revoke(claims, session=True)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
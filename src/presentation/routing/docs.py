@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from src.presentation.docs import api_docs
+from src.presentation.security import verify_credentials
+
+
+docs_router = APIRouter(include_in_schema=False, dependencies=[Depends(verify_credentials)])
+
+
+@docs_router.get('/docs')
+async def swagger_ui(request: Request) -> Response:
+    """Swagger documentation, protected with basic authentication."""
+    return api_docs.page('swagger').respond(request)
+
+
+@docs_router.get('/redoc')
+async def redoc(request: Request) -> Response:
+    """ReDoc documentation, protected with basic authentication."""
+    return api_docs.page('redoc').respond(request)
+
+
+@docs_router.get('/openapi.json')
+async def openapi_schema(request: Request) -> Response:
+    return api_docs.page('openapi').respond(request)
+
+
+@docs_router.get('/docs/static/{name}')
+async def docs_asset(name: str, request: Request) -> Response:
+    """Bundled Swagger UI and ReDoc files."""
+    asset = api_docs.asset(name)
+    if asset is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return asset.respond(request)
@@ -0,0 +1,114 @@
+import asyncio
+import csv
+import io
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any
+import anyio
+from sqlalchemy import Row, Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from src.infrastructure.database.context import read_session_maker
+from src.infrastructure.logger import logger
+from src.infrastructure.utils.serialization import json_dumps
+from src.presentation.schemas.export_format import ExportFormat
+
+
+class _NdjsonEncoder:
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.__columns = tuple(columns)
+        self.__buffer = bytearray()
+
+    def header(self) -> bytes:
+        return b''
+
+    def encode(self, rows: Sequence[Row[Any]]) -> bytes:
+        buffer = self.__buffer
+        buffer.clear()
+        for row in rows:
+            buffer += json_dumps(dict(zip(self.__columns, row, strict=True)))
+            buffer += b'\n'
+        return bytes(buffer)
+
+
+class _CsvEncoder:
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.__columns = columns
+        self.__buffer = io.StringIO()
+        self.__writer = csv.writer(self.__buffer)
+
+    def header(self) -> bytes:
+        return self.encode([self.__columns])
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        self.__buffer.seek(0)
+        self.__buffer.truncate()
+        self.__writer.writerows(rows)
+        return self.__buffer.getvalue().encode()
+
+
+async def stream_rows(
+    statement: Select[Any],
+    export_format: ExportFormat,
+    *,
+    session_maker: async_sessionmaker[AsyncSession] = read_session_maker,
+    chunk_size: int = 1000,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Encode the rows of `statement` chunk by chunk.
+
+    Rows come from a server-side cursor `chunk_size` at a time and the next
+    chunk is fetched only after the previous one was sent, so memory use is
+    bounded by one chunk. The statement should select columns, e.g.
+    `select(*User.__table__.columns)`; column names become NDJSON keys and the
+    CSV header.
+    """
+    async with session_maker() as session:
+        result = await session.stream(statement.execution_options(yield_per=chunk_size))
+        # Plain str: column names are quoted_name, a str subclass orjson rejects as a key
+        columns = [str(key) for key in result.keys()]  # noqa: SIM118 - Result is not a dict
+        encoder = _NdjsonEncoder(columns) if export_format is ExportFormat.NDJSON else _CsvEncoder(columns)
+        rows = 0
+        try:
+            if header := encoder.header():
+                yield header
+            async for partition in result.partitions():
+                yield encoder.encode(partition)
+                rows += len(partition)
+        except (GeneratorExit, asyncio.CancelledError):
+            logger.info('Export cancelled', rows=rows)
+            raise
+        finally:
+            # Closing the cursor and the session stops the query when the client
+            # went away mid-stream; shielded as the response may be cancelled
+            with anyio.CancelScope(shield=True):
+                await result.close()
+                await session.close()
+
+
+class ExportResponse(StreamingResponse):
+    """StreamingResponse that closes its row stream as soon as the response ends, even on disconnect"""
+
+    body_iterator: AsyncGenerator[bytes, None]
+
+    def __init__(
+        self,
+        statement: Select[Any],
+        export_format: ExportFormat = ExportFormat.NDJSON,
+        *,
+        filename: str | None = None,
+        session_maker: async_sessionmaker[AsyncSession] = read_session_maker,
+        chunk_size: int = 1000,
+    ) -> None:
+        headers = {'Content-Disposition': f'attachment; filename="{filename}"'} if filename else None
+        super().__init__(
+            stream_rows(statement, export_format, session_maker=session_maker, chunk_size=chunk_size),
+            headers=headers,
+            media_type=export_format.media_type,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.body_iterator.aclose()
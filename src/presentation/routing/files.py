@@ -0,0 +1,83 @@
+import hashlib
+import mimetypes
+import uuid
+from fastapi import APIRouter, Depends, Request, Response, status
+from src.application.contracts.i_storage import IStorage
+from src.application.domain.exceptions import PayloadTooLargeError, StoredFileNotFoundError
+from src.application.domain.objects.token_claims import TokenClaims
+from src.infrastructure.storage import get_storage
+from src.presentation.responses import FastJSONResponse, stored_file_response
+from src.presentation.schemas import StoredFileSchema
+from src.presentation.security import current_claims
+from src.settings import settings
+
+
+files_router = APIRouter(prefix='/files', tags=['Files'])
+
+_BINARY_BODY = {
+    'requestBody': {
+        'required': True,
+        'content': {'application/octet-stream': {'schema': {'type': 'string', 'format': 'binary'}}},
+    },
+}
+
+
+def _owned_key(claims: TokenClaims, key: str) -> str:
+    """Storage key of `key` under the caller's own prefix; a key is a single path segment, so it cannot leave it"""
+    return f'{hashlib.sha256(claims.subject.encode()).hexdigest()[:32]}/{key}'
+
+
+@files_router.post(
+    '',
+    status_code=status.HTTP_201_CREATED,
+    response_model=StoredFileSchema,
+    openapi_extra=_BINARY_BODY,
+)
+async def upload_file(
+    request: Request,
+    claims: TokenClaims = Depends(current_claims),
+    storage: IStorage = Depends(get_storage),
+) -> FastJSONResponse:
+    """
+    Store the raw request body as a new file of the caller.
+
+    The body is streamed to the storage as it arrives and the upload is
+    rejected (413) as soon as it passes MAX_FILE_SIZE; the `Content-Type`
+    of the request becomes the type of the file.
+    """
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > settings.MAX_FILE_SIZE:
+        raise PayloadTooLargeError(settings.MAX_FILE_SIZE)
+    content_type = request.headers.get('content-type', 'application/octet-stream').split(';')[0].strip()
+    key = uuid.uuid4().hex + (mimetypes.guess_extension(content_type) or '')
+    stored = await storage.save(
+        _owned_key(claims, key), request.stream(), content_type=content_type, max_size=settings.MAX_FILE_SIZE
+    )
+    schema = StoredFileSchema(key=key, size=stored.size, content_type=stored.content_type, sha256=stored.sha256)
+    return StoredFileSchema.respond(schema, status_code=status.HTTP_201_CREATED)
+
+
+@files_router.get('/{key}', response_class=Response)
+async def download_file(
+    key: str,
+    request: Request,
+    claims: TokenClaims = Depends(current_claims),
+    storage: IStorage = Depends(get_storage),
+) -> Response:
+    """Download a file of the caller; a single `Range` is honoured (206)."""
+    try:
+        stored = await storage.stat(_owned_key(claims, key))
+    except StoredFileNotFoundError:
+        raise StoredFileNotFoundError(key) from None
+    return stored_file_response(storage, stored, request.headers.get('range'))
+
+
+@files_router.delete('/{key}', status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+async def delete_file(
+    key: str,
+    claims: TokenClaims = Depends(current_claims),
+    storage: IStorage = Depends(get_storage),
+) -> Response:
+    """Delete a file of the caller."""
+    await storage.delete(_owned_key(claims, key))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from src.infrastructure.health import health_monitor
+
+
+health_router = APIRouter(prefix='/health')
+
+
+@health_router.get('/ready', include_in_schema=False)
+@health_router.get('', include_in_schema=False)  # alias kept for existing probes
+async def readiness() -> Response:
+    """Readiness: last result of the background dependency checks."""
+    status_code, body = health_monitor.readiness()
+    return Response(body, status_code, media_type='application/json')
+
+
+@health_router.get('/live', include_in_schema=False)
+async def liveness() -> Response:
+    """Liveness: the worker serves requests and its health checker runs."""
+    status_code, body = health_monitor.liveness()
+    return Response(body, status_code, media_type='application/json')
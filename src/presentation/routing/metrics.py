@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from src.infrastructure.metrics import metrics_store, render_prometheus
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get('/metrics', include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """Prometheus metrics summed over all workers of the container."""
+    families = await metrics_store.collect()
+    return PlainTextResponse(render_prometheus(families), media_type='text/plain; version=0.0.4')
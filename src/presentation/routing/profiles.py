@@ -0,0 +1,24 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from src.infrastructure.profiling import profile_store
+from src.presentation.responses import FastJSONResponse
+from src.presentation.schemas import ProfileSchema
+from src.presentation.security import verify_credentials
+
+
+profiles_router = APIRouter(prefix='/profiles', dependencies=[Depends(verify_credentials)])
+
+
+@profiles_router.get('', response_model=list[ProfileSchema], include_in_schema=False)
+async def list_profiles() -> FastJSONResponse:
+    """Saved request profiles, newest first; open them in https://www.speedscope.app"""
+    return ProfileSchema.respond(await asyncio.to_thread(profile_store.list))
+
+
+@profiles_router.get('/{name}', include_in_schema=False)
+async def get_profile(name: str) -> FileResponse:
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Profile not found')
+    return FileResponse(path, media_type='application/json', filename=path.name)
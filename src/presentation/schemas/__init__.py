@@ -0,0 +1,7 @@
+from src.presentation.schemas.export_format import ExportFormat
+from src.presentation.schemas.response_schema import ResponseSchema
+from src.presentation.schemas.profile_schema import ProfileSchema
+from src.presentation.schemas.stored_file_schema import StoredFileSchema
+from src.presentation.schemas.login_schema import LoginSchema
+from src.presentation.schemas.refresh_token_schema import RefreshTokenSchema
+from src.presentation.schemas.token_pair_schema import TokenPairSchema
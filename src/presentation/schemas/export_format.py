@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """Formats of streamed list exports"""
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+    @property
+    def media_type(self) -> str:
+        return 'application/x-ndjson' if self is ExportFormat.NDJSON else 'text/csv; charset=utf-8'
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class LoginSchema(BaseModel):
+    """Credentials of the account to log in"""
+    username: str
+    password: str
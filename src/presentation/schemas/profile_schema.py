@@ -0,0 +1,9 @@
+from datetime import datetime
+from src.presentation.schemas.response_schema import ResponseSchema
+
+
+class ProfileSchema(ResponseSchema):
+    """Saved request profile"""
+    name: str
+    size: int
+    created_at: datetime
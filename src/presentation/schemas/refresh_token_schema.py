@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class RefreshTokenSchema(BaseModel):
+    """Refresh token to exchange"""
+    refresh_token: str
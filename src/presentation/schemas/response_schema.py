@@ -0,0 +1,42 @@
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from src.presentation.responses import FastJSONResponse
+
+
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
+
+
+class ResponseSchema(BaseModel):
+    """
+    Base class for response schemas.
+
+    Used as a `response_model`, FastAPI validates the returned value against
+    the schema, dumps it to Python objects and only then encodes it. A route
+    that returns data it can trust to match the schema (rows it selected
+    itself, instances of the schema) can keep the `response_model` for the
+    OpenAPI docs and return `Schema.respond(data)` instead, which encodes the
+    data once and skips validation.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def respond(
+        cls,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> FastJSONResponse:
+        """
+        Response with `content` encoded as is: mappings and plain values through
+        orjson, instances (or a list of instances) of the schema through the
+        schema's own serializer.
+        """
+        if isinstance(content, cls):
+            content = cls.__pydantic_serializer__.to_json(content)
+        elif isinstance(content, list) and content and isinstance(content[0], cls):
+            content = _list_adapter(cls).dump_json(content)
+        return FastJSONResponse(content, status_code=status_code, headers=headers)
@@ -0,0 +1,9 @@
+from src.presentation.schemas.response_schema import ResponseSchema
+
+
+class StoredFileSchema(ResponseSchema):
+    """Uploaded file"""
+    key: str
+    size: int
+    content_type: str
+    sha256: str | None
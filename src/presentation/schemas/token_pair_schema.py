@@ -0,0 +1,9 @@
+from src.presentation.schemas.response_schema import ResponseSchema
+
+
+class TokenPairSchema(ResponseSchema):
+    """Access and refresh token"""
+    access_token: str
+    refresh_token: str
+    token_type: str
+    expires_in: int
@@ -0,0 +1,7 @@
+from src.presentation.security.docs_credentials import (
+    basic_credentials,
+    docs_credentials_valid,
+    security,
+    verify_credentials,
+)
+from src.presentation.security.bearer_token import bearer, current_claims
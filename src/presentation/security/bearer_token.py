@@ -0,0 +1,20 @@
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from src.application.contracts.i_token_service import ITokenService
+from src.application.domain.exceptions import InvalidTokenError
+from src.application.domain.objects.token_claims import TokenClaims
+from src.infrastructure.auth import get_token_service
+
+
+bearer = HTTPBearer(auto_error=False, description='JWT access token')
+
+
+async def current_claims(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer),
+    tokens: ITokenService = Depends(get_token_service),
+) -> TokenClaims:
+    """Claims of the verified access token of the request; 401 without a valid one."""
+    if credentials is None:
+        message = 'Missing bearer token'
+        raise InvalidTokenError(message)
+    return await tokens.verify(credentials.credentials)
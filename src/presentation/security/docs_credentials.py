@@ -0,0 +1,35 @@
+import base64
+import binascii
+import secrets
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from src.settings import settings
+
+
+# Initialize HTTP Basic authentication
+security = HTTPBasic(description='Basic Authentication')
+
+
+def docs_credentials_valid(username: str, password: str) -> bool:
+    """Compare with DOCS_USERNAME / DOCS_PASSWORD in constant time"""
+    username_valid = secrets.compare_digest(username.encode(), settings.DOCS_USERNAME.encode())
+    password_valid = secrets.compare_digest(password.encode(), settings.DOCS_PASSWORD.encode())
+    return username_valid and password_valid
+
+
+def basic_credentials(authorization: bytes) -> tuple[str, str] | None:
+    """Username and password of a raw `Authorization: Basic ...` header value"""
+    scheme, _, encoded = authorization.partition(b' ')
+    if scheme.lower() != b'basic':
+        return None
+    try:
+        username, separator, password = base64.b64decode(encoded, validate=True).decode().partition(':')
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    return (username, password) if separator else None
+
+
+async def verify_credentials(credentials: HTTPBasicCredentials = Depends(security)) -> None:
+    """Validates the user's credentials against the documentation credentials."""
+    if not docs_credentials_valid(credentials.username, credentials.password):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Incorrect username or password')
@@ -1,13 +1,12 @@
 from functools import lru_cache
+from pathlib import Path
 from typing import Optional, List, Literal
-from dotenv import load_dotenv, find_dotenv
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-env_file = find_dotenv('.env')
-if env_file:
-    load_dotenv(env_file)
+# .env of the project root, read once by pydantic-settings
+ENV_FILE = Path(__file__).resolve().parent.parent / '.env'
 
 
 class Settings(BaseSettings):
@@ -24,12 +23,49 @@ class Settings(BaseSettings):
     DATABASE_POOL_TIMEOUT: int = Field(default=30, description="Database pool timeout")
     DATABASE_POOL_RECYCLE: int = Field(default=3600, description="Database pool recycle")
     DATABASE_ECHO: bool = Field(default=False, description="SQLAlchemy echo")
+    DATABASE_SLOW_CHECKOUT_MS: float = Field(
+        default=100.0, ge=0, description="Log connection checkouts waiting longer than this (ms)"
+    )
+    DATABASE_POOL_WARM_CONNECTIONS: int = Field(
+        default=2, ge=0, description="Connections per pool each worker opens at startup"
+    )
+    DATABASE_REPLICA_URLS: str = Field(
+        default='', description="Comma-separated read replica URLs (postgresql+asyncpg://...)"
+    )
+    DATABASE_REPLICA_STRATEGY: Literal['round_robin', 'least_connections'] = Field(
+        default='round_robin', description="How read-only sessions pick a replica"
+    )
+    DATABASE_REPLICA_MAX_LAG: float = Field(default=5.0, ge=0, description="Skip replicas lagging more (seconds)")
+    DATABASE_REPLICA_CHECK_INTERVAL: float = Field(default=5.0, gt=0, description="Seconds between replica checks")
 
     # ===== Security Settings =====
     SECRET_KEY: str = Field(min_length=32, description="Secret key for JWT")
     ALGORITHM: str = Field(default='HS256', description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Access token expiration")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, description="Refresh token expiration")
+    AUTH_VERIFIED_CACHE_SIZE: int = Field(
+        default=10_000, ge=0, description="Verified tokens kept per worker to skip signature checks, 0 disables"
+    )
+    AUTH_REVOCATION_BACKEND: Literal['memory', 'redis'] = Field(
+        default='redis', description="Revoked tokens: in Redis shared by all workers, or in process for a single worker"
+    )
+    AUTH_REVOCATION_PREFIX: str = Field(default='auth:', description="Prefix of revocation keys in Redis")
+    AUTH_BLOOM_CAPACITY: int = Field(
+        default=100_000, ge=1, description="Revoked ids the local Bloom filter is sized for"
+    )
+    AUTH_BLOOM_ERROR_RATE: float = Field(
+        default=0.001, gt=0, lt=1, description="False positive rate of the Bloom filter at capacity"
+    )
+    AUTH_REVOCATION_SYNC_INTERVAL: float = Field(
+        default=60.0, gt=0, description="Seconds between rebuilds of the Bloom filter from the revocation store"
+    )
+
+    HASH_ROUNDS: int = Field(default=12, ge=4, le=31, description="bcrypt work factor (log2 rounds)")
+    HASH_WORKERS: int = Field(default=2, ge=1, description="Threads per worker process for bcrypt")
+    HASH_QUEUE_LIMIT: int = Field(default=64, ge=0, description="bcrypt calls allowed to wait for a thread before 503")
+
+    AUTH_USERNAME: str | None = Field(default=None, description="Account allowed to log in, None disables login")
+    AUTH_PASSWORD_HASH: str | None = Field(default=None, description="bcrypt hash of the account password")
 
     DOCS_USERNAME: str = Field(description="Documentation username")
     DOCS_PASSWORD: str = Field(description="Documentation password")
@@ -40,15 +76,32 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: str | None = Field(default=None, description="Redis password")
     REDIS_DB: int = Field(default=0, ge=0, description="Redis database")
 
+    # ===== Cache =====
+    CACHE_BACKEND: Literal['redis', 'memory'] = Field(default='memory', description="Shared (L2) cache backend")
+    CACHE_PREFIX: str = Field(default='cache:', description="Prefix of cache keys in Redis")
+    CACHE_DEFAULT_TTL: float = Field(default=300.0, gt=0, description="Default cache TTL in seconds")
+    CACHE_L1_TTL: float = Field(default=30.0, ge=0, description="Max TTL of in-process (L1) cache entries")
+    CACHE_L1_MAX_ENTRIES: int = Field(default=10_000, ge=0, description="Max in-process (L1) cache entries")
+
     # ===== File Storage =====
     UPLOAD_DIR: str = Field(default='uploads', description="Upload directory")
     MAX_FILE_SIZE: int = Field(default=10 * 1024 * 1024, description="Max file size")
+    STORAGE_BACKEND: Literal['local', 's3'] = Field(default='local', description="Where uploaded files are stored")
+    STORAGE_CHUNK_SIZE: int = Field(
+        default=1024 * 1024, gt=0, description="Bytes written or read per call to the storage backend"
+    )
 
     S3_ENDPOINT: str | None = Field(default=None, description="S3 endpoint")
     S3_ACCESS_KEY: str | None = Field(default=None, description="S3 access key")
     S3_SECRET_KEY: str | None = Field(default=None, description="S3 secret key")
     S3_BUCKET_NAME: str | None = Field(default=None, description="S3 bucket name")
     S3_REGION: str = Field(default='us-east-1', description="S3 region")
+    S3_PART_SIZE: int = Field(
+        default=8 * 1024 * 1024, ge=5 * 1024 * 1024, description="Part size of multipart uploads (S3 minimum is 5 MiB)"
+    )
+    S3_MAX_CONCURRENCY: int = Field(default=4, ge=1, description="Parts of one upload sent at the same time")
+    S3_WORKERS: int = Field(default=16, ge=1, description="Threads running S3 calls")
+    S3_QUEUE_LIMIT: int = Field(default=256, ge=0, description="S3 calls that may wait for a thread before 503")
 
     # ===== External APIs =====
     SMTP_HOST: str | None = Field(default=None, description="SMTP host")
@@ -56,12 +109,73 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str | None = Field(default=None, description="SMTP username")
     SMTP_PASSWORD: str | None = Field(default=None, description="SMTP password")
     SMTP_TLS: bool = Field(default=True, description="SMTP TLS")
+    SMTP_TIMEOUT: float = Field(default=10.0, gt=0, description="SMTP connect and command timeout in seconds")
+    EMAIL_FROM: str | None = Field(default=None, description="Sender address, SMTP_USERNAME by default")
+    EMAIL_QUEUE_BACKEND: Literal['memory', 'redis'] = Field(
+        default='memory', description="Email queue: in process, or a Redis list kept across restarts"
+    )
+    EMAIL_QUEUE_KEY: str = Field(default='email:queue', description="Redis list of the email queue")
+    EMAIL_QUEUE_LIMIT: int = Field(default=10_000, ge=1, description="Max queued emails of the in-process queue")
+    EMAIL_POOL_SIZE: int = Field(default=2, ge=1, description="SMTP connections kept open per worker")
+    EMAIL_BATCH_SIZE: int = Field(default=50, ge=1, description="Emails taken from the queue at a time")
+    EMAIL_RETRIES: int = Field(default=5, ge=1, description="Delivery attempts on transient SMTP errors")
+    EMAIL_RETRY_DELAY: float = Field(default=1.0, gt=0, description="Initial delay between delivery attempts")
+    EMAIL_DRAIN_TIMEOUT: float = Field(default=10.0, ge=0, description="Seconds to send queued emails on shutdown")
 
     # ===== Logging =====
     LOG_LEVEL: Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] = Field(
         default='INFO', description="Logging level"
     )
     LOG_FORMAT: Literal['JSON', 'TEXT'] = Field(default='TEXT', description="Log format")
+    LOG_CAPTURE_LOCATION: bool | None = Field(
+        default=None, description="Add caller file:line to log lines (defaults to on only for DEBUG level)"
+    )
+    LOG_ASYNC: bool = Field(default=False, description="Write logs from a background thread")
+    LOG_BUFFER_SIZE: int = Field(default=10_000, ge=1, description="Max log lines buffered by the background writer")
+    LOG_BATCH_SIZE: int = Field(default=512, ge=1, description="Max log lines per write of the background writer")
+    LOG_OVERFLOW_POLICY: Literal['BLOCK', 'DROP_LOW', 'DROP'] = Field(
+        default='BLOCK', description="Behaviour when the log buffer is full"
+    )
+
+    # ===== Resilience =====
+    RETRY_DEADLINE: float = Field(default=30.0, gt=0, description="Default overall time budget of @retry (seconds)")
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = Field(
+        default=5, ge=1, description="Consecutive failures that open a circuit breaker"
+    )
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = Field(
+        default=30.0, gt=0, description="Seconds an open circuit waits before a trial call"
+    )
+
+    # ===== Metrics =====
+    METRICS_ENABLED: bool = Field(default=True, description="Record request metrics and expose /metrics")
+    METRICS_DIR: str = Field(default='metrics', description="Directory for per-worker metrics snapshots")
+    METRICS_FLUSH_INTERVAL: float = Field(default=5.0, gt=0, description="Seconds between metrics snapshots")
+
+    # ===== Profiling =====
+    PROFILING_ENABLED: bool = Field(
+        default=False, description="Allow per-request profiling (X-Profile header with docs credentials or sampling)"
+    )
+    PROFILING_SAMPLE_RATE: float = Field(
+        default=0.0, ge=0, le=1, description="Share of requests profiled without the X-Profile header"
+    )
+    PROFILING_INTERVAL: float = Field(default=0.001, gt=0, description="Profiler sampling interval in seconds")
+    PROFILING_DIR: str = Field(default='profiles', description="Directory for speedscope request profiles")
+    PROFILING_MAX_FILES: int = Field(default=100, ge=1, description="Profiles kept on disk, the oldest are deleted")
+
+    # ===== Event Loop Monitor =====
+    LOOP_MONITOR_ENABLED: bool = Field(default=True, description="Measure event loop lag and log blocking callbacks")
+    LOOP_MONITOR_INTERVAL: float = Field(default=0.1, gt=0, description="Seconds between event loop lag samples")
+    LOOP_MONITOR_WINDOW: int = Field(default=600, ge=1, description="Lag samples kept for the lag percentiles")
+    LOOP_MONITOR_SLOW_CALLBACK_MS: float = Field(
+        default=100.0, gt=0, description="Milliseconds a callback may block the event loop before it is logged"
+    )
+
+    # ===== Health Checks =====
+    HEALTH_CHECK_INTERVAL: float = Field(default=5.0, gt=0, description="Seconds between background dependency checks")
+    HEALTH_CHECK_TIMEOUT: float = Field(default=2.0, gt=0, description="Seconds a dependency check may take")
+    HEALTH_MAX_LOOP_LAG_MS: float = Field(
+        default=500.0, gt=0, description="p99 event loop lag above which the worker is reported not ready"
+    )
 
     # ===== CORS =====
     CORS_ORIGINS: str = Field(
@@ -73,10 +187,20 @@ class Settings(BaseSettings):
     # ===== Rate Limiting =====
     RATE_LIMIT_REQUESTS: int = Field(default=60, description="Rate limit requests per minute")
     RATE_LIMIT_WINDOW: int = Field(default=60, description="Rate limit window in seconds")
+    RATE_LIMIT_ENABLED: bool = Field(default=True, description="Enforce the rate limit")
+    RATE_LIMIT_BACKEND: Literal['redis', 'memory'] = Field(
+        default='redis', description="Rate limit counters: in Redis shared by all workers, or per worker process"
+    )
+    RATE_LIMIT_KEYS: str = Field(
+        default='ip', description="Comma-separated rate limit key parts: ip, subject, route"
+    )
+    RATE_LIMIT_TRUSTED_PROXIES: int = Field(
+        default=0, ge=0, description="Reverse proxies in front of the app that append to X-Forwarded-For (0 ignores it)"
+    )
 
     # ===== Pydantic Settings Config =====
     model_config = SettingsConfigDict(
-        env_file='.env',
+        env_file=ENV_FILE,
         env_file_encoding='utf-8',
         case_sensitive=True,
         use_enum_values=True,
@@ -92,6 +216,11 @@ class Settings(BaseSettings):
             f'@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}'
         )
 
+    @property
+    def DATABASE_REPLICAS(self) -> List[str]:
+        """Get read replica URLs as list"""
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(',') if url.strip()]
+
     @property
     def REDIS_URL(self) -> str:
         """Get Redis URL"""
@@ -101,7 +230,7 @@ class Settings(BaseSettings):
     @property
     def EXCLUDED_PATHS(self) -> List[str]:
         """Get paths excluded from middleware"""
-        return ['/docs', '/redoc', '/openapi.json', '/ping', '/health']
+        return ['/docs', '/redoc', '/openapi.json', '/ping', '/health', '/health/ready', '/health/live', '/metrics']
 
     @property
     def CORS(self) -> List[str]:
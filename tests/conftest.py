@@ -0,0 +1,19 @@
+"""
+Shared test setup.
+
+Settings require a few variables without defaults; they are given dummy
+values here, before any `src` module is imported. Nothing in the tests
+talks to a real database or server.
+"""
+import os
+
+
+os.environ.setdefault('DATABASE_HOST', 'localhost')
+os.environ.setdefault('DATABASE_NAME', 'test')
+os.environ.setdefault('DATABASE_USER', 'test')
+os.environ.setdefault('DATABASE_PASSWORD', 'test')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key-with-at-least-32-characters')
+os.environ.setdefault('DOCS_USERNAME', 'test')
+os.environ.setdefault('DOCS_PASSWORD', 'test')
+os.environ.setdefault('AUTH_REVOCATION_BACKEND', 'memory')
+os.environ.setdefault('RATE_LIMIT_BACKEND', 'memory')
@@ -0,0 +1,72 @@
+import pytest
+from src.application.domain.exceptions import InvalidTokenError
+from src.infrastructure.auth.jwt_codec import JWTCodec, _b64encode
+from src.infrastructure.utils.serialization import json_dumps
+
+
+SECRET = 'test-secret-key-with-at-least-32-characters'  # noqa: S105 - test key
+
+
+@pytest.fixture
+def codec() -> JWTCodec:
+    return JWTCodec(SECRET)
+
+
+def test_round_trip(codec: JWTCodec):
+    assert codec.decode(codec.encode({'sub': 'user', 'n': 1})) == {'sub': 'user', 'n': 1}
+
+
+def test_unsupported_algorithm():
+    with pytest.raises(ValueError, match='Unsupported JWT algorithm'):
+        JWTCodec(SECRET, 'RS256')
+
+
+@pytest.mark.parametrize(
+    'token',
+    [
+        pytest.param('h.p.\xe9abc', id='non-ascii'),
+        pytest.param('\udcff.p.s', id='surrogate'),
+        pytest.param('', id='empty'),
+        pytest.param('abc', id='no-dots'),
+        pytest.param('h.p', id='two-parts'),
+    ],
+)
+def test_garbage_is_rejected_as_malformed(codec: JWTCodec, token: str):
+    with pytest.raises(InvalidTokenError, match='Malformed token'):
+        codec.decode(token)
+
+
+def test_non_ascii_signature_of_a_valid_header_and_payload(codec: JWTCodec):
+    header_and_payload = codec.encode({'sub': 'user'}).rpartition('.')[0]
+    for signature in ('\xe9abc', '\u2603', '\udcff'):
+        with pytest.raises(InvalidTokenError, match='Malformed token'):
+            codec.decode(f'{header_and_payload}.{signature}')
+
+
+def test_truncated_tokens_are_rejected(codec: JWTCodec):
+    token = codec.encode({'sub': 'user'})
+    header, payload, signature = token.split('.')
+    for truncated in (token[:-1], f'{header}.{payload}.', f'{header}.{payload}', f'{header}..{signature}'):
+        with pytest.raises(InvalidTokenError):
+            codec.decode(truncated)
+
+
+@pytest.mark.parametrize(
+    'header',
+    [{'alg': 'none', 'typ': 'JWT'}, {'alg': 'HS512', 'typ': 'JWT'}, {'typ': 'JWT', 'alg': 'HS256'}],
+)
+def test_other_headers_are_rejected(codec: JWTCodec, header: dict[str, str]):
+    _, payload, signature = codec.encode({'sub': 'user'}).split('.')
+    with pytest.raises(InvalidTokenError, match='Malformed token'):
+        codec.decode(f'{_b64encode(json_dumps(header)).decode()}.{payload}.{signature}')
+
+
+def test_signature_of_another_key_is_rejected(codec: JWTCodec):
+    token = JWTCodec('another-secret-key-with-at-least-32-characters').encode({'sub': 'user'})
+    with pytest.raises(InvalidTokenError, match='Invalid token signature'):
+        codec.decode(token)
+
+
+def test_signed_payload_that_is_not_an_object(codec: JWTCodec):
+    with pytest.raises(InvalidTokenError, match='Malformed token'):
+        codec.decode(codec.encode([1, 2]))  # type: ignore[arg-type]
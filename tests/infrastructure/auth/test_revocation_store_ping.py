@@ -0,0 +1,34 @@
+import json
+import fakeredis
+import pytest
+from redis.asyncio import Redis
+from redis.backoff import NoBackoff
+from redis.asyncio.retry import Retry
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.infrastructure.auth.memory_revocation_store import MemoryRevocationStore
+from src.infrastructure.auth.redis_revocation_store import RedisRevocationStore
+from src.infrastructure.health import HealthMonitor
+from src.infrastructure.logger import logger
+
+
+async def test_ping():
+    await MemoryRevocationStore().ping()
+    store = RedisRevocationStore(fakeredis.FakeAsyncRedis(), logger)
+    await store.ping()
+    await store.close()
+
+
+async def test_unreachable_redis_fails_the_ping_and_readiness():
+    # Nothing listens on port 1, the connection is refused right away
+    store = RedisRevocationStore(Redis(port=1, retry=Retry(NoBackoff(), 0)), logger)
+    with pytest.raises(ServiceUnavailableError, match='unavailable'):
+        await store.ping()
+
+    monitor = HealthMonitor(logger)
+    monitor.register('revocation_store', store.ping)
+    await monitor.check()
+    status_code, body = monitor.readiness()
+
+    assert status_code == 503
+    assert json.loads(body)['status'] == 'down'
+    await store.close()
@@ -0,0 +1,56 @@
+from collections.abc import AsyncIterator, Callable
+import fakeredis
+import pytest
+from src.infrastructure.cache.cache_backend import CacheBackend
+from src.infrastructure.cache.memory_cache_backend import MemoryCacheBackend
+from src.infrastructure.cache.redis_cache_backend import RedisCacheBackend
+from src.infrastructure.logger import logger
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_server() -> fakeredis.FakeServer:
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture(params=['memory', 'redis'])
+async def backend_factory(request: pytest.FixtureRequest, redis_server: fakeredis.FakeServer) -> AsyncIterator[Callable[[], CacheBackend]]:
+    """
+    Factory of backends sharing one storage, like the workers of a deployment;
+    the memory backend is process-local, so it hands out the same instance
+    """
+    backends: list[CacheBackend] = []
+    memory = MemoryCacheBackend()
+
+    def create() -> CacheBackend:
+        backend: CacheBackend
+        if request.param == 'memory':
+            backend = memory
+        else:
+            backend = RedisCacheBackend(fakeredis.FakeAsyncRedis(server=redis_server), logger, prefix='test:')
+        backends.append(backend)
+        return backend
+
+    yield create
+    for backend in backends:
+        await backend.close()
+
+
+@pytest.fixture
+def backend(backend_factory: Callable[[], CacheBackend]) -> CacheBackend:
+    return backend_factory()
@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Callable
+from src.infrastructure.cache.cache_backend import CacheBackend
+from src.infrastructure.cache.memory_cache_backend import MemoryCacheBackend
+from tests.infrastructure.cache.conftest import FakeClock
+
+
+async def test_set_get_delete(backend: CacheBackend):
+    assert await backend.set('a', b'1', 60) is True
+    assert await backend.get('a') == b'1'
+
+    await backend.delete(['a'])
+
+    assert await backend.get('a') is None
+
+
+async def test_memory_backend_expires_entries(clock: FakeClock):
+    backend = MemoryCacheBackend(clock)
+    await backend.set('a', b'1', 5)
+    clock.advance(5)
+
+    assert await backend.get('a') is None
+
+
+async def test_invalidate_tags_deletes_tagged_keys(backend: CacheBackend):
+    await backend.set('a', b'1', 60, ['users'])
+    await backend.set('b', b'2', 60, ['users', 'admins'])
+    await backend.set('c', b'3', 60, ['admins'])
+    await backend.set('d', b'4', 60)
+
+    keys = await backend.invalidate_tags(['users'])
+
+    assert sorted(keys) == ['a', 'b']
+    assert [await backend.get(key) for key in 'abcd'] == [None, None, b'3', b'4']
+    assert await backend.invalidate_tags(['users']) == []
+
+
+async def test_invalidation_bumps_generations(backend: CacheBackend):
+    assert await backend.tag_generations(['users', 'admins']) == [0, 0]
+
+    await backend.invalidate_tags(['users'])
+    await backend.invalidate_tags(['users'])
+
+    assert await backend.tag_generations(['users', 'admins']) == [2, 0]
+
+
+async def test_write_with_outdated_generations_is_skipped(backend: CacheBackend):
+    generations = await backend.tag_generations(['users'])
+    await backend.invalidate_tags(['users'])
+
+    assert await backend.set('a', b'stale', 60, ['users'], generations) is False
+    assert await backend.get('a') is None
+
+    generations = await backend.tag_generations(['users'])
+    assert await backend.set('a', b'fresh', 60, ['users'], generations) is True
+    assert await backend.get('a') == b'fresh'
+
+
+async def test_deletions_are_broadcast(backend_factory: Callable[[], CacheBackend]):
+    writer, listener = backend_factory(), backend_factory()
+    received: list[list[str]] = []
+    unsubscribe = await listener.subscribe(received.append)
+
+    await writer.set('a', b'1', 60, ['users'])
+    await writer.invalidate_tags(['users'])
+    await writer.delete(['b'])
+    for _ in range(50):
+        if len(received) == 2:
+            break
+        await asyncio.sleep(0.01)
+    await unsubscribe()
+
+    assert received == [['a'], ['b']]
@@ -0,0 +1,62 @@
+import datetime
+import decimal
+import uuid
+import pytest
+from pydantic import BaseModel
+from src.infrastructure.cache.cache_codec import decode_value, encode_value
+
+
+class User(BaseModel):
+    id: int
+    name: str
+    created_at: datetime.datetime
+
+
+@pytest.mark.parametrize('value', [
+    None,
+    'text',
+    42,
+    1.5,
+    True,
+    [1, 'a', None],
+    {'nested': {'list': [1, 2]}},
+    (1, 'a'),
+    datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC),
+    datetime.date(2024, 5, 1),
+    uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    decimal.Decimal('10.01'),
+    {'when': datetime.date(2024, 5, 1), 'ids': (uuid.UUID(int=1),)},
+])
+def test_round_trip_keeps_type(value: object):
+    decoded = decode_value(encode_value(value))
+
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_model_round_trip():
+    user = User(id=1, name='x', created_at=datetime.datetime(2024, 5, 1, tzinfo=datetime.UTC))
+
+    decoded = decode_value(encode_value([user]))
+
+    assert decoded == [user]
+    assert isinstance(decoded[0], User)
+
+
+@pytest.mark.parametrize('value', [
+    {1: 'int key'},
+    {'set': {1, 2}},
+    object(),
+    b'bytes',
+])
+def test_unsupported_values_raise(value: object):
+    with pytest.raises(TypeError):
+        encode_value(value)
+
+
+def test_model_defined_in_a_function_raises():
+    class Local(BaseModel):
+        id: int
+
+    with pytest.raises(TypeError, match='defined in a function'):
+        encode_value(Local(id=1))
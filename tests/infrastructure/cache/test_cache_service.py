@@ -0,0 +1,163 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+import pytest
+from src.infrastructure.cache.cache_backend import CacheBackend
+from src.infrastructure.cache.cache_backend_error import CacheBackendError
+from src.infrastructure.cache.cache_service import CacheService
+from src.infrastructure.cache.cached import cached
+from src.infrastructure.cache.memory_cache_backend import MemoryCacheBackend
+from src.infrastructure.logger import logger
+
+
+DOWN = 'Connection refused'
+
+
+class UnavailableBackend(MemoryCacheBackend):
+    """Backend whose server is down"""
+
+    async def get(self, *args: Any, **kwargs: Any) -> bytes | None:  # noqa: ARG002
+        raise CacheBackendError(DOWN)
+
+    async def set(self, *args: Any, **kwargs: Any) -> bool:  # noqa: ARG002
+        raise CacheBackendError(DOWN)
+
+
+async def eventually_missing(service: CacheService, key: str) -> bool:
+    """Whether the key disappears from the service, waiting for the invalidation broadcast"""
+    for _ in range(100):
+        if await service.get(key) is None:
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+async def worker_factory(
+    backend_factory: Callable[[], CacheBackend],
+) -> AsyncIterator[Callable[[], Awaitable[CacheService]]]:
+    """CacheService per simulated worker, all sharing one backend storage"""
+    services: list[CacheService] = []
+
+    async def create() -> CacheService:
+        service = CacheService(backend_factory(), logger, l1_ttl=60, prefix='app:')
+        await service.start()
+        services.append(service)
+        return service
+
+    yield create
+    for service in services:
+        await service.stop()
+
+
+async def test_l2_hit_fills_l1(worker_factory):
+    first, second = await worker_factory(), await worker_factory()
+    await first.set('user:1', {'id': 1})
+
+    assert await second.get('user:1') == {'id': 1}
+    assert await second.get('user:1') == {'id': 1}
+    assert (second.stats.l2_hits, second.stats.l1_hits) == (1, 1)
+
+
+async def test_missing_key_returns_default(worker_factory):
+    service = await worker_factory()
+
+    assert await service.get('missing', 'default') == 'default'
+    assert service.stats.misses == 1
+
+
+async def test_concurrent_misses_share_one_load(worker_factory):
+    service = await worker_factory()
+    calls = 0
+
+    async def load() -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {'id': 1}
+
+    results = await asyncio.gather(*(service.get_or_set('user:1', load) for _ in range(50)))
+
+    assert calls == 1
+    assert all(result == {'id': 1} for result in results)
+    assert service.stats.loads == 1
+
+
+async def test_invalidation_reaches_l1_of_every_worker(worker_factory):
+    first, second = await worker_factory(), await worker_factory()
+    await first.set('user:1', 'old', tags=['users'])
+    assert await second.get('user:1') == 'old'
+
+    await first.invalidate_tags('users')
+
+    assert await eventually_missing(second, 'user:1')
+
+
+async def test_delete_reaches_l1_of_every_worker(worker_factory):
+    first, second = await worker_factory(), await worker_factory()
+    await first.set('user:1', 'old')
+    assert await second.get('user:1') == 'old'
+
+    await first.delete('user:1')
+
+    assert await eventually_missing(second, 'user:1')
+
+
+async def test_load_racing_an_invalidation_is_not_cached(worker_factory):
+    service = await worker_factory()
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def load() -> str:
+        loading.set()
+        await release.wait()
+        return 'stale'
+
+    task = asyncio.create_task(service.get_or_set('user:1', load, tags=['users']))
+    await loading.wait()
+    await service.invalidate_tags('users')
+    release.set()
+
+    assert await task == 'stale'
+    assert await service.get('user:1') is None
+    assert service.stats.stale_writes == 1
+
+
+async def test_unavailable_backend_degrades_to_loading():
+    service = CacheService(UnavailableBackend(), logger)
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await service.get_or_set('key', load) == 1
+    # Still served from L1 while the backend is down
+    assert await service.get_or_set('key', load) == 1
+    assert service.stats.backend_errors == 2
+
+
+async def test_unencodable_value_raises_before_caching(worker_factory):
+    service = await worker_factory()
+
+    with pytest.raises(TypeError):
+        await service.set('key', object())
+    assert await service.get('key') is None
+
+
+async def test_cached_decorator_keys_and_tags(worker_factory):
+    service = await worker_factory()
+    calls: list[int] = []
+
+    @cached('user:{user_id}', tags=['users', 'user:{user_id}'], cache=service)
+    async def get_user(user_id: int) -> dict[str, int]:
+        calls.append(user_id)
+        return {'id': user_id}
+
+    assert await get_user(1) == {'id': 1}
+    assert await get_user(user_id=1) == {'id': 1}
+    await service.invalidate_tags('user:1')
+    assert await get_user(1) == {'id': 1}
+
+    assert calls == [1, 1]
@@ -0,0 +1,43 @@
+from src.infrastructure.cache.lru_cache import MISSING, LRUCache
+from tests.infrastructure.cache.conftest import FakeClock
+
+
+def test_evicts_least_recently_used(clock: FakeClock):
+    cache = LRUCache(2, clock)
+    cache.set('a', 1, 60)
+    cache.set('b', 2, 60)
+    assert cache.get('a') == 1
+    cache.set('c', 3, 60)
+
+    assert cache.get('b') is MISSING
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.evictions == 1
+
+
+def test_expires_entries(clock: FakeClock):
+    cache = LRUCache(10, clock)
+    cache.set('a', 1, 5)
+    clock.advance(4.9)
+    assert cache.get('a') == 1
+    clock.advance(0.1)
+
+    assert cache.get('a') is MISSING
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_falsy_values_are_hits(clock: FakeClock):
+    cache = LRUCache(10, clock)
+    cache.set('none', None, 60)
+    cache.set('zero', 0, 60)
+
+    assert cache.get('none') is None
+    assert cache.get('zero') == 0
+
+
+def test_disabled_cache_stores_nothing(clock: FakeClock):
+    cache = LRUCache(0, clock)
+    cache.set('a', 1, 60)
+    LRUCache(10, clock).set('b', 1, 0)
+
+    assert cache.get('a') is MISSING
@@ -0,0 +1,130 @@
+"""
+insert_many on SQLite (chunked INSERTs) and, when TEST_DATABASE_URL points
+to a PostgreSQL database (postgresql+asyncpg://...), on its COPY path.
+"""
+import enum
+import os
+from datetime import datetime
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+import pytest
+from sqlalchemy import JSON, DateTime, Enum, String, Table, TypeDecorator, func, select
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.repositories.repository import Repository
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    BLUE = 'blue'
+
+
+class Lowercase(TypeDecorator[str]):
+    impl = String(50)
+    cache_ok = True
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> str | None:  # noqa: ARG002
+        return value.lower() if value is not None else None
+
+
+class Item(Base):
+    __tablename__ = 'repository_test_items'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(Lowercase())
+    color: Mapped[Color] = mapped_column(Enum(Color, native_enum=False), default=Color.RED)
+    data: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    slug: Mapped[str] = mapped_column(
+        String(60), default=lambda context: f'{context.get_current_parameters()["name"]}-slug'
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.current_timestamp())
+
+
+TABLE: Table = Item.__table__  # type: ignore[assignment]
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+async def engine(request: pytest.FixtureRequest, tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    if request.param == 'sqlite':
+        url = f'sqlite+aiosqlite:///{tmp_path / "test.db"}'
+    else:
+        url = os.environ.get('TEST_DATABASE_URL', '')
+        if not url:
+            pytest.skip('TEST_DATABASE_URL is not set')
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(TABLE.drop, checkfirst=True)
+        await connection.run_sync(TABLE.create)
+    yield engine
+    async with engine.begin() as connection:
+        await connection.run_sync(TABLE.drop)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+
+def rows(count: int, start: int = 0) -> Iterator[dict[str, Any]]:
+    for index in range(start, start + count):
+        yield {'id': index, 'name': f'Item {index}'}
+
+
+async def items(session: AsyncSession) -> list[Item]:
+    return list((await session.scalars(select(Item).order_by(Item.id))).all())
+
+
+async def test_rows_get_defaults_and_bind_processing(session: AsyncSession):
+    count = await Repository(session, Item).insert_many([
+        {'id': 1, 'name': 'First', 'color': Color.BLUE, 'data': {'tags': ['a', 'b']}},
+        {'id': 2, 'name': 'SECOND', 'color': Color.RED, 'data': {}},
+    ])
+    await session.commit()
+
+    assert count == 2
+    first, second = await items(session)
+    assert (first.name, first.color, first.data, first.slug) == ('first', Color.BLUE, {'tags': ['a', 'b']}, 'First-slug')
+    assert (second.name, second.color, second.data, second.slug) == ('second', Color.RED, {}, 'SECOND-slug')
+    assert first.created_at is not None
+
+
+async def test_missing_columns_use_the_python_defaults(session: AsyncSession):
+    await Repository(session, Item).insert_many([{'id': 1, 'name': 'Only name'}])
+    await session.commit()
+
+    [item] = await items(session)
+    assert (item.color, item.data, item.slug) == (Color.RED, {}, 'Only name-slug')
+
+
+async def test_generators_larger_than_a_chunk(session: AsyncSession):
+    assert await Repository(session, Item, chunk_size=100).insert_many(rows(1050)) == 1050
+    await session.commit()
+    assert await session.scalar(select(func.count()).select_from(Item)) == 1050
+
+
+async def test_nothing_to_insert(session: AsyncSession):
+    assert await Repository(session, Item).insert_many(iter([])) == 0
+
+
+async def test_insert_is_rolled_back_with_the_session(session: AsyncSession):
+    await Repository(session, Item).insert_many(rows(10))
+    await session.rollback()
+    assert await items(session) == []
+
+    # Same keys again: nothing was left behind
+    assert await Repository(session, Item).insert_many(rows(10)) == 10
+    await session.commit()
+    assert len(await items(session)) == 10
+
+
+async def test_insert_joins_a_transaction_that_already_ran_statements(session: AsyncSession):
+    repository = Repository(session, Item)
+    await repository.insert_many(rows(5))
+    await repository.insert_many(rows(5, start=5))
+    await session.rollback()
+    assert await items(session) == []
@@ -0,0 +1,56 @@
+from collections.abc import Iterator
+import pytest
+from sqlalchemy import Column, ClauseElement, Integer, MetaData, Table, delete, insert, literal, select, text, union, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from src.infrastructure.database.pool_telemetry import PoolTelemetry
+from src.infrastructure.database.replica import Replica
+from src.infrastructure.database.replica_router import ReplicaRouter, primary_pinned
+from src.infrastructure.database.routing_session import RoutingSession
+from src.infrastructure.logger import logger
+
+
+items = Table('items', MetaData(), Column('id', Integer, primary_key=True))
+
+
+@pytest.fixture
+def engines() -> Iterator[tuple[AsyncEngine, AsyncEngine]]:
+    # Engines connect lazily, so nothing here needs a running server
+    primary = create_async_engine('postgresql+asyncpg://primary/test')
+    replica = create_async_engine('postgresql+asyncpg://replica/test')
+    yield primary, replica
+    primary.sync_engine.dispose()
+    replica.sync_engine.dispose()
+
+
+@pytest.fixture
+def session(engines: tuple[AsyncEngine, AsyncEngine]) -> Iterator[RoutingSession]:
+    primary, replica = engines
+    router = ReplicaRouter(logger, [Replica('replica', replica, PoolTelemetry('replica', logger, 1.0))])
+    token = primary_pinned.set(False)
+    yield RoutingSession(bind=primary.sync_engine, router=router, read_only=True)
+    primary_pinned.reset(token)
+
+
+def test_plain_select_goes_to_the_replica(session: RoutingSession, engines: tuple[AsyncEngine, AsyncEngine]):
+    assert session.get_bind(clause=select(items)) is engines[1].sync_engine
+    assert not primary_pinned.get()
+
+
+@pytest.mark.parametrize(
+    'clause',
+    [
+        pytest.param(text('SELECT 1'), id='text'),
+        pytest.param(text('UPDATE items SET id = id'), id='text-write'),
+        pytest.param(select(items).with_for_update(), id='for-update'),
+        pytest.param(insert(items), id='insert'),
+        pytest.param(update(items), id='update'),
+        pytest.param(delete(items), id='delete'),
+        pytest.param(union(select(literal(1)), select(literal(2))), id='compound'),
+    ],
+)
+def test_anything_else_goes_to_the_primary_and_pins_it(
+    session: RoutingSession, engines: tuple[AsyncEngine, AsyncEngine], clause: ClauseElement
+):
+    assert session.get_bind(clause=clause) is engines[0].sync_engine
+    assert primary_pinned.get()
+    assert session.get_bind(clause=select(items)) is engines[0].sync_engine
@@ -0,0 +1,61 @@
+import asyncio
+import json
+import pytest
+from src.infrastructure.health import HealthMonitor
+from src.infrastructure.logger import LogFormat, logger
+from src.infrastructure.logger.log_formatter import create_formatter
+from tests.memory_sink import MemorySink
+
+
+@pytest.fixture
+def sink(monkeypatch: pytest.MonkeyPatch) -> MemorySink:
+    sink = MemorySink()
+    monkeypatch.setattr(logger, 'sink', sink)
+    monkeypatch.setattr(logger, '_formatter', create_formatter(LogFormat.JSON))
+    return sink
+
+
+async def refused() -> None:
+    msg = 'connection to postgres://admin@10.0.0.5:5432 refused'
+    raise ConnectionRefusedError(msg)
+
+
+async def hangs() -> None:
+    await asyncio.sleep(1)
+
+
+async def test_probe_errors_are_logged_but_not_exposed(sink: MemorySink):
+    monitor = HealthMonitor(logger, timeout=0.05)
+    monitor.register('database', refused)
+    monitor.register('cache', hangs, critical=False)
+    await monitor.check()
+    status_code, body = monitor.readiness()
+
+    assert status_code == 503
+    checks = json.loads(body)['checks']
+    assert checks['database']['error'] == 'ConnectionRefusedError'
+    assert checks['cache']['error'] == 'no response in 0.05 s'
+    assert b'10.0.0.5' not in body
+
+    records = {record['dependency']: record for record in sink.records}
+    assert records['database']['error'] == 'ConnectionRefusedError'
+    assert records['database']['detail'] == 'connection to postgres://admin@10.0.0.5:5432 refused'
+    assert records['cache']['error'] == 'no response in 0.05 s'
+
+
+async def test_failures_are_logged_once_until_recovery(sink: MemorySink):
+    failing = True
+
+    async def probe() -> None:
+        if failing:
+            await refused()
+
+    monitor = HealthMonitor(logger)
+    monitor.register('database', probe)
+    await monitor.check()
+    await monitor.check()
+    failing = False
+    await monitor.check()
+
+    assert [record['message'] for record in sink.records] == ['Health check failed', 'Health check recovered']
+    assert monitor.readiness()[0] == 200
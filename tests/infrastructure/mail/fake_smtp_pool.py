@@ -0,0 +1,52 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable
+from email import message_from_string, policy
+from typing import TYPE_CHECKING, Any
+from src.infrastructure.mail.smtp_pool import SMTPPool
+
+if TYPE_CHECKING:
+    from email.message import EmailMessage
+
+
+class FakeConnection:
+    def __init__(self, pool: 'FakeSMTPPool') -> None:
+        self.__pool = pool
+
+    async def sendmail(self, sender: str, recipients: list[str], message: str) -> None:
+        pool = self.__pool
+        pool.attempts += 1
+        pool.active += 1
+        pool.max_active = max(pool.max_active, pool.active)
+        try:
+            await pool.behaviour(recipients)
+        finally:
+            pool.active -= 1
+        pool.delivered.append((sender, recipients, message_from_string(message, policy=policy.SMTP)))
+
+
+class FakeSMTPPool(SMTPPool):
+    """
+    Pool of fake connections recording delivered messages.
+
+    `behaviour` is awaited for every attempt with its recipients; it can
+    sleep, raise or hang to stand in for a slow or failing server.
+    """
+
+    def __init__(self, size: int = 4, behaviour: Callable[[list[str]], Any] | None = None) -> None:
+        super().__init__('localhost', 25, size=size)
+        self.behaviour = behaviour or (lambda _recipients: asyncio.sleep(0))
+        self.delivered: list[tuple[str, list[str], EmailMessage]] = []
+        self.attempts = 0
+        self.active = 0
+        self.max_active = 0
+        self.closed = False
+        self.__slots = asyncio.Semaphore(size)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        async with self.__slots:
+            yield FakeConnection(self)
+
+    async def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,192 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import NoReturn
+import fakeredis
+import pytest
+from aiosmtplib import SMTPRecipientsRefused, SMTPResponseException
+from src.infrastructure.logger import logger
+from src.infrastructure.mail.email_queue import EmailQueue
+from src.infrastructure.mail.email_service import EmailService
+from src.infrastructure.mail.memory_email_queue import MemoryEmailQueue
+from src.infrastructure.mail.redis_email_queue import RedisEmailQueue
+from tests.infrastructure.mail.fake_smtp_pool import FakeSMTPPool
+
+
+ServiceFactory = Callable[..., EmailService]
+
+
+async def eventually(condition: Callable[[], bool]) -> bool:
+    for _ in range(200):
+        if condition():
+            return True
+        await asyncio.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+async def service_factory() -> AsyncIterator[ServiceFactory]:
+    started: list[EmailService] = []
+
+    def create(pool: FakeSMTPPool, queue: EmailQueue | None = None, **kwargs: float) -> EmailService:
+        service = EmailService(
+            queue or MemoryEmailQueue(), pool, logger, sender='app@example.com', retry_delay=0.001, **kwargs,  # type: ignore[arg-type]
+        )
+        started.append(service)
+        return service
+
+    yield create
+    for service in started:
+        await service.stop()
+
+
+async def test_send_delivers_in_the_background(service_factory: ServiceFactory):
+    pool = FakeSMTPPool()
+    service = service_factory(pool)
+    await service.start()
+
+    await service.send('user@example.com', 'Welcome', 'Plain body', html='<p>HTML body</p>')
+
+    assert await eventually(lambda: service.sent == 1)
+    sender, recipients, message = pool.delivered[0]
+    assert (sender, recipients) == ('app@example.com', ['user@example.com'])
+    assert message['Subject'] == 'Welcome'
+    assert message['To'] == 'user@example.com'
+    assert message['Message-ID'].endswith('@example.com>')
+    assert message['Date'] is not None
+    assert [part.get_content_type() for part in message.iter_parts()] == ['text/plain', 'text/html']
+
+
+@pytest.mark.parametrize('subject', ['Hi\r\nBcc: victim@example.com', 'Hi\nX-Injected: 1', 'Hi\rthere'])
+async def test_header_injection_fails_in_the_caller(service_factory: ServiceFactory, subject: str):
+    queue = MemoryEmailQueue()
+    service = service_factory(FakeSMTPPool(), queue)
+
+    with pytest.raises(ValueError, match='linefeed or carriage return'):
+        await service.send('user@example.com', subject, 'body')
+    assert await queue.size() == 0
+
+
+async def test_unreadable_queue_entry_does_not_stop_the_dispatcher(service_factory: ServiceFactory):
+    pool = FakeSMTPPool()
+    queue = MemoryEmailQueue()
+    service = service_factory(pool, queue)
+    await queue.put(b'not json')
+    await queue.put(b'{"to": ["a@example.com"]}')
+    await service.send('user@example.com', 'After', 'body')
+    await service.start()
+
+    assert await eventually(lambda: service.sent == 1)
+    assert service.failed == 2
+
+    await service.send('user@example.com', 'Later', 'body')
+    assert await eventually(lambda: service.sent == 2)
+
+
+async def test_batch_is_sent_concurrently_up_to_the_pool_size(service_factory: ServiceFactory):
+    pool = FakeSMTPPool(size=4, behaviour=lambda _recipients: asyncio.sleep(0.02))
+    service = service_factory(pool, batch_size=50)
+    for i in range(20):
+        await service.send(f'user{i}@example.com', 'Batch', 'body')
+    await service.start()
+
+    assert await eventually(lambda: service.sent == 20)
+    assert pool.max_active == 4
+
+
+async def test_transient_errors_are_retried(service_factory: ServiceFactory):
+    failures = 2
+
+    async def flaky(_recipients: list[str]) -> None:
+        nonlocal failures
+        if failures:
+            failures -= 1
+            raise SMTPResponseException(451, 'Try again later')
+
+    pool = FakeSMTPPool(behaviour=flaky)
+    service = service_factory(pool)
+    await service.start()
+    await service.send('user@example.com', 'Retry', 'body')
+
+    assert await eventually(lambda: service.sent == 1)
+    assert (service.retried, service.failed, pool.attempts) == (2, 0, 3)
+
+
+async def test_transient_errors_give_up_after_the_last_retry(service_factory: ServiceFactory):
+    async def down(_recipients: list[str]) -> NoReturn:
+        message = 'Connection refused'
+        raise ConnectionRefusedError(message)
+
+    pool = FakeSMTPPool(behaviour=down)
+    service = service_factory(pool, retries=3)
+    await service.start()
+    await service.send('user@example.com', 'Down', 'body')
+
+    assert await eventually(lambda: service.failed == 1)
+    assert (pool.attempts, service.retried) == (3, 2)
+
+
+@pytest.mark.parametrize('error', [
+    SMTPResponseException(550, 'Mailbox unavailable'),
+    SMTPRecipientsRefused([]),
+])
+async def test_permanent_errors_are_not_retried(service_factory: ServiceFactory, error: Exception):
+    async def reject(_recipients: list[str]) -> NoReturn:
+        raise error
+
+    pool = FakeSMTPPool(behaviour=reject)
+    service = service_factory(pool)
+    await service.start()
+    await service.send('user@example.com', 'Rejected', 'body')
+
+    assert await eventually(lambda: service.failed == 1)
+    assert (pool.attempts, service.retried) == (1, 0)
+
+
+async def test_unavailable_queue_does_not_stop_the_dispatcher(service_factory: ServiceFactory):
+    class FlakyQueue(MemoryEmailQueue):
+        failures = 3
+
+        async def get_batch(self, size: int, wait: float) -> list[bytes]:
+            if self.failures:
+                self.failures -= 1
+                message = 'Connection reset by peer'
+                raise ConnectionResetError(message)
+            return await super().get_batch(size, wait)
+
+    service = service_factory(FakeSMTPPool(), FlakyQueue())
+    await service.send('user@example.com', 'Eventually', 'body')
+    await service.start()
+
+    assert await eventually(lambda: service.sent == 1)
+
+
+async def test_stop_drains_the_memory_queue():
+    pool = FakeSMTPPool(behaviour=lambda _recipients: asyncio.sleep(0.005))
+    service = EmailService(MemoryEmailQueue(), pool, logger, sender='app@example.com', batch_size=5)
+    await service.start()
+    for i in range(30):
+        await service.send(f'user{i}@example.com', 'Drain', 'body')
+
+    await service.stop()
+
+    assert service.sent == 30
+    assert pool.closed
+
+
+async def test_interrupted_batch_goes_back_to_a_persistent_queue():
+    release = asyncio.Event()
+    pool = FakeSMTPPool(size=2, behaviour=lambda _recipients: release.wait())
+    server = fakeredis.FakeServer()
+    queue = RedisEmailQueue(fakeredis.FakeAsyncRedis(server=server), key='test:email')
+    service = EmailService(queue, pool, logger, sender='app@example.com', batch_size=10, drain_timeout=0.05)
+    for i in range(15):
+        await service.send(f'user{i}@example.com', 'Persistent', 'body')
+    await service.start()
+    assert await eventually(lambda: pool.active == 2)
+
+    await service.stop()
+
+    remaining = RedisEmailQueue(fakeredis.FakeAsyncRedis(server=server), key='test:email')
+    assert service.sent == 0
+    assert await remaining.size() == 15
+    await remaining.close()
@@ -0,0 +1,84 @@
+import asyncio
+import socket
+from collections.abc import Iterator
+from email import message_from_bytes
+from typing import Any
+import pytest
+from aiosmtpd.controller import Controller
+from src.infrastructure.mail.smtp_pool import SMTPPool
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, list[str], bytes]] = []
+        self.sessions: set[Any] = set()
+
+    async def handle_DATA(self, _server: Any, session: Any, envelope: Any) -> str:
+        self.sessions.add(id(session))
+        self.messages.append((envelope.mail_from, envelope.rcpt_tos, envelope.content))
+        return '250 Message accepted for delivery'
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return int(probe.getsockname()[1])
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[tuple[Controller, RecordingHandler]]:
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname='127.0.0.1', port=free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+def message(number: int) -> str:
+    return f'From: app@example.com\r\nTo: user@example.com\r\nSubject: {number}\r\n\r\nbody\r\n'
+
+
+async def test_connections_are_reused(smtp_server: tuple[Controller, RecordingHandler]):
+    controller, handler = smtp_server
+    pool = SMTPPool(controller.hostname, controller.port, tls=False, size=2)
+
+    for number in range(5):
+        async with pool.acquire() as connection:
+            await connection.sendmail('app@example.com', ['user@example.com'], message(number))
+    await pool.close()
+
+    assert [message_from_bytes(content)['Subject'] for _, _, content in handler.messages] == ['0', '1', '2', '3', '4']
+    assert len(handler.sessions) == 1
+
+
+async def test_size_bounds_concurrent_connections(smtp_server: tuple[Controller, RecordingHandler]):
+    controller, handler = smtp_server
+    pool = SMTPPool(controller.hostname, controller.port, tls=False, size=2)
+
+    async def send(number: int) -> None:
+        async with pool.acquire() as connection:
+            await connection.sendmail('app@example.com', ['user@example.com'], message(number))
+
+    await asyncio.gather(*(send(number) for number in range(10)))
+    await pool.close()
+
+    assert len(handler.messages) == 10
+    assert len(handler.sessions) <= 2
+
+
+async def test_failed_connection_is_not_reused(smtp_server: tuple[Controller, RecordingHandler]):
+    controller, handler = smtp_server
+    pool = SMTPPool(controller.hostname, controller.port, tls=False, size=1)
+
+    async def fail_after_sending() -> None:
+        async with pool.acquire() as connection:
+            await connection.sendmail('app@example.com', ['user@example.com'], message(0))
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await fail_after_sending()
+    async with pool.acquire() as connection:
+        await connection.sendmail('app@example.com', ['user@example.com'], message(1))
+    await pool.close()
+
+    assert len(handler.sessions) == 2
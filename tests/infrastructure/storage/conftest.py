@@ -0,0 +1,13 @@
+from collections.abc import AsyncIterator, Iterable
+
+
+async def chunks_of(data: bytes, size: int = 1000) -> AsyncIterator[bytes]:
+    """The data as the request stream would deliver it"""
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+async def read_all(chunks: AsyncIterator[bytes] | Iterable[bytes]) -> bytes:
+    if isinstance(chunks, AsyncIterator):
+        return b''.join([chunk async for chunk in chunks])
+    return b''.join(chunks)
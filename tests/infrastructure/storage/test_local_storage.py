@@ -0,0 +1,74 @@
+import hashlib
+from pathlib import Path
+import pytest
+from src.application.domain.exceptions import PayloadTooLargeError, StoredFileNotFoundError
+from src.infrastructure.storage.local_storage import LocalStorage
+from tests.infrastructure.storage.conftest import chunks_of, read_all
+
+
+DATA = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalStorage:
+    return LocalStorage(tmp_path, chunk_size=4096)
+
+
+async def test_save_stat_read_delete(storage: LocalStorage):
+    stored = await storage.save('owner/file.bin', chunks_of(DATA), content_type='application/x-test')
+
+    assert (stored.key, stored.size, stored.content_type) == ('owner/file.bin', len(DATA), 'application/x-test')
+    assert stored.sha256 == hashlib.sha256(DATA).hexdigest()
+    assert (await storage.stat('owner/file.bin')).size == len(DATA)
+    assert await read_all(storage.read('owner/file.bin')) == DATA
+
+    await storage.delete('owner/file.bin')
+
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat('owner/file.bin')
+
+
+@pytest.mark.parametrize(('start', 'end'), [(0, 0), (10, 99), (5000, None), (10_000, 20_000), (0, None)])
+async def test_read_range(storage: LocalStorage, start: int, end: int | None):
+    await storage.save('file', chunks_of(DATA))
+
+    expected = DATA[start:] if end is None else DATA[start:end + 1]
+    assert await read_all(storage.read('file', start, end)) == expected
+
+
+async def test_too_large_upload_leaves_nothing(storage: LocalStorage, tmp_path: Path):
+    with pytest.raises(PayloadTooLargeError):
+        await storage.save('file', chunks_of(DATA), max_size=len(DATA) - 1)
+
+    assert [path for path in tmp_path.rglob('*') if path.is_file()] == []
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat('file')
+
+
+async def test_upload_of_exactly_max_size_is_accepted(storage: LocalStorage):
+    stored = await storage.save('file', chunks_of(DATA), max_size=len(DATA))
+
+    assert stored.size == len(DATA)
+
+
+@pytest.mark.parametrize('key', ['../outside', '/etc/passwd', 'a/../../b', ''])
+async def test_invalid_keys_never_touch_the_disk(storage: LocalStorage, tmp_path: Path, key: str):
+    (tmp_path.parent / 'outside').write_bytes(b'secret')
+
+    with pytest.raises(ValueError, match='Invalid storage key'):
+        await storage.save(key, chunks_of(b'x'))
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat(key)
+    await storage.delete(key)
+
+    assert storage.local_path(key) is None
+    assert (tmp_path.parent / 'outside').read_bytes() == b'secret'
+
+
+async def test_directory_is_not_a_file(storage: LocalStorage):
+    await storage.save('dir/file', chunks_of(b'x'))
+
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat('dir')
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat('dir/file/below')
@@ -0,0 +1,102 @@
+import hashlib
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+import boto3
+import pytest
+from moto import mock_aws
+from moto.s3 import models as s3_models
+from src.application.domain.exceptions import PayloadTooLargeError, StoredFileNotFoundError
+from src.infrastructure.logger import logger
+from src.infrastructure.storage.s3_storage import S3Storage
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+from tests.infrastructure.storage.conftest import chunks_of, read_all
+
+
+BUCKET = 'test-bucket'
+PART_SIZE = 1024
+DATA = bytes(range(256)) * 20
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[Any]:
+    monkeypatch.setattr(s3_models, 'S3_UPLOAD_PART_MIN_SIZE', PART_SIZE)
+    with mock_aws():
+        client = boto3.client('s3', region_name='us-east-1')
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+async def storage(client: Any) -> AsyncIterator[S3Storage]:
+    executor = BoundedExecutor(max_workers=4, queue_limit=32, thread_name_prefix='s3-test')
+    storage = S3Storage(client, BUCKET, executor, logger, part_size=PART_SIZE, max_concurrency=2, chunk_size=700)
+    yield storage
+    await storage.close()
+
+
+async def test_small_upload_is_a_single_put(storage: S3Storage, client: Any):
+    stored = await storage.save('owner/small.txt', chunks_of(b'hello'), content_type='text/plain')
+
+    head = client.head_object(Bucket=BUCKET, Key='owner/small.txt')
+    assert '-' not in head['ETag']
+    assert stored.sha256 == hashlib.sha256(b'hello').hexdigest()
+    assert (await storage.stat('owner/small.txt')).sha256 == stored.sha256
+    assert (await storage.stat('owner/small.txt')).content_type == 'text/plain'
+
+
+async def test_large_upload_is_multipart(storage: S3Storage, client: Any):
+    stored = await storage.save('owner/large.bin', chunks_of(DATA, 300))
+
+    head = client.head_object(Bucket=BUCKET, Key='owner/large.bin')
+    parts = -(-len(DATA) // PART_SIZE)
+    assert head['ETag'].strip('"').endswith(f'-{parts}')
+    assert stored.size == len(DATA)
+    assert stored.sha256 == hashlib.sha256(DATA).hexdigest()
+    assert await read_all(storage.read('owner/large.bin')) == DATA
+
+
+@pytest.mark.parametrize(('start', 'end'), [(0, 0), (100, 1999), (4000, None)])
+async def test_read_range(storage: S3Storage, start: int, end: int | None):
+    await storage.save('file', chunks_of(DATA))
+
+    expected = DATA[start:] if end is None else DATA[start:end + 1]
+    assert await read_all(storage.read('file', start, end)) == expected
+
+
+async def test_rejected_multipart_upload_is_aborted(storage: S3Storage, client: Any):
+    with pytest.raises(PayloadTooLargeError):
+        await storage.save('file', chunks_of(DATA, 300), max_size=3 * PART_SIZE)
+
+    assert client.list_multipart_uploads(Bucket=BUCKET).get('Uploads', []) == []
+    assert client.list_objects_v2(Bucket=BUCKET).get('KeyCount') == 0
+
+
+async def test_failed_part_aborts_the_upload(storage: S3Storage, client: Any, monkeypatch: pytest.MonkeyPatch):
+    upload_part = client.upload_part
+    calls = 0
+
+    def flaky_upload_part(**kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            message = 'Connection reset by peer'
+            raise ConnectionError(message)
+        return upload_part(**kwargs)
+
+    monkeypatch.setattr(client, 'upload_part', flaky_upload_part)
+
+    with pytest.raises(ConnectionError):
+        await storage.save('file', chunks_of(DATA, 300))
+
+    assert client.list_multipart_uploads(Bucket=BUCKET).get('Uploads', []) == []
+
+
+async def test_missing_and_invalid_keys(storage: S3Storage):
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat('missing')
+    with pytest.raises(StoredFileNotFoundError):
+        await read_all(storage.read('missing'))
+    with pytest.raises(StoredFileNotFoundError):
+        await storage.stat('../escape')
+    with pytest.raises(ValueError, match='Invalid storage key'):
+        await storage.save('../escape', chunks_of(b'x'))
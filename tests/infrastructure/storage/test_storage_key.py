@@ -0,0 +1,36 @@
+import pytest
+from src.infrastructure.storage.storage_key import valid_key
+
+
+@pytest.mark.parametrize('key', [
+    'file',
+    'file.txt',
+    'archive.tar.gz',
+    'a1b2/c3-d4_e5.json',
+    'owner/nested/dir/file',
+    'x' * 512,
+])
+def test_valid_keys(key: str):
+    assert valid_key(key)
+
+
+@pytest.mark.parametrize('key', [
+    '',
+    '.',
+    '..',
+    '../etc/passwd',
+    'a/../../b',
+    '/absolute',
+    'trailing/',
+    'double//slash',
+    '.hidden',
+    'name.',
+    'a/./b',
+    'back\\slash',
+    'space name',
+    'nul\x00',
+    'ünïcode',
+    'x' * 513,
+])
+def test_invalid_keys(key: str):
+    assert not valid_key(key)
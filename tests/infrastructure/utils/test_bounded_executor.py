@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+import threading
+from collections.abc import Iterator
+import bcrypt
+import pytest
+from src.application.domain.exceptions import ServiceUnavailableError
+from src.infrastructure.utils.bounded_executor import BoundedExecutor
+from src.infrastructure.utils.hash import HashService
+
+
+@pytest.fixture
+def executor() -> Iterator[BoundedExecutor]:
+    executor = BoundedExecutor(max_workers=2, queue_limit=2, thread_name_prefix='test')
+    yield executor
+    executor.shutdown()
+
+
+async def wait_until_idle(executor: BoundedExecutor) -> None:
+    for _ in range(200):
+        if executor.pending == 0:
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail(f'{executor.pending} slots were never freed')
+
+
+async def test_batches_that_do_not_fit_are_rejected_whole(executor: BoundedExecutor):
+    release = threading.Event()
+    running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ServiceUnavailableError, match='saturated'):
+        executor.submit_many(release.wait, [(), ()])
+    assert executor.pending == 3
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.pending == 0
+
+
+async def test_cancelled_call_keeps_its_slot_until_the_thread_finishes(executor: BoundedExecutor):
+    started, release = threading.Event(), threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait()
+
+    call = asyncio.ensure_future(executor.run(block))
+    await asyncio.to_thread(started.wait)
+    call.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await call
+    assert executor.pending == 1
+
+    release.set()
+    await wait_until_idle(executor)
+
+
+async def test_cancelled_batch_frees_every_slot(executor: BoundedExecutor):
+    hashed = bcrypt.hashpw(b'password', bcrypt.gensalt(4)).decode()
+    service = HashService(executor, rounds=4)
+
+    batch = asyncio.ensure_future(service.verify_many([(hashed, 'password')] * 4))
+    await asyncio.sleep(0)
+    batch.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await batch
+
+    await wait_until_idle(executor)
+    assert await service.verify_many([(hashed, 'password'), (hashed, 'wrong')]) == [True, False]
@@ -0,0 +1,132 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+import pytest
+from src.infrastructure.utils.hedged import Hedge, hedged
+
+
+def attempt_script(*steps: tuple[float, Any]) -> tuple[Callable[[], Awaitable[Any]], list[int], list[int]]:
+    """Callable whose n-th call sleeps and then returns or raises the n-th step"""
+    calls: list[int] = []
+    cancelled: list[int] = []
+
+    async def call() -> Any:
+        index = len(calls)
+        calls.append(index)
+        delay, outcome = steps[index]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return call, calls, cancelled
+
+
+async def test_fast_call_is_not_hedged():
+    hedge = Hedge(after_ms=50)
+    call, calls, _ = attempt_script((0, 'first'))
+
+    assert await hedge.call(call) == 'first'
+    assert calls == [0]
+    assert hedge.hedged == 0
+
+
+async def test_backup_wins_and_slow_attempt_is_cancelled():
+    hedge = Hedge(after_ms=10)
+    call, calls, cancelled = attempt_script((1, 'first'), (0, 'backup'))
+
+    assert await hedge.call(call) == 'backup'
+    await asyncio.sleep(0)
+    assert calls == [0, 1]
+    assert cancelled == [0]
+    assert (hedge.hedged, hedge.backup_wins) == (1, 1)
+
+
+async def test_first_attempt_still_wins_after_hedging():
+    hedge = Hedge(after_ms=10)
+    call, _, cancelled = attempt_script((0.03, 'first'), (1, 'backup'))
+
+    assert await hedge.call(call) == 'first'
+    await asyncio.sleep(0)
+    assert cancelled == [1]
+    assert (hedge.hedged, hedge.backup_wins) == (1, 0)
+
+
+async def test_backup_succeeds_when_first_attempt_fails():
+    hedge = Hedge(after_ms=10)
+    call, _, _ = attempt_script((0.02, ValueError('first')), (0.04, 'backup'))
+
+    assert await hedge.call(call) == 'backup'
+
+
+async def test_backup_succeeds_when_first_attempt_is_cancelled():
+    hedge = Hedge(after_ms=10)
+    call, _, _ = attempt_script((0.02, asyncio.CancelledError()), (0.04, 'backup'))
+
+    assert await hedge.call(call) == 'backup'
+
+
+async def test_error_of_first_attempt_when_all_fail():
+    hedge = Hedge(after_ms=10)
+    error = ValueError('first')
+    call, _, _ = attempt_script((0.02, error), (0.03, KeyError('backup')))
+
+    with pytest.raises(ValueError, match='first') as raised:
+        await hedge.call(call)
+    assert raised.value is error
+
+
+async def test_failure_of_a_cancelled_first_attempt_comes_from_the_backup():
+    hedge = Hedge(after_ms=10)
+    call, _, _ = attempt_script((0.02, asyncio.CancelledError()), (0.03, KeyError('backup')))
+
+    with pytest.raises(KeyError):
+        await hedge.call(call)
+
+
+async def test_cancelled_caller_cancels_every_attempt():
+    hedge = Hedge(after_ms=10)
+    call, calls, cancelled = attempt_script((1, 'first'), (1, 'backup'))
+
+    task = asyncio.create_task(hedge.call(call))
+    await asyncio.sleep(0.03)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    assert calls == [0, 1]
+    assert sorted(cancelled) == [0, 1]
+
+
+async def test_percentile_hedging_waits_for_samples():
+    hedge = Hedge(percentile=0.5, min_samples=20)
+    assert hedge.delay() is None
+
+    for _ in range(20):
+        hedge.latency.record(0.01)
+
+    delay = hedge.delay()
+    assert delay is not None
+    assert delay == pytest.approx(0.01, rel=0.5)
+
+
+async def test_concurrent_hedged_calls():
+    attempts: dict[int, int] = {}
+
+    @hedged(after_ms=20)
+    async def fetch(value: int) -> int:
+        attempts[value] = attempts.get(value, 0) + 1
+        # First attempts of even values are slow, so exactly those are hedged
+        await asyncio.sleep(1 if value % 2 == 0 and attempts[value] == 1 else 0)
+        return value
+
+    results = await asyncio.gather(*(fetch(i) for i in range(100)))
+
+    assert results == list(range(100))
+    assert fetch.hedge.hedged == fetch.hedge.backup_wins == 50  # type: ignore[attr-defined]
+    assert sum(attempts.values()) == 150
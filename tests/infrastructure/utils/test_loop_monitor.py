@@ -0,0 +1,45 @@
+import sys
+import time
+import pytest
+from src.infrastructure.logger import LogFormat, logger
+from src.infrastructure.logger.log_formatter import create_formatter
+from src.infrastructure.utils.loop_monitor import LoopMonitor
+from tests.memory_sink import MemorySink
+
+
+@pytest.fixture
+def sink(monkeypatch: pytest.MonkeyPatch) -> MemorySink:
+    sink = MemorySink()
+    monkeypatch.setattr(logger, 'sink', sink)
+    monkeypatch.setattr(logger, '_formatter', create_formatter(LogFormat.JSON))
+    return sink
+
+
+async def block_loop(monitor: LoopMonitor, seconds: float) -> None:
+    await monitor.start()
+    try:
+        time.sleep(seconds)  # noqa: ASYNC251 - blocking the loop is the point
+    finally:
+        await monitor.stop()
+
+
+async def test_blocked_loop_is_reported_once(sink: MemorySink):
+    monitor = LoopMonitor(logger, interval=0.01, slow_callback=0.05)
+    await block_loop(monitor, 0.3)
+
+    assert monitor.stalls == 1
+    [record] = sink.records
+    assert record['message'] == 'Event loop blocked'
+    assert record['blocked_ms'] > 50
+    assert 'block_loop' in record['stack']
+    assert 'field_trace_id' not in record
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='Task.get_context() is available from Python 3.12')
+async def test_report_carries_the_trace_id_of_the_blocking_task(sink: MemorySink):
+    monitor = LoopMonitor(logger, interval=0.01, slow_callback=0.05)
+    trace_id = logger.new_trace_id()
+    await block_loop(monitor, 0.3)
+
+    [record] = sink.records
+    assert record['trace_id'] == trace_id
@@ -0,0 +1,151 @@
+import asyncio
+import functools
+from typing import Any, NoReturn
+import pytest
+from src.infrastructure.utils.single_flight import SingleFlight, singleflight
+
+
+CALLERS = 200
+
+
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load() -> object:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return object()
+
+    waiters = [asyncio.create_task(flight.do('key', load)) for _ in range(CALLERS)]
+    await asyncio.sleep(0)
+    assert 'key' in flight
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.shared == CALLERS - 1
+    assert len(flight) == 0
+
+
+async def test_different_keys_run_separately():
+    flight = SingleFlight()
+
+    async def load(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    results = await asyncio.gather(*(flight.do(f'key:{i % 10}', functools.partial(load, i % 10)) for i in range(CALLERS)))
+
+    assert results == [i % 10 for i in range(CALLERS)]
+    assert flight.shared == CALLERS - 10
+
+
+async def test_key_is_released_after_the_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do('key', load) == 1
+    assert await flight.do('key', load) == 2
+    assert 'key' not in flight
+
+
+async def test_error_reaches_every_caller():
+    flight = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+    error = ValueError('broken')
+
+    async def load() -> NoReturn:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise error
+
+    waiters = [asyncio.create_task(flight.do('key', load)) for _ in range(CALLERS)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert calls == 1
+    assert all(result is error for result in results)
+    assert len(flight) == 0
+
+
+async def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> str:
+        await release.wait()
+        return 'value'
+
+    waiters = [asyncio.create_task(flight.do('key', load)) for _ in range(CALLERS)]
+    await asyncio.sleep(0)
+    for waiter in waiters[::2]:
+        waiter.cancel()
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results[::2])
+    assert results[1::2] == ['value'] * (CALLERS // 2)
+
+
+async def test_cancelled_call_cancels_every_caller():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def load() -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    waiters = [asyncio.create_task(flight.do('key', load)) for _ in range(CALLERS)]
+    await started.wait()
+    # The shared call is the only other task
+    shared = next(task for task in asyncio.all_tasks() if task not in waiters and task is not asyncio.current_task())
+    shared.cancel()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert len(flight) == 0
+
+
+async def test_decorator_coalesces_by_rendered_key():
+    calls: list[int] = []
+
+    @singleflight('user:{user_id}')
+    async def get_user(user_id: int, *, verbose: bool = False) -> dict[str, Any]:
+        calls.append(user_id)
+        await asyncio.sleep(0.01)
+        return {'id': user_id, 'verbose': verbose}
+
+    results = await asyncio.gather(*(get_user(i % 2) for i in range(CALLERS)))
+
+    assert sorted(calls) == [0, 1]
+    assert results[0] is results[2]
+    assert get_user.single_flight.shared == CALLERS - 2  # type: ignore[attr-defined]
+
+
+async def test_abandoned_error_is_not_reported(caplog):
+    flight = SingleFlight()
+
+    async def load() -> NoReturn:
+        await asyncio.sleep(0)
+        raise RuntimeError
+
+    waiter = asyncio.create_task(flight.do('key', load))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0.01)
+
+    assert 'exception was never retrieved' not in caplog.text
@@ -0,0 +1,16 @@
+import json
+from typing import Any
+from src.infrastructure.logger import LogLevel, LogSink
+
+
+class MemorySink(LogSink):
+    """Keeps every line written by a logger with the JSON format, decoded"""
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+
+    def write(self, line: str, level: LogLevel) -> None:  # noqa: ARG002
+        self.records.append(json.loads(line))
+
+    def flush(self) -> None:
+        pass
@@ -0,0 +1,58 @@
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.application.domain.exceptions import InvalidTokenError, ServiceUnavailableError, StoredFileNotFoundError
+from src.infrastructure.logger import logger
+from src.presentation.handlers import problem_handler
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+    problem_handler.install(app)
+
+    @app.get('/missing')
+    async def missing() -> None:
+        key = 'report.csv'
+        raise StoredFileNotFoundError(key)
+
+    @app.get('/busy')
+    async def busy() -> None:
+        message = 'Too busy'
+        raise ServiceUnavailableError(message, retry_after=2.5)
+
+    @app.get('/token')
+    async def token() -> None:
+        message = 'Token has "expired"'
+        raise InvalidTokenError(message)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_problem_details(client: AsyncClient):
+    logger.set_trace_id('trace-1')
+    response = await client.get('/missing')
+
+    assert response.status_code == 404
+    assert response.headers['content-type'] == 'application/problem+json'
+    assert int(response.headers['content-length']) == len(response.content)
+    assert response.json() == {
+        'type': 'about:blank',
+        'title': 'Not Found',
+        'status': 404,
+        'detail': "File 'report.csv' not found",
+        'trace_id': 'trace-1',
+    }
+
+
+async def test_registered_title_and_headers(client: AsyncClient):
+    busy = await client.get('/busy')
+    assert busy.status_code == 503
+    assert busy.json()['title'] == 'Service unavailable'
+    assert busy.headers['retry-after'] == '3'
+
+    token = await client.get('/token')
+    assert token.status_code == 401
+    assert token.headers['www-authenticate'] == 'Bearer error="invalid_token", error_description="Token has \\"expired\\""'
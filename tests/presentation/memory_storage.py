@@ -0,0 +1,45 @@
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path
+from src.application.contracts.i_storage import IStorage
+from src.application.domain.exceptions import StoredFileNotFoundError
+from src.application.domain.objects.stored_file import StoredFile
+from src.infrastructure.storage.size_limit import limit_size
+
+
+class MemoryStorage(IStorage):
+    """Storage stand-in without a local path, so responses stream from `read` like with S3"""
+
+    def __init__(self) -> None:
+        self.files: dict[str, tuple[bytes, str]] = {}
+
+    async def save(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        content_type: str = 'application/octet-stream',
+        max_size: int | None = None,
+    ) -> StoredFile:
+        data = b''.join([chunk async for chunk in limit_size(chunks, max_size)])
+        self.files[key] = (data, content_type)
+        return StoredFile(key, len(data), content_type, hashlib.sha256(data).hexdigest())
+
+    async def stat(self, key: str) -> StoredFile:
+        if key not in self.files:
+            raise StoredFileNotFoundError(key)
+        data, content_type = self.files[key]
+        return StoredFile(key, len(data), content_type, hashlib.sha256(data).hexdigest())
+
+    async def read(self, key: str, start: int = 0, end: int | None = None) -> AsyncIterator[bytes]:
+        data, _ = self.files[key]
+        yield data[start:None if end is None else end + 1]
+
+    async def delete(self, key: str) -> None:
+        self.files.pop(key, None)
+
+    def local_path(self, key: str) -> Path | None:  # noqa: ARG002
+        return None
+
+    async def close(self) -> None:
+        pass
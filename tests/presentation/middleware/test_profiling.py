@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.infrastructure.logger import logger
+from src.infrastructure.profiling import ProfileStore
+from src.presentation.middleware.profiling import ProfilingMiddleware
+from src.presentation.middleware.request_context import RequestContextMiddleware
+
+pytest.importorskip('pyinstrument')
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ProfileStore:
+    return ProfileStore(tmp_path)
+
+
+@pytest.fixture
+async def client(store: ProfileStore) -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+
+    @app.get('/items')
+    async def items() -> list[int]:
+        return []
+
+    app.add_middleware(ProfilingMiddleware, logger=logger, store=store, sample_rate=1.0)
+    app.add_middleware(RequestContextMiddleware, logger=logger)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_sampled_requests_are_saved_under_the_trace_id_and_a_random_suffix(
+    client: AsyncClient, store: ProfileStore
+):
+    first = (await client.get('/items', headers={'x-trace-id': 'trace-1'})).headers['x-profile-id']
+    second = (await client.get('/items', headers={'x-trace-id': 'trace-1'})).headers['x-profile-id']
+
+    assert first != second
+    assert first.startswith('trace-1-')
+    assert second.startswith('trace-1-')
+    assert {profile['name'] for profile in store.list()} == {first, second}
+
+
+async def test_a_trace_id_cannot_overwrite_an_existing_profile(client: AsyncClient, store: ProfileStore):
+    store.save('victim', '{}')
+
+    name = (await client.get('/items', headers={'x-trace-id': 'victim'})).headers['x-profile-id']
+
+    assert name != 'victim'
+    path = store.path('victim')
+    assert path is not None
+    assert path.read_text() == '{}'
+
+
+async def test_unusable_trace_ids_get_a_random_name(client: AsyncClient, store: ProfileStore):
+    name = (await client.get('/items', headers={'x-trace-id': 'a/../../b'})).headers['x-profile-id']
+
+    assert store.valid_name(name)
+    assert store.path(name) is not None
@@ -0,0 +1,76 @@
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.infrastructure import auth
+from src.infrastructure.logger import logger
+from src.infrastructure.rate_limit import MemoryRateLimitBackend
+from src.presentation.middleware.rate_limit import RateLimitMiddleware, auth_subject_key
+
+
+LIMIT = 2
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+
+    @app.get('/items')
+    async def items() -> list[int]:
+        return []
+
+    app.add_middleware(
+        RateLimitMiddleware, backend=MemoryRateLimitBackend(), limit=LIMIT, window=60, key_function=auth_subject_key
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def statuses(client: AsyncClient, authorization: bytes | None = None) -> list[int]:
+    headers = {b'authorization': authorization} if authorization is not None else {}
+    return [(await client.get('/items', headers=headers)).status_code for _ in range(LIMIT + 1)]
+
+
+async def test_requests_are_limited_per_token_subject(client: AsyncClient):
+    alice = f'Bearer {auth.token_service.issue("alice").access_token}'.encode()
+    bob = f'Bearer {auth.token_service.issue("bob").access_token}'.encode()
+
+    assert await statuses(client, alice) == [200, 200, 429]
+    assert await statuses(client, bob) == [200, 200, 429]
+
+
+@pytest.mark.parametrize(
+    'token',
+    [
+        pytest.param('not-a-token', id='garbage'),
+        pytest.param('{header_and_payload}.\xe9abc', id='non-ascii-signature'),
+        pytest.param('{header_and_payload}.', id='truncated'),
+    ],
+)
+async def test_malformed_tokens_fall_back_to_the_client_address(client: AsyncClient, token: str):
+    header_and_payload = auth.token_service.issue('alice').access_token.rpartition('.')[0]
+    authorization = f'Bearer {token.format(header_and_payload=header_and_payload)}'.encode('latin-1')
+
+    assert await statuses(client, authorization) == [200, 200, 429]
+    assert (await client.get('/items')).status_code == 429
+
+
+async def test_rejections_are_problem_details(client: AsyncClient):
+    logger.set_trace_id('trace-1')
+    for _ in range(LIMIT):
+        await client.get('/items')
+    response = await client.get('/items')
+
+    assert response.status_code == 429
+    assert response.headers['content-type'] == 'application/problem+json'
+    assert response.json() == {
+        'type': 'about:blank',
+        'title': 'Too Many Requests',
+        'status': 429,
+        'detail': f'Rate limit of {LIMIT} requests exceeded, retry later',
+        'trace_id': 'trace-1',
+    }
+    assert int(response.headers['retry-after']) > 0
+    assert response.headers['x-ratelimit-reset'] == response.headers['retry-after']
+    assert response.headers['x-ratelimit-limit'] == str(LIMIT)
+    assert response.headers['x-ratelimit-remaining'] == '0'
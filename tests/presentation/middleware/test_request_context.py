@@ -0,0 +1,53 @@
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.infrastructure.logger import LogFormat, logger
+from src.infrastructure.logger.log_formatter import create_formatter
+from src.presentation.middleware.request_context import RequestContextMiddleware
+from tests.memory_sink import MemorySink
+
+
+@pytest.fixture
+def sink(monkeypatch: pytest.MonkeyPatch) -> MemorySink:
+    sink = MemorySink()
+    monkeypatch.setattr(logger, 'sink', sink)
+    monkeypatch.setattr(logger, '_formatter', create_formatter(LogFormat.JSON))
+    return sink
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+
+    @app.get('/items')
+    async def items() -> list[int]:
+        return []
+
+    @app.get('/ping')
+    async def ping() -> str:
+        return 'pong'
+
+    app.add_middleware(RequestContextMiddleware, logger=logger)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_requests_are_logged_with_the_message_and_structured_fields(client: AsyncClient, sink: MemorySink):
+    response = await client.get('/items?page=2', headers={'x-trace-id': 'trace-1'})
+
+    assert response.headers['x-trace-id'] == 'trace-1'
+    started, finished = (record for record in sink.records if record['message'].startswith('Request '))
+    assert started['message'] == 'Request started: GET http://test/items?page=2 - TraceID: trace-1'
+    assert finished['message'] == 'Request finished: GET http://test/items?page=2 - TraceID: trace-1 - Status: 200'
+    assert started['trace_id'] == finished['trace_id'] == 'trace-1'
+    assert (started['method'], started['url']) == ('GET', 'http://test/items?page=2')
+    assert (finished['method'], finished['url'], finished['status']) == ('GET', 'http://test/items?page=2', 200)
+
+
+async def test_trace_id_is_generated_and_excluded_paths_are_not_logged(client: AsyncClient, sink: MemorySink):
+    response = await client.get('/items')
+    assert len(response.headers['x-trace-id']) == 36
+
+    assert 'x-trace-id' not in (await client.get('/ping')).headers
+    assert all(record['url'] == 'http://test/items' for record in sink.records if record['message'].startswith('Request '))
@@ -0,0 +1,114 @@
+import gzip
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI, Request, Response
+from httpx import ASGITransport, AsyncClient
+from src.presentation.responses import StaticContent
+
+
+brotli = pytest.importorskip('brotli', reason='the br variants need the speedups extra')
+BODY = b'function swagger() { return "docs"; }\n' * 100
+content = StaticContent(BODY, 'text/javascript; charset=utf-8', 'public, max-age=60')
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+
+    @app.get('/asset')
+    async def asset(request: Request) -> Response:
+        return content.respond(request)
+
+    @app.get('/small')
+    async def small(request: Request) -> Response:
+        return StaticContent(b'tiny', 'text/plain').respond(request)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def fetch(client: AsyncClient, accept_encoding: str) -> tuple[str | None, str]:
+    response = await client.get('/asset', headers={'accept-encoding': accept_encoding})
+    assert response.content == BODY  # httpx decodes whatever was sent
+    return response.headers.get('content-encoding'), response.headers['etag']
+
+
+@pytest.mark.parametrize(
+    ('accept_encoding', 'expected'),
+    [
+        ('identity', None),
+        ('gzip', 'gzip'),
+        ('gzip, deflate, br', 'br'),
+        ('br;q=0.5, gzip;q=1.0', 'br'),
+        ('*', 'br'),
+        ('br;q=0, gzip', 'gzip'),
+        ('br;q=0.0, gzip;q=0.000', None),
+        ('br;q=0, *', 'gzip'),
+        ('*;q=0', None),
+        ('GZIP ; Q=0.8', 'gzip'),
+        ('gzip;q=invalid', None),
+    ],
+)
+async def test_encoding_negotiation(client: AsyncClient, accept_encoding: str, expected: str | None):
+    coding, _ = await fetch(client, accept_encoding)
+    assert coding == expected
+
+
+async def test_every_variant_has_its_own_etag_and_varies_on_accept_encoding(client: AsyncClient):
+    variants = {accept_encoding: await fetch(client, accept_encoding) for accept_encoding in ('identity', 'gzip', 'br')}
+    etags = [etag for _, etag in variants.values()]
+
+    assert etags[0] == f'"{content.digest}"'
+    assert etags[1:] == [f'"{content.digest}-gzip"', f'"{content.digest}-br"']
+    for accept_encoding in variants:
+        response = await client.get('/asset', headers={'accept-encoding': accept_encoding})
+        assert response.headers['vary'] == 'Accept-Encoding'
+        assert response.headers['cache-control'] == 'public, max-age=60'
+        assert response.headers['content-type'] == 'text/javascript; charset=utf-8'
+
+
+async def raw_body(client: AsyncClient, accept_encoding: str) -> bytes:
+    async with client.stream('GET', '/asset', headers={'accept-encoding': accept_encoding}) as response:
+        return b''.join([chunk async for chunk in response.aiter_raw()])
+
+
+async def test_compressed_bodies_are_smaller_and_decode_to_the_body(client: AsyncClient):
+    gzipped, brotlied = await raw_body(client, 'gzip'), await raw_body(client, 'br')
+
+    assert len(brotlied) < len(gzipped) < len(BODY)
+    assert gzip.decompress(gzipped) == BODY
+    assert brotli.decompress(brotlied) == BODY
+
+
+async def test_small_bodies_are_not_compressed(client: AsyncClient):
+    response = await client.get('/small', headers={'accept-encoding': 'gzip, br'})
+    assert 'content-encoding' not in response.headers
+    assert response.content == b'tiny'
+
+
+@pytest.mark.parametrize(
+    'if_none_match',
+    [
+        f'"{content.digest}"',
+        f'W/"{content.digest}"',
+        f'"other", "{content.digest}-gzip"',
+        f'"other",W/"{content.digest}-br"',
+        '*',
+        ' * ',
+    ],
+)
+async def test_matching_if_none_match_gets_304_without_a_body(client: AsyncClient, if_none_match: str):
+    response = await client.get('/asset', headers={'accept-encoding': 'gzip', 'if-none-match': if_none_match})
+
+    assert response.status_code == 304
+    assert response.content == b''
+    assert 'content-encoding' not in response.headers
+    assert response.headers['etag'] == f'"{content.digest}-gzip"'
+    assert response.headers['vary'] == 'Accept-Encoding'
+
+
+@pytest.mark.parametrize('if_none_match', ['"other"', '', f'"{content.digest}x"', f'{content.digest}'])
+async def test_other_if_none_match_gets_the_body(client: AsyncClient, if_none_match: str):
+    response = await client.get('/asset', headers={'accept-encoding': 'identity', 'if-none-match': if_none_match})
+    assert response.status_code == 200
+    assert response.content == BODY
@@ -0,0 +1,86 @@
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
+from httpx import ASGITransport, AsyncClient
+from src.presentation.responses.stored_file_response import _requested_range, stored_file_response
+from tests.infrastructure.storage.conftest import chunks_of
+from tests.presentation.memory_storage import MemoryStorage
+
+
+DATA = bytes(range(100))
+
+
+@pytest.mark.parametrize(('header', 'expected'), [
+    (None, None),
+    ('', None),
+    ('bytes=0-9', (0, 9)),
+    ('bytes=90-', (90, 99)),
+    ('bytes=90-500', (90, 99)),
+    ('bytes=-10', (90, 99)),
+    ('bytes=-500', (0, 99)),
+    ('bytes=-0', (100, -1)),
+    ('bytes=100-', (100, 99)),
+    ('bytes=150-200', (150, 99)),
+    ('  bytes=5-5  ', (5, 5)),
+    ('bytes=9-0', None),
+    ('bytes=-', None),
+    ('bytes=0-1,5-6', None),
+    ('items=0-9', None),
+    ('bytes=a-b', None),
+])
+def test_requested_range(header: str | None, expected: tuple[int, int] | None):
+    assert _requested_range(header, len(DATA)) == expected
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    storage = MemoryStorage()
+    await storage.save('file.bin', chunks_of(DATA, 30))
+    app = FastAPI()
+
+    @app.get('/file')
+    async def download(request: Request) -> Response:
+        return stored_file_response(storage, await storage.stat('file.bin'), request.headers.get('range'))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_whole_file(client: AsyncClient):
+    response = await client.get('/file')
+
+    assert response.status_code == 200
+    assert response.content == DATA
+    assert response.headers['accept-ranges'] == 'bytes'
+    assert response.headers['etag'].startswith('"')
+
+
+async def test_partial_content(client: AsyncClient):
+    response = await client.get('/file', headers={'range': 'bytes=10-19'})
+
+    assert response.status_code == 206
+    assert response.content == DATA[10:20]
+    assert response.headers['content-range'] == 'bytes 10-19/100'
+    assert response.headers['content-length'] == '10'
+
+
+async def test_suffix_range(client: AsyncClient):
+    response = await client.get('/file', headers={'range': 'bytes=-5'})
+
+    assert response.status_code == 206
+    assert response.content == DATA[-5:]
+
+
+async def test_unsatisfiable_range(client: AsyncClient):
+    response = await client.get('/file', headers={'range': 'bytes=100-'})
+
+    assert response.status_code == 416
+    assert response.headers['content-range'] == 'bytes */100'
+
+
+async def test_multiple_ranges_get_the_whole_file(client: AsyncClient):
+    response = await client.get('/file', headers={'range': 'bytes=0-1,5-6'})
+
+    assert response.status_code == 200
+    assert response.content == DATA
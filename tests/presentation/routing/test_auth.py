@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+import bcrypt
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.presentation.handlers import problem_handler
+from src.presentation.routing.auth import auth_router
+from src.settings import settings
+
+
+PASSWORD = 'correct horse battery staple'  # noqa: S105 - test credentials
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+    app.include_router(auth_router)
+    problem_handler.install(app)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+@pytest.fixture
+def account(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'AUTH_USERNAME', 'admin')
+    monkeypatch.setattr(settings, 'AUTH_PASSWORD_HASH', bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(4)).decode())
+
+
+@pytest.mark.usefixtures('account')
+async def test_login_issues_a_working_token_pair(client: AsyncClient):
+    response = await client.post('/auth/login', json={'username': 'admin', 'password': PASSWORD})
+    assert response.status_code == 200
+    pair = response.json()
+    assert pair['token_type'] == 'bearer'  # noqa: S105 - OAuth2 token type, not a secret
+
+    refreshed = await client.post('/auth/refresh', json={'refresh_token': pair['refresh_token']})
+    assert refreshed.status_code == 200
+    access_token = refreshed.json()['access_token']
+
+    logout = await client.post('/auth/logout', headers={'authorization': f'Bearer {access_token}'})
+    assert logout.status_code == 204
+    again = await client.post('/auth/logout', headers={'authorization': f'Bearer {access_token}'})
+    assert again.status_code == 401
+
+
+@pytest.mark.usefixtures('account')
+@pytest.mark.parametrize(
+    ('username', 'password'),
+    [('admin', 'wrong password'), ('someone', PASSWORD), ('', '')],
+)
+async def test_login_rejects_wrong_credentials(client: AsyncClient, username: str, password: str):
+    response = await client.post('/auth/login', json={'username': username, 'password': password})
+    assert response.status_code == 401
+    assert response.headers['content-type'] == 'application/problem+json'
+    assert response.json()['detail'] == 'Incorrect username or password'
+
+
+async def test_login_is_disabled_without_an_account(client: AsyncClient):
+    response = await client.post('/auth/login', json={'username': 'admin', 'password': PASSWORD})
+    assert response.status_code == 401
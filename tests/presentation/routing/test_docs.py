@@ -0,0 +1,87 @@
+import asyncio
+import base64
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.presentation.docs import api_docs
+from src.presentation.routing.docs import docs_router
+from src.settings import settings
+
+
+@pytest.fixture(scope='module')
+def app() -> FastAPI:
+    app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None, title='Test API')
+    app.include_router(docs_router)
+
+    @app.get('/items')
+    async def items() -> list[int]:
+        return []
+
+    # Compressing the bundles takes a while, they are built once for the module
+    asyncio.run(api_docs.build(app))
+    return app
+
+
+@pytest.fixture
+async def client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+def credentials(username: str = settings.DOCS_USERNAME, password: str = settings.DOCS_PASSWORD) -> dict[str, str]:
+    token = base64.b64encode(f'{username}:{password}'.encode()).decode()
+    return {'authorization': f'Basic {token}', 'accept-encoding': 'identity'}
+
+
+PATHS = ['/docs', '/redoc', '/openapi.json', '/docs/static/swagger-ui-bundle.js', '/docs/static/unknown.js']
+
+
+@pytest.mark.parametrize('path', PATHS)
+async def test_docs_require_credentials(client: AsyncClient, path: str):
+    assert (await client.get(path)).status_code == 401
+    wrong = credentials(password='wrong')  # noqa: S106 - test credentials
+    assert (await client.get(path, headers=wrong)).status_code == 401
+
+
+async def test_pages_link_the_bundled_assets_by_digest(client: AsyncClient):
+    swagger = await client.get('/docs', headers=credentials())
+    assert swagger.status_code == 200
+    assert swagger.headers['content-type'] == 'text/html; charset=utf-8'
+    assert swagger.headers['cache-control'] == 'private, no-cache'
+    asset = api_docs.asset('swagger-ui-bundle.js')
+    assert asset is not None
+    assert f'/docs/static/swagger-ui-bundle.js?v={asset.digest[:12]}' in swagger.text
+    assert 'cdn.jsdelivr.net' not in swagger.text
+
+    redoc = await client.get('/redoc', headers=credentials())
+    assert redoc.status_code == 200
+    assert '/docs/static/redoc.standalone.js?v=' in redoc.text
+
+
+async def test_openapi_schema(client: AsyncClient):
+    response = await client.get('/openapi.json', headers=credentials())
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    schema = response.json()
+    assert schema['info']['title'] == 'Test API'
+    assert '/items' in schema['paths']
+    assert '/docs' not in schema['paths']
+
+
+async def test_assets_are_cached_and_revalidated(client: AsyncClient):
+    response = await client.get('/docs/static/swagger-ui.css', headers=credentials())
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'text/css; charset=utf-8'
+    assert response.headers['cache-control'] == 'private, max-age=31536000, immutable'
+
+    again = await client.get(
+        '/docs/static/swagger-ui.css', headers={**credentials(), 'if-none-match': response.headers['etag']}
+    )
+    assert again.status_code == 304
+    assert again.content == b''
+
+
+async def test_unknown_asset_is_not_found(client: AsyncClient):
+    for name in ('unknown.js', 'redoc.LICENSE', '..%2Fapi_docs.py'):
+        assert (await client.get(f'/docs/static/{name}', headers=credentials())).status_code == 404
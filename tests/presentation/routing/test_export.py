@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import Column, Integer, MetaData, String, Table, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from src.presentation.routing.export import ExportResponse, stream_rows
+from src.presentation.schemas.export_format import ExportFormat
+
+CHUNK_SIZE = 2
+
+metadata = MetaData()
+people = Table(
+    'people',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('name', String),
+    Column('note', String),
+)
+
+PEOPLE = [
+    {'id': 1, 'name': 'Alice', 'note': 'plain'},
+    {'id': 2, 'name': 'Smith, Bob', 'note': 'comma'},
+    {'id': 3, 'name': 'Carol', 'note': 'two\nlines'},
+    {'id': 4, 'name': 'Dan "the man"', 'note': 'quotes'},
+    {'id': 5, 'name': 'Émile', 'note': 'unicode'},
+]
+
+
+@pytest.fixture
+async def session_maker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "test.db"}')
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+        await connection.execute(insert(people), PEOPLE)
+    yield async_sessionmaker(engine)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(session_maker: async_sessionmaker[AsyncSession]) -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+
+    @app.get('/people')
+    async def export_people(export_format: ExportFormat = ExportFormat.NDJSON) -> ExportResponse:
+        return ExportResponse(
+            select(*people.columns).order_by(people.c.id),
+            export_format,
+            filename=f'people.{export_format.value}',
+            session_maker=session_maker,
+            chunk_size=CHUNK_SIZE,
+        )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def chunks(session_maker: async_sessionmaker[AsyncSession], export_format: ExportFormat) -> list[bytes]:
+    statement = select(*people.columns).order_by(people.c.id)
+    return [chunk async for chunk in stream_rows(statement, export_format, session_maker=session_maker, chunk_size=CHUNK_SIZE)]
+
+
+async def test_ndjson_chunks_hold_whole_lines(session_maker: async_sessionmaker[AsyncSession]):
+    body = await chunks(session_maker, ExportFormat.NDJSON)
+
+    # One chunk per partition of the cursor, each made of newline-terminated lines
+    assert [chunk.count(b'\n') for chunk in body] == [2, 2, 1]
+    assert all(chunk.endswith(b'\n') for chunk in body)
+    assert [json.loads(line) for line in b''.join(body).splitlines()] == PEOPLE
+
+
+async def test_csv_chunks_hold_whole_records(session_maker: async_sessionmaker[AsyncSession]):
+    header, *body = await chunks(session_maker, ExportFormat.CSV)
+
+    assert header == b'id,name,note\r\n'
+    assert len(body) == 3
+    assert all(chunk.endswith(b'\r\n') for chunk in body)
+    # Every chunk parses on its own: no quoted field is split across chunks
+    assert [row for chunk in body for row in csv.reader(io.StringIO(chunk.decode(), newline=''))] == [
+        [str(person['id']), person['name'], person['note']] for person in PEOPLE
+    ]
+
+
+async def test_ndjson_export(client: AsyncClient):
+    response = await client.get('/people')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert response.headers['content-disposition'] == 'attachment; filename="people.ndjson"'
+    assert response.content.endswith(b'\n')
+    assert [json.loads(line) for line in response.content.splitlines()] == PEOPLE
+
+
+async def test_csv_export(client: AsyncClient):
+    response = await client.get('/people', params={'export_format': 'csv'})
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'text/csv; charset=utf-8'
+    assert response.headers['content-disposition'] == 'attachment; filename="people.csv"'
+    text = response.content.decode()
+    assert text.count('id,name,note') == 1
+    assert '"Smith, Bob"' in text
+    assert '"two\nlines"' in text
+    assert '"Dan ""the man"""' in text
+    assert list(csv.DictReader(io.StringIO(text, newline=''))) == [
+        {key: str(value) for key, value in person.items()} for person in PEOPLE
+    ]
+
+
+async def test_empty_exports(client: AsyncClient, session_maker: async_sessionmaker[AsyncSession]):
+    async with session_maker.begin() as session:
+        await session.execute(people.delete())
+
+    assert (await client.get('/people')).content == b''
+    assert (await client.get('/people', params={'export_format': 'csv'})).content == b'id,name,note\r\n'
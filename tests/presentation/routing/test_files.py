@@ -0,0 +1,94 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.infrastructure import auth
+from src.infrastructure.storage import get_storage
+from src.infrastructure.storage.local_storage import LocalStorage
+from src.presentation.handlers import problem_handler
+from src.presentation.routing.files import files_router
+from src.settings import settings
+
+
+def bearer(subject: str) -> dict[str, str]:
+    return {'authorization': f'Bearer {auth.token_service.issue(subject).access_token}'}
+
+
+@pytest.fixture
+async def client(tmp_path: Path) -> AsyncIterator[AsyncClient]:
+    storage = LocalStorage(tmp_path)
+    app = FastAPI()
+    app.include_router(files_router)
+    problem_handler.install(app)
+
+    async def get_test_storage() -> LocalStorage:
+        return storage
+
+    app.dependency_overrides[get_storage] = get_test_storage
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def upload(client: AsyncClient, subject: str, data: bytes) -> str:
+    response = await client.post('/files', content=data, headers={**bearer(subject), 'content-type': 'text/plain'})
+    assert response.status_code == 201
+    return str(response.json()['key'])
+
+
+async def test_requests_without_a_valid_token_are_rejected(client: AsyncClient):
+    header_and_payload = auth.token_service.issue('alice').access_token.rpartition('.')[0]
+    non_ascii_signature = f'Bearer {header_and_payload}.\xe9abc'
+    for response in (
+        await client.post('/files', content=b'data'),
+        await client.get('/files/key'),
+        await client.delete('/files/key'),
+        await client.get('/files/key', headers={'authorization': 'Bearer not-a-token'}),
+        await client.get('/files/key', headers={b'authorization': non_ascii_signature.encode('latin-1')}),
+    ):
+        assert response.status_code == 401
+        assert response.headers['content-type'] == 'application/problem+json'
+
+
+async def test_upload_and_download(client: AsyncClient):
+    key = await upload(client, 'alice', b'hello world')
+
+    assert key.endswith('.txt')
+    response = await client.get(f'/files/{key}', headers={**bearer('alice'), 'range': 'bytes=6-'})
+    assert response.status_code == 206
+    assert response.content == b'world'
+
+
+async def test_files_are_scoped_to_their_owner(client: AsyncClient):
+    key = await upload(client, 'alice', b'private')
+
+    assert (await client.get(f'/files/{key}', headers=bearer('mallory'))).status_code == 404
+    assert (await client.delete(f'/files/{key}', headers=bearer('mallory'))).status_code == 204
+    assert (await client.get(f'/files/{key}', headers=bearer('alice'))).content == b'private'
+
+
+async def test_delete(client: AsyncClient):
+    key = await upload(client, 'alice', b'data')
+
+    assert (await client.delete(f'/files/{key}', headers=bearer('alice'))).status_code == 204
+    assert (await client.get(f'/files/{key}', headers=bearer('alice'))).status_code == 404
+
+
+async def test_keys_cannot_escape_the_owner_prefix(client: AsyncClient):
+    await upload(client, 'alice', b'data')
+
+    response = await client.get('/files/..%2F..%2Fetc%2Fpasswd', headers=bearer('alice'))
+    assert response.status_code == 404
+
+
+async def test_too_large_upload(client: AsyncClient, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, 'MAX_FILE_SIZE', 10)
+
+    declared = await client.post('/files', content=b'x' * 11, headers=bearer('alice'))
+
+    async def body() -> AsyncIterator[bytes]:
+        for _ in range(5):
+            yield b'xxxx'
+
+    streamed = await client.post('/files', content=body(), headers=bearer('alice'))
+    assert declared.status_code == streamed.status_code == 413
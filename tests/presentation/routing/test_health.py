@@ -0,0 +1,29 @@
+from collections.abc import AsyncIterator
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.infrastructure.health import health_monitor
+from src.presentation.routing.health import health_router
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[AsyncClient]:
+    app = FastAPI()
+    app.include_router(health_router)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_readiness_is_served_at_ready_and_its_alias(client: AsyncClient):
+    await health_monitor.check()
+    ready, alias = await client.get('/health/ready'), await client.get('/health')
+
+    assert ready.status_code == alias.status_code
+    assert ready.headers['content-type'] == 'application/json'
+    assert ready.json().keys() == alias.json().keys() == {'checks', 'status', 'age'}
+
+
+async def test_liveness(client: AsyncClient):
+    await health_monitor.check()
+    response = await client.get('/health/live')
+    assert response.status_code == 200